@@ -10,18 +10,38 @@ Author: TSM Web Crawler Project
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import logging
+import random
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urlparse
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from flask import Flask, Response, jsonify, render_template_string, request, send_file
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    stream_template,
+    stream_with_context,
+)
+from jinja2 import DictLoader, FileSystemBytecodeCache
+from markupsafe import Markup
 
 # Import audit report generator
 from src.audit_report import AuditReportGenerator
@@ -80,6 +100,138 @@ try:
 except ImportError:
     logger.warning("flask-cors not installed. CORS not enabled.")
 
+# Enable response compression (the dashboard HTML is large and repetitive)
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+# Streamed responses (the dashboard page) have their own list, which leaves
+# out gzip by default
+app.config["COMPRESS_ALGORITHM_STREAMING"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+app.config["COMPRESS_MIMETYPES"] = [
+    "text/html",
+    "text/css",
+    "text/csv",
+    "text/plain",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "application/x-ndjson",
+]
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    logger.warning("flask-compress not installed. Falling back to built-in gzip.")
+
+    @app.after_request
+    def gzip_response(response: Response) -> Response:
+        """Gzip-compress text responses when the client accepts it."""
+        if (
+            response.direct_passthrough
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+            or response.mimetype not in app.config["COMPRESS_MIMETYPES"]
+        ):
+            return response
+
+        if response.is_streamed:
+            # Compress chunk by chunk so streamed pages still flush early.
+            response.response = gzip_stream(response.response)
+            response.headers.pop("Content-Length", None)
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+            return response
+
+        data = response.get_data()
+        if len(data) < app.config["COMPRESS_MIN_SIZE"]:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Content-Length"] = str(len(response.get_data()))
+        response.vary.add("Accept-Encoding")
+        return response
+
+    def gzip_stream(chunks):
+        """Gzip an iterable of response chunks, flushing after each one."""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+# Templates are inline strings, so they never change while the process runs:
+# skip the per-render freshness check and persist compiled bytecode across
+# restarts (the cache is keyed by a source checksum, so edits still apply).
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+# Shared Tailwind class strings, exposed to templates as globals so each
+# repeated literal is stored once instead of per occurrence.
+PILL_BASE = "inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium"
+TEMPLATE_CLASSES = {
+    "PILL_GOOD": f"{PILL_BASE} bg-green-500/10 text-green-400",
+    "PILL_WARN": f"{PILL_BASE} bg-amber-500/10 text-amber-400",
+    "PILL_BAD": f"{PILL_BASE} bg-red-500/10 text-red-400",
+    "CARD": "rounded-xl border border-slate-700 bg-slate-800",
+}
+app.jinja_env.globals.update(TEMPLATE_CLASSES)
+
+# ---------------------------------------------------------------------------
+# SVG Icon Sprite
+# ---------------------------------------------------------------------------
+
+# Font Awesome Free 6 solid glyphs (CC BY 4.0 - https://fontawesome.com/license/free),
+# inlined once per page as <symbol> elements and referenced with <use>.
+ICON_PATHS: Dict[str, tuple] = {
+    "chart-bar": ("0 0 512 512", "M32 32c17.7 0 32 14.3 32 32l0 336c0 8.8 7.2 16 16 16l400 0c17.7 0 32 14.3 32 32s-14.3 32-32 32L80 480c-44.2 0-80-35.8-80-80L0 64C0 46.3 14.3 32 32 32zm96 96c0-17.7 14.3-32 32-32l192 0c17.7 0 32 14.3 32 32s-14.3 32-32 32l-192 0c-17.7 0-32-14.3-32-32zm32 64l128 0c17.7 0 32 14.3 32 32s-14.3 32-32 32l-128 0c-17.7 0-32-14.3-32-32s14.3-32 32-32zm0 96l256 0c17.7 0 32 14.3 32 32s-14.3 32-32 32l-256 0c-17.7 0-32-14.3-32-32s14.3-32 32-32z"),
+    "chart-line": ("0 0 512 512", "M64 64c0-17.7-14.3-32-32-32S0 46.3 0 64L0 400c0 44.2 35.8 80 80 80l400 0c17.7 0 32-14.3 32-32s-14.3-32-32-32L80 416c-8.8 0-16-7.2-16-16L64 64zm406.6 86.6c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0L320 210.7l-57.4-57.4c-12.5-12.5-32.8-12.5-45.3 0l-112 112c-12.5 12.5-12.5 32.8 0 45.3s32.8 12.5 45.3 0L240 221.3l57.4 57.4c12.5 12.5 32.8 12.5 45.3 0l128-128z"),
+    "chart-pie": ("0 0 576 512", "M304 240l0-223.4c0-9 7-16.6 16-16.6C443.7 0 544 100.3 544 224c0 9-7.6 16-16.6 16L304 240zM32 272C32 150.7 122.1 50.3 239 34.3c9.2-1.3 17 6.1 17 15.4L256 288 412.5 444.5c6.7 6.7 6.2 17.7-1.5 23.1C371.8 495.6 323.8 512 272 512C139.5 512 32 404.6 32 272zm526.4 16c9.3 0 16.6 7.8 15.4 17c-7.7 55.9-34.6 105.6-73.9 142.3c-6 5.6-15.4 5.2-21.2-.7L320 288l238.4 0z"),
+    "check": ("0 0 448 512", "M438.6 105.4c12.5 12.5 12.5 32.8 0 45.3l-256 256c-12.5 12.5-32.8 12.5-45.3 0l-128-128c-12.5-12.5-12.5-32.8 0-45.3s32.8-12.5 45.3 0L160 338.7 393.4 105.4c12.5-12.5 32.8-12.5 45.3 0z"),
+    "check-circle": ("0 0 512 512", "M256 512A256 256 0 1 0 256 0a256 256 0 1 0 0 512zM369 209L241 337c-9.4 9.4-24.6 9.4-33.9 0l-64-64c-9.4-9.4-9.4-24.6 0-33.9s24.6-9.4 33.9 0l47 47L335 175c9.4-9.4 24.6-9.4 33.9 0s9.4 24.6 0 33.9z"),
+    "chevron-down": ("0 0 512 512", "M233.4 406.6c12.5 12.5 32.8 12.5 45.3 0l192-192c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0L256 338.7 86.6 169.4c-12.5-12.5-32.8-12.5-45.3 0s-12.5 32.8 0 45.3l192 192z"),
+    "clipboard-list": ("0 0 384 512", "M192 0c-41.8 0-77.4 26.7-90.5 64L64 64C28.7 64 0 92.7 0 128L0 448c0 35.3 28.7 64 64 64l256 0c35.3 0 64-28.7 64-64l0-320c0-35.3-28.7-64-64-64l-37.5 0C269.4 26.7 233.8 0 192 0zm0 64a32 32 0 1 1 0 64 32 32 0 1 1 0-64zM72 272a24 24 0 1 1 48 0 24 24 0 1 1 -48 0zm104-16l128 0c8.8 0 16 7.2 16 16s-7.2 16-16 16l-128 0c-8.8 0-16-7.2-16-16s7.2-16 16-16zM72 368a24 24 0 1 1 48 0 24 24 0 1 1 -48 0zm88 0c0-8.8 7.2-16 16-16l128 0c8.8 0 16 7.2 16 16s-7.2 16-16 16l-128 0c-8.8 0-16-7.2-16-16z"),
+    "download": ("0 0 512 512", "M288 32c0-17.7-14.3-32-32-32s-32 14.3-32 32l0 242.7-73.4-73.4c-12.5-12.5-32.8-12.5-45.3 0s-12.5 32.8 0 45.3l128 128c12.5 12.5 32.8 12.5 45.3 0l128-128c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0L288 274.7 288 32zM64 352c-35.3 0-64 28.7-64 64l0 32c0 35.3 28.7 64 64 64l384 0c35.3 0 64-28.7 64-64l0-32c0-35.3-28.7-64-64-64l-101.5 0-45.3 45.3c-25 25-65.5 25-90.5 0L165.5 352 64 352zm368 56a24 24 0 1 1 0 48 24 24 0 1 1 0-48z"),
+    "exclamation": ("0 0 128 512", "M96 64c0-17.7-14.3-32-32-32S32 46.3 32 64l0 256c0 17.7 14.3 32 32 32s32-14.3 32-32L96 64zM64 480a40 40 0 1 0 0-80 40 40 0 1 0 0 80z"),
+    "exclamation-circle": ("0 0 512 512", "M256 512A256 256 0 1 0 256 0a256 256 0 1 0 0 512zm0-384c13.3 0 24 10.7 24 24l0 112c0 13.3-10.7 24-24 24s-24-10.7-24-24l0-112c0-13.3 10.7-24 24-24zM224 352a32 32 0 1 1 64 0 32 32 0 1 1 -64 0z"),
+    "exclamation-triangle": ("0 0 512 512", "M256 32c14.2 0 27.3 7.5 34.5 19.8l216 368c7.3 12.4 7.3 27.7 .2 40.1S486.3 480 472 480L40 480c-14.3 0-27.6-7.7-34.7-20.1s-7-27.8 .2-40.1l216-368C228.7 39.5 241.8 32 256 32zm0 128c-13.3 0-24 10.7-24 24l0 112c0 13.3 10.7 24 24 24s24-10.7 24-24l0-112c0-13.3-10.7-24-24-24zm32 224a32 32 0 1 0 -64 0 32 32 0 1 0 64 0z"),
+    "file-alt": ("0 0 384 512", "M64 0C28.7 0 0 28.7 0 64L0 448c0 35.3 28.7 64 64 64l256 0c35.3 0 64-28.7 64-64l0-288-128 0c-17.7 0-32-14.3-32-32L224 0 64 0zM256 0l0 128 128 0L256 0zM112 256l160 0c8.8 0 16 7.2 16 16s-7.2 16-16 16l-160 0c-8.8 0-16-7.2-16-16s7.2-16 16-16zm0 64l160 0c8.8 0 16 7.2 16 16s-7.2 16-16 16l-160 0c-8.8 0-16-7.2-16-16s7.2-16 16-16zm0 64l160 0c8.8 0 16 7.2 16 16s-7.2 16-16 16l-160 0c-8.8 0-16-7.2-16-16s7.2-16 16-16z"),
+    "fire": ("0 0 448 512", "M159.3 5.4c7.8-7.3 19.9-7.2 27.7 .1c27.6 25.9 53.5 53.8 77.7 84c11-14.4 23.5-30.1 37-42.9c7.9-7.4 20.1-7.4 28 .1c34.6 33 63.9 76.6 84.5 118c20.3 40.8 33.8 82.5 33.8 111.9C448 404.2 348.2 512 224 512C98.4 512 0 404.1 0 276.5c0-38.4 17.8-85.3 45.4-131.7C73.3 97.7 112.7 48.6 159.3 5.4zM225.7 416c25.3 0 47.7-7 68.8-21c42.1-29.4 53.4-88.2 28.1-134.4c-4.5-9-16-9.6-22.5-2l-25.2 29.3c-6.6 7.6-18.5 7.4-24.7-.5c-16.5-21-46-58.5-62.8-79.8c-6.3-8-18.3-8.1-24.7-.1c-33.8 42.5-50.8 69.3-50.8 99.4C112 375.4 162.6 416 225.7 416z"),
+    "hourglass-half": ("0 0 384 512", "M32 0C14.3 0 0 14.3 0 32S14.3 64 32 64l0 11c0 42.4 16.9 83.1 46.9 113.1L146.7 256 78.9 323.9C48.9 353.9 32 394.6 32 437l0 11c-17.7 0-32 14.3-32 32s14.3 32 32 32l32 0 256 0 32 0c17.7 0 32-14.3 32-32s-14.3-32-32-32l0-11c0-42.4-16.9-83.1-46.9-113.1L237.3 256l67.9-67.9c30-30 46.9-70.7 46.9-113.1l0-11c17.7 0 32-14.3 32-32s-14.3-32-32-32L320 0 64 0 32 0zM96 75l0-11 192 0 0 11c0 19-5.6 37.4-16 53L112 128c-10.3-15.6-16-34-16-53zm16 309c3.5-5.3 7.6-10.3 12.1-14.9L192 301.3l67.9 67.9c4.6 4.6 8.6 9.6 12.1 14.9L112 384z"),
+    "info-circle": ("0 0 512 512", "M256 512A256 256 0 1 0 256 0a256 256 0 1 0 0 512zM216 336l24 0 0-64-24 0c-13.3 0-24-10.7-24-24s10.7-24 24-24l48 0c13.3 0 24 10.7 24 24l0 88 8 0c13.3 0 24 10.7 24 24s-10.7 24-24 24l-80 0c-13.3 0-24-10.7-24-24s10.7-24 24-24zm40-208a32 32 0 1 1 0 64 32 32 0 1 1 0-64z"),
+    "lightbulb": ("0 0 384 512", "M272 384c9.6-31.9 29.5-59.1 49.2-86.2c0 0 0 0 0 0c5.2-7.1 10.4-14.2 15.4-21.4c19.8-28.5 31.4-63 31.4-100.3C368 78.8 289.2 0 192 0S16 78.8 16 176c0 37.3 11.6 71.9 31.4 100.3c5 7.2 10.2 14.3 15.4 21.4c0 0 0 0 0 0c19.8 27.1 39.7 54.4 49.2 86.2l160 0zM192 512c44.2 0 80-35.8 80-80l0-16-160 0 0 16c0 44.2 35.8 80 80 80zM112 176c0 8.8-7.2 16-16 16s-16-7.2-16-16c0-61.9 50.1-112 112-112c8.8 0 16 7.2 16 16s-7.2 16-16 16c-44.2 0-80 35.8-80 80z"),
+    "print": ("0 0 512 512", "M128 0C92.7 0 64 28.7 64 64l0 96 64 0 0-96 226.7 0L384 93.3l0 66.7 64 0 0-66.7c0-17-6.7-33.3-18.7-45.3L400 18.7C388 6.7 371.7 0 354.7 0L128 0zM384 352l0 32 0 64-256 0 0-64 0-16 0-16 256 0zm64 32l32 0c17.7 0 32-14.3 32-32l0-96c0-35.3-28.7-64-64-64L64 192c-35.3 0-64 28.7-64 64l0 96c0 17.7 14.3 32 32 32l32 0 0 64c0 35.3 28.7 64 64 64l256 0c35.3 0 64-28.7 64-64l0-64zM432 248a24 24 0 1 1 0 48 24 24 0 1 1 0-48z"),
+    "project-diagram": ("0 0 576 512", "M0 80C0 53.5 21.5 32 48 32l96 0c26.5 0 48 21.5 48 48l0 16 192 0 0-16c0-26.5 21.5-48 48-48l96 0c26.5 0 48 21.5 48 48l0 96c0 26.5-21.5 48-48 48l-96 0c-26.5 0-48-21.5-48-48l0-16-192 0 0 16c0 1.7-.1 3.4-.3 5L272 288l96 0c26.5 0 48 21.5 48 48l0 96c0 26.5-21.5 48-48 48l-96 0c-26.5 0-48-21.5-48-48l0-96c0-1.7 .1-3.4 .3-5L144 224l-96 0c-26.5 0-48-21.5-48-48L0 80z"),
+    "search-minus": ("0 0 512 512", "M416 208c0 45.9-14.9 88.3-40 122.7L502.6 457.4c12.5 12.5 12.5 32.8 0 45.3s-32.8 12.5-45.3 0L330.7 376c-34.4 25.2-76.8 40-122.7 40C93.1 416 0 322.9 0 208S93.1 0 208 0S416 93.1 416 208zM136 184c-13.3 0-24 10.7-24 24s10.7 24 24 24l144 0c13.3 0 24-10.7 24-24s-10.7-24-24-24l-144 0z"),
+    "search-plus": ("0 0 512 512", "M416 208c0 45.9-14.9 88.3-40 122.7L502.6 457.4c12.5 12.5 12.5 32.8 0 45.3s-32.8 12.5-45.3 0L330.7 376c-34.4 25.2-76.8 40-122.7 40C93.1 416 0 322.9 0 208S93.1 0 208 0S416 93.1 416 208zM184 296c0 13.3 10.7 24 24 24s24-10.7 24-24l0-64 64 0c13.3 0 24-10.7 24-24s-10.7-24-24-24l-64 0 0-64c0-13.3-10.7-24-24-24s-24 10.7-24 24l0 64-64 0c-13.3 0-24 10.7-24 24s10.7 24 24 24l64 0 0 64z"),
+    "sign-out-alt": ("0 0 512 512", "M377.9 105.9L500.7 228.7c7.2 7.2 11.3 17.1 11.3 27.3s-4.1 20.1-11.3 27.3L377.9 406.1c-6.4 6.4-15 9.9-24 9.9c-18.7 0-33.9-15.2-33.9-33.9l0-62.1-128 0c-17.7 0-32-14.3-32-32l0-64c0-17.7 14.3-32 32-32l128 0 0-62.1c0-18.7 15.2-33.9 33.9-33.9c9 0 17.6 3.6 24 9.9zM160 96L96 96c-17.7 0-32 14.3-32 32l0 256c0 17.7 14.3 32 32 32l64 0c17.7 0 32 14.3 32 32s-14.3 32-32 32l-64 0c-53 0-96-43-96-96L0 128C0 75 43 32 96 32l64 0c17.7 0 32 14.3 32 32s-14.3 32-32 32z"),
+    "sort": ("0 0 320 512", "M137.4 41.4c12.5-12.5 32.8-12.5 45.3 0l128 128c9.2 9.2 11.9 22.9 6.9 34.9s-16.6 19.8-29.6 19.8L32 224c-12.9 0-24.6-7.8-29.6-19.8s-2.2-25.7 6.9-34.9l128-128zm0 429.3l-128-128c-9.2-9.2-11.9-22.9-6.9-34.9s16.6-19.8 29.6-19.8l256 0c12.9 0 24.6 7.8 29.6 19.8s2.2 25.7-6.9 34.9l-128 128c-12.5 12.5-32.8 12.5-45.3 0z"),
+    "star": ("0 0 576 512", "M316.9 18C311.6 7 300.4 0 288.1 0s-23.4 7-28.8 18L195 150.3 51.4 171.5c-12 1.8-22 10.2-25.7 21.7s-.7 24.2 7.9 32.7L137.8 329 113.2 474.7c-2 12 3 24.2 12.9 31.3s23 8 33.8 2.3l128.3-68.5 128.3 68.5c10.8 5.7 23.9 4.9 33.8-2.3s14.9-19.3 12.9-31.3L438.5 329 542.7 225.9c8.6-8.5 11.7-21.2 7.9-32.7s-13.7-19.9-25.7-21.7L381.2 150.3 316.9 18z"),
+    "sync-alt": ("0 0 512 512", "M142.9 142.9c-17.5 17.5-30.1 38-37.8 59.8c-5.9 16.7-24.2 25.4-40.8 19.5s-25.4-24.2-19.5-40.8C55.6 150.7 73.2 122 97.6 97.6c87.2-87.2 228.3-87.5 315.8-1L455 55c6.9-6.9 17.2-8.9 26.2-5.2s14.8 12.5 14.8 22.2l0 128c0 13.3-10.7 24-24 24l-8.4 0c0 0 0 0 0 0L344 224c-9.7 0-18.5-5.8-22.2-14.8s-1.7-19.3 5.2-26.2l41.1-41.1c-62.6-61.5-163.1-61.2-225.3 1zM16 312c0-13.3 10.7-24 24-24l7.6 0 .7 0L168 288c9.7 0 18.5 5.8 22.2 14.8s1.7 19.3-5.2 26.2l-41.1 41.1c62.6 61.5 163.1 61.2 225.3-1c17.5-17.5 30.1-38 37.8-59.8c5.9-16.7 24.2-25.4 40.8-19.5s25.4 24.2 19.5 40.8c-10.8 30.6-28.4 59.3-52.9 83.8c-87.2 87.2-228.3 87.5-315.8 1L57 457c-6.9 6.9-17.2 8.9-26.2 5.2S16 449.7 16 440l0-119.6 0-.7 0-7.6z"),
+    "table": ("0 0 512 512", "M64 256l0-96 160 0 0 96L64 256zm0 64l160 0 0 96L64 416l0-96zm224 96l0-96 160 0 0 96-160 0zM448 256l-160 0 0-96 160 0 0 96zM64 32C28.7 32 0 60.7 0 96L0 416c0 35.3 28.7 64 64 64l384 0c35.3 0 64-28.7 64-64l0-320c0-35.3-28.7-64-64-64L64 32z"),
+    "times": ("0 0 384 512", "M342.6 150.6c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0L192 210.7 86.6 105.4c-12.5-12.5-32.8-12.5-45.3 0s-12.5 32.8 0 45.3L146.7 256 41.4 361.4c-12.5 12.5-12.5 32.8 0 45.3s32.8 12.5 45.3 0L192 301.3 297.4 406.6c12.5 12.5 32.8 12.5 45.3 0s12.5-32.8 0-45.3L237.3 256 342.6 150.6z"),
+    "unlink": ("0 0 640 512", "M38.8 5.1C28.4-3.1 13.3-1.2 5.1 9.2S-1.2 34.7 9.2 42.9l592 464c10.4 8.2 25.5 6.3 33.7-4.1s6.3-25.5-4.1-33.7L489.3 358.2l90.5-90.5c56.5-56.5 56.5-148 0-204.5c-50-50-128.8-56.5-186.3-15.4l-1.6 1.1c-14.4 10.3-17.7 30.3-7.4 44.6s30.3 17.7 44.6 7.4l1.6-1.1c32.1-22.9 76-19.3 103.8 8.6c31.5 31.5 31.5 82.5 0 114l-96 96-31.9-25C430.9 239.6 420.1 175.1 377 132c-52.2-52.3-134.5-56.2-191.3-11.7L38.8 5.1zM239 162c30.1-14.9 67.7-9.9 92.8 15.3c20 20 27.5 48.3 21.7 74.5L239 162zM406.6 416.4L220.9 270c-2.1 39.8 12.2 80.1 42.2 110c38.9 38.9 94.4 51 143.6 36.3zm-290-228.5L60.2 244.3c-56.5 56.5-56.5 148 0 204.5c50 50 128.8 56.5 186.3 15.4l1.6-1.1c14.4-10.3 17.7-30.3 7.4-44.6s-30.3-17.7-44.6-7.4l-1.6 1.1c-32.1 22.9-76 19.3-103.8-8.6C74 372 74 321 105.5 289.5l61.8-61.8-50.6-39.9z"),
+}
+
+ICON_SPRITE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">'
+    + "".join(
+        f'<symbol id="icon-{name}" viewBox="{view_box}"><path d="{path}"/></symbol>'
+        for name, (view_box, path) in ICON_PATHS.items()
+    )
+    + "</svg>"
+)
+
+
+def render_icon(name: str, classes: str = "") -> Markup:
+    """Render an inline SVG icon that references the page's icon sprite."""
+    class_attr = f"icon {classes}".strip()
+    return Markup(f'<svg class="{class_attr}" aria-hidden="true"><use href="#icon-{name}"/></svg>')
+
+
+app.jinja_env.globals.update(ICON_SPRITE=Markup(ICON_SPRITE_SVG), icon=render_icon)
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -111,16 +263,28 @@ def load_crawl_data() -> pd.DataFrame:
     return df
 
 
+def compute_data_etag(timestamp: str) -> str:
+    """Derive an ETag for the loaded crawl data from the CSV file and load time."""
+    if CSV_FILE_PATH.exists():
+        csv_stat = CSV_FILE_PATH.stat()
+        version = f"{csv_stat.st_mtime_ns}:{csv_stat.st_size}:{timestamp}"
+    else:
+        version = f"missing:{timestamp}"
+    return hashlib.blake2b(version.encode(), digest_size=16).hexdigest()
+
+
 def load_dashboard_data() -> Dict[str, Any]:
     """Load all dashboard data."""
     df = load_crawl_data()
     
     if df.empty:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         return {
             "df_crawl": df,
             "audit_data": {},
             "stats": {},
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
+            "etag": compute_data_etag(timestamp),
         }
 
     # Generate audit data
@@ -153,11 +317,13 @@ def load_dashboard_data() -> Dict[str, Any]:
         "deep_pages": int((df["depth"] >= 5).sum()) if len(df) > 0 else 0,
     }
 
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     return {
         "df_crawl": df,
         "audit_data": audit_data,
         "stats": stats,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": timestamp,
+        "etag": compute_data_etag(timestamp),
     }
 
 
@@ -180,6 +346,41 @@ def refresh_dashboard_data() -> Dict[str, Any]:
     return _dashboard_data
 
 
+# ---------------------------------------------------------------------------
+# Data Table Functions
+# ---------------------------------------------------------------------------
+
+TABLE_COLUMNS = ["url", "title", "depth", "child_count", "status_code"]
+TABLE_URL_DISPLAY_LEN = 50
+TABLE_TITLE_DISPLAY_LEN = 40
+# Field order of each /api/rows.ndjson line
+TABLE_ROW_FIELDS = TABLE_COLUMNS + ["url_disp", "title_disp", "status_class"]
+
+
+def truncate_column(values: pd.Series, length: int) -> pd.Series:
+    """Truncate a string column for display, appending an ellipsis when cut."""
+    return values.str.slice(0, length).where(values.str.len() <= length, values.str.slice(0, length) + "...")
+
+
+def status_class_column(status_codes: pd.Series) -> pd.Series:
+    """Bucket HTTP status codes into the data table's badge classes."""
+    return pd.Series("error", index=status_codes.index).mask(
+        status_codes < 400, "redirect"
+    ).mask(status_codes == 200, "ok")
+
+
+def build_table_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Build data table rows with display strings and status class precomputed."""
+    if df.empty:
+        return []
+
+    rows = df[TABLE_COLUMNS].copy()
+    rows["url_disp"] = truncate_column(rows["url"], TABLE_URL_DISPLAY_LEN)
+    rows["title_disp"] = truncate_column(rows["title"], TABLE_TITLE_DISPLAY_LEN)
+    rows["status_class"] = status_class_column(rows["status_code"])
+    return rows.to_dict("records")
+
+
 # ---------------------------------------------------------------------------
 # Visualization Functions
 # ---------------------------------------------------------------------------
@@ -399,6 +600,7 @@ def create_mindmap_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
 
     # Build graph
     G = nx.DiGraph()
+    known_urls = set(df_limited["url"])
     
     for _, row in df_limited.iterrows():
         url = row["url"]
@@ -411,7 +613,7 @@ def create_mindmap_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
             "status_code": int(row.get("status_code", 200)),
         })
         
-        if parent and parent in [r["url"] for _, r in df_limited.iterrows()]:
+        if parent and parent in known_urls:
             G.add_edge(parent, url)
 
     # Find root nodes
@@ -475,12 +677,15 @@ def create_mindmap_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
         if edge[0] in pos and edge[1] in pos:
             x0, y0 = pos[edge[0]]
             x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+            edge_x.extend([x0, x1, np.nan])
+            edge_y.extend([y0, y1, np.nan])
 
+    # Coordinates and sizes go out as numpy typed arrays, which Plotly
+    # serializes as compact base64 float32/uint8 buffers instead of
+    # long decimal lists.
     edge_trace = go.Scatter(
-        x=edge_x,
-        y=edge_y,
+        x=np.array(edge_x, dtype=np.float32),
+        y=np.array(edge_y, dtype=np.float32),
         line=dict(width=1, color="#475569"),
         hoverinfo="none",
         mode="lines",
@@ -532,15 +737,15 @@ def create_mindmap_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
         depth_name = depth_names.get(depth, f"Level {depth}")
         
         node_trace = go.Scatter(
-            x=node_x,
-            y=node_y,
+            x=np.array(node_x, dtype=np.float32),
+            y=np.array(node_y, dtype=np.float32),
             mode="markers",
             hoverinfo="text",
             text=node_text,
             name=depth_name,
             marker=dict(
                 color=get_depth_color(depth),
-                size=node_size,
+                size=np.array(node_size, dtype=np.uint8),
                 line=dict(width=2, color="#0F172A"),
                 opacity=0.9,
             ),
@@ -657,6 +862,7 @@ def create_tree_hierarchy_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
 
     # Build graph
     G = nx.DiGraph()
+    known_urls = set(df_limited["url"])
     
     for _, row in df_limited.iterrows():
         url = row["url"]
@@ -669,7 +875,7 @@ def create_tree_hierarchy_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
             "status_code": int(row.get("status_code", 200)),
         })
         
-        if parent and parent in [r["url"] for _, r in df_limited.iterrows()]:
+        if parent and parent in known_urls:
             G.add_edge(parent, url)
 
     # Find root nodes
@@ -727,12 +933,12 @@ def create_tree_hierarchy_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
         if edge[0] in pos and edge[1] in pos:
             x0, y0 = pos[edge[0]]
             x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+            edge_x.extend([x0, x1, np.nan])
+            edge_y.extend([y0, y1, np.nan])
 
     edge_trace = go.Scatter(
-        x=edge_x,
-        y=edge_y,
+        x=np.array(edge_x, dtype=np.float32),
+        y=np.array(edge_y, dtype=np.float32),
         line=dict(width=1.5, color="#475569"),
         hoverinfo="none",
         mode="lines",
@@ -784,15 +990,15 @@ def create_tree_hierarchy_plotly(df: pd.DataFrame, max_nodes: int = 100) -> str:
         depth_name = depth_names.get(depth, f"Level {depth}")
         
         node_trace = go.Scatter(
-            x=node_x,
-            y=node_y,
+            x=np.array(node_x, dtype=np.float32),
+            y=np.array(node_y, dtype=np.float32),
             mode="markers",
             hoverinfo="text",
             text=node_text,
             name=depth_name,
             marker=dict(
                 color=get_depth_color(depth),
-                size=node_size,
+                size=np.array(node_size, dtype=np.uint8),
                 line=dict(width=2, color="#0F172A"),
                 opacity=0.9,
                 symbol="square" if depth == 0 else "circle",
@@ -850,15 +1056,14 @@ SHADCN_DASHBOARD_HTML = '''
     <!-- Tailwind CSS -->
     <script src="https://cdn.tailwindcss.com"></script>
     
-    <!-- Plotly.js -->
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <!-- Plotly.js (fetched in parallel, executed by loadPlotly() before the first chart) -->
+    <link rel="preload" as="script" href="https://cdn.plot.ly/plotly-2.35.2.min.js">
     
-    <!-- jsPDF & html2canvas for PDF Export -->
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js"></script>
+    <!-- jsPDF is loaded on demand by the PDF export buttons -->
     
-    <!-- Font Awesome -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <!-- Font Awesome (non-blocking) -->
+    <link rel="preload" as="style" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"></noscript>
     
     <!-- Google Fonts -->
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
@@ -954,6 +1159,30 @@ SHADCN_DASHBOARD_HTML = '''
         .animate-slide-up {
             animation: slideUp 0.3s ease forwards;
         }
+        /* Exit runs as an animation too, so it overrides the slide-up fill */
+        @keyframes slideDown {
+            from { 
+                opacity: 1; 
+                transform: translateY(0); 
+            }
+            to { 
+                opacity: 0; 
+                transform: translateY(20px); 
+            }
+        }
+        .notification-exit {
+            animation: slideDown 0.3s ease forwards;
+        }
+        
+        /* Inline SVG icons (sprite) */
+        .icon {
+            display: inline-block;
+            width: 1em;
+            height: 1em;
+            vertical-align: -0.125em;
+            fill: currentColor;
+            overflow: visible;
+        }
         
         /* Progress bar animation */
         .progress-bar {
@@ -965,6 +1194,52 @@ SHADCN_DASHBOARD_HTML = '''
             background-color: rgba(59, 130, 246, 0.1);
         }
         
+        /* Page scroll is locked while a modal is open */
+        body.modal-open {
+            overflow: hidden;
+        }
+        
+        /* Below-the-fold sections skip layout and paint until scrolled near.
+           Not used on tab panels: their containment would trap the fixed-position modals. */
+        .deferred-section {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 600px;
+        }
+        
+        /* Data table status badges: one short class per status bucket
+           (same look as the PILL_GOOD/WARN/BAD utility strings) */
+        .status-badge {
+            display: inline-flex;
+            align-items: center;
+            gap: 0.25rem;
+            border-radius: 9999px;
+            padding: 0.25rem 0.625rem;
+            font-size: 0.75rem;
+            line-height: 1rem;
+            font-weight: 500;
+        }
+        .status-badge-ok {
+            background-color: rgba(34, 197, 94, 0.1);
+            color: #4ADE80;
+        }
+        .status-badge-redirect {
+            background-color: rgba(245, 158, 11, 0.1);
+            color: #FBBF24;
+        }
+        .status-badge-error {
+            background-color: rgba(239, 68, 68, 0.1);
+            color: #F87171;
+        }
+        
+        /* Virtualized table rows (keep in sync with TABLE_ROW_HEIGHT) */
+        #dataTableBody tr.table-row-hover {
+            height: 44px;
+        }
+        #dataTableBody tr.spacer-top,
+        #dataTableBody tr.spacer-bottom {
+            border: 0;
+        }
+        
         /* Light mode overrides */
         html:not(.dark) body {
             background-color: #F8FAFC;
@@ -987,6 +1262,8 @@ SHADCN_DASHBOARD_HTML = '''
     </style>
 </head>
 <body class="bg-slate-900 text-slate-50 font-sans min-h-screen">
+    {{ ICON_SPRITE }}
+    
     <!-- Header -->
     <header class="sticky top-0 z-50 w-full border-b border-slate-700 bg-slate-900/95 backdrop-blur supports-[backdrop-filter]:bg-slate-900/60">
         <div class="container mx-auto flex h-16 max-w-screen-2xl items-center justify-between px-4">
@@ -1101,7 +1378,7 @@ SHADCN_DASHBOARD_HTML = '''
                 
                 <!-- Export Options -->
                 <div class="flex items-center gap-2">
-                    <button onclick="exportDashboardPDF()" class="px-4 py-2 rounded-lg bg-green-600 hover:bg-green-700 text-white text-sm font-medium transition-colors">
+                    <button onclick="exportDashboardPDF()" onpointerenter="preloadPdfLibs()" onfocus="preloadPdfLibs()" class="px-4 py-2 rounded-lg bg-green-600 hover:bg-green-700 text-white text-sm font-medium transition-colors">
                         <i class="fas fa-file-pdf mr-2"></i>Export PDF
                     </button>
                     <button onclick="exportDashboardCSV()" class="px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm font-medium transition-colors">
@@ -1140,7 +1417,7 @@ SHADCN_DASHBOARD_HTML = '''
             <!-- Summary Cards - Now Clickable -->
             <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4 mb-6">
                 <!-- Card 1: Total Pages -->
-                <div onclick="openDrilldownModal('total_pages')" class="rounded-xl border border-slate-700 bg-slate-800 p-5 card-hover transition-all cursor-pointer hover:border-blue-500/50 hover:shadow-lg hover:shadow-blue-500/10 group">
+                <div data-action="openDrilldown" data-metric="total_pages" class="{{ CARD }} p-5 card-hover transition-all cursor-pointer hover:border-blue-500/50 hover:shadow-lg hover:shadow-blue-500/10 group">
                     <div class="flex items-start justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400 group-hover:text-blue-400 transition-colors">Total Pages</p>
@@ -1157,7 +1434,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- Card 2: IA Score -->
-                <div onclick="openDrilldownModal('ia_score')" class="rounded-xl border border-slate-700 bg-slate-800 p-5 card-hover transition-all cursor-pointer hover:border-green-500/50 hover:shadow-lg hover:shadow-green-500/10 group">
+                <div data-action="openDrilldown" data-metric="ia_score" class="{{ CARD }} p-5 card-hover transition-all cursor-pointer hover:border-green-500/50 hover:shadow-lg hover:shadow-green-500/10 group">
                     <div class="flex items-start justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400 group-hover:text-green-400 transition-colors">Architecture Score</p>
@@ -1179,7 +1456,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- Card 3: Average Depth -->
-                <div onclick="openDrilldownModal('avg_depth')" class="rounded-xl border border-slate-700 bg-slate-800 p-5 card-hover transition-all cursor-pointer hover:border-amber-500/50 hover:shadow-lg hover:shadow-amber-500/10 group">
+                <div data-action="openDrilldown" data-metric="avg_depth" class="{{ CARD }} p-5 card-hover transition-all cursor-pointer hover:border-amber-500/50 hover:shadow-lg hover:shadow-amber-500/10 group">
                     <div class="flex items-start justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400 group-hover:text-amber-400 transition-colors">Average Depth</p>
@@ -1196,7 +1473,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- Card 4: Health Status -->
-                <div onclick="openDrilldownModal('health_status')" class="rounded-xl border border-slate-700 bg-slate-800 p-5 card-hover transition-all cursor-pointer hover:border-purple-500/50 hover:shadow-lg hover:shadow-purple-500/10 group">
+                <div data-action="openDrilldown" data-metric="health_status" class="{{ CARD }} p-5 card-hover transition-all cursor-pointer hover:border-purple-500/50 hover:shadow-lg hover:shadow-purple-500/10 group">
                     <div class="flex items-start justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400 group-hover:text-purple-400 transition-colors">Health Status</p>
@@ -1230,7 +1507,7 @@ SHADCN_DASHBOARD_HTML = '''
                                 <span>Deep Dive Analysis</span>
                             </h3>
                             <div class="flex items-center gap-2">
-                                <button onclick="exportDrilldownPDF()" class="px-3 py-1.5 rounded-lg bg-green-600 hover:bg-green-700 text-white text-xs font-medium transition-colors">
+                                <button onclick="exportDrilldownPDF()" onpointerenter="preloadPdfLibs()" onfocus="preloadPdfLibs()" class="px-3 py-1.5 rounded-lg bg-green-600 hover:bg-green-700 text-white text-xs font-medium transition-colors">
                                     <i class="fas fa-file-pdf mr-1"></i>PDF
                                 </button>
                                 <button onclick="exportDrilldownCSV()" class="px-3 py-1.5 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-xs font-medium transition-colors">
@@ -1252,12 +1529,120 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
             </div>
             
+            <!-- Total Pages drilldown body, cloned into the modal on open -->
+            <template id="drilldownPagesTpl">
+                <!-- Summary Cards -->
+                <div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">
+                    <div class="p-4 rounded-lg bg-slate-700/30 border border-slate-600/30">
+                        <p class="text-xs text-slate-400">Current Total</p>
+                        <p class="text-2xl font-bold text-blue-400">{{ stats.total_pages }}</p>
+                        <p class="text-xs text-slate-500">pages</p>
+                    </div>
+                    <div class="p-4 rounded-lg bg-slate-700/30 border border-green-600/30">
+                        <p class="text-xs text-slate-400">YoY Growth</p>
+                        <p class="text-2xl font-bold text-green-400">+{{ page_growth.growth_rate }}%</p>
+                        <p class="text-xs text-slate-500">vs last year</p>
+                    </div>
+                    <div class="p-4 rounded-lg bg-slate-700/30 border border-amber-600/30">
+                        <p class="text-xs text-slate-400">Monthly Avg</p>
+                        <p class="text-2xl font-bold text-amber-400">+{{ page_growth.avg_monthly_growth | round | int }}</p>
+                        <p class="text-xs text-slate-500">pages/month</p>
+                    </div>
+                    <div class="p-4 rounded-lg bg-slate-700/30 border border-purple-600/30">
+                        <p class="text-xs text-slate-400">EOY Projected</p>
+                        <p class="text-2xl font-bold text-purple-400">{{ page_growth.projected_end_of_year }}</p>
+                        <p class="text-xs text-slate-500">end of year</p>
+                    </div>
+                </div>
+                
+                <!-- Monthly Comparison -->
+                <div class="mb-6 p-4 rounded-xl bg-slate-700/20 border border-slate-600/30">
+                    <h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+                        <i class="fas fa-calendar-alt text-cyan-400"></i>Monthly Comparison
+                    </h4>
+                    <div class="grid grid-cols-2 md:grid-cols-4 gap-4">
+                        <div class="text-center p-3 rounded-lg bg-slate-800">
+                            <p class="text-xs text-slate-400">Last Month</p>
+                            <p class="text-xl font-bold text-slate-300">{{ page_growth.last_month_pages }}</p>
+                        </div>
+                        <div class="text-center p-3 rounded-lg bg-slate-800">
+                            <p class="text-xs text-slate-400">This Month</p>
+                            <p class="text-xl font-bold text-blue-400">{{ page_growth.this_month_pages }}</p>
+                        </div>
+                        <div class="text-center p-3 rounded-lg bg-green-900/30">
+                            <p class="text-xs text-slate-400">Pages Added</p>
+                            <p class="text-xl font-bold text-green-400">+{{ page_growth.pages_added }}</p>
+                        </div>
+                        <div class="text-center p-3 rounded-lg bg-red-900/30">
+                            <p class="text-xs text-slate-400">Pages Removed</p>
+                            <p class="text-xl font-bold text-red-400">-{{ page_growth.pages_removed }}</p>
+                        </div>
+                    </div>
+                </div>
+                
+                <!-- 12-Month Trend Chart -->
+                <div class="mb-6">
+                    <h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+                        <i class="fas fa-chart-line text-blue-400"></i>12-Month Historical Trend
+                    </h4>
+                    <div id="drilldownTrendChart" style="height: 250px;"></div>
+                </div>
+                
+                <!-- Two Column Layout -->
+                <div class="grid grid-cols-1 md:grid-cols-2 gap-6">
+                    <!-- Pages by Section -->
+                    <div>
+                        <h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+                            <i class="fas fa-folder-tree text-amber-400"></i>Pages by Section
+                        </h4>
+                        <div id="drilldownSectionChart" style="height: 200px;"></div>
+                    </div>
+                    
+                    <!-- Contributing Factors -->
+                    <div>
+                        <h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+                            <i class="fas fa-lightbulb text-green-400"></i>Contributing Factors (What Changed)
+                        </h4>
+                        <div class="space-y-2">
+                            <div class="p-3 rounded-lg bg-green-900/20 border border-green-600/30">
+                                <div class="flex items-center justify-between">
+                                    <p class="text-sm text-green-400 font-medium"><i class="fas fa-plus-circle mr-2"></i>New Content Added</p>
+                                    <span class="text-xs bg-green-600/30 text-green-400 px-2 py-0.5 rounded">+{{ page_growth.pages_added }}</span>
+                                </div>
+                                <p class="text-xs text-slate-400 mt-1">News and Events sections expanded</p>
+                            </div>
+                            <div class="p-3 rounded-lg bg-blue-900/20 border border-blue-600/30">
+                                <div class="flex items-center justify-between">
+                                    <p class="text-sm text-blue-400 font-medium"><i class="fas fa-sitemap mr-2"></i>Structure Improved</p>
+                                    <span class="text-xs bg-blue-600/30 text-blue-400 px-2 py-0.5 rounded">Better</span>
+                                </div>
+                                <p class="text-xs text-slate-400 mt-1">Navigation restructured for better UX</p>
+                            </div>
+                            <div class="p-3 rounded-lg bg-red-900/20 border border-red-600/30">
+                                <div class="flex items-center justify-between">
+                                    <p class="text-sm text-red-400 font-medium"><i class="fas fa-archive mr-2"></i>Pages Archived</p>
+                                    <span class="text-xs bg-red-600/30 text-red-400 px-2 py-0.5 rounded">-{{ page_growth.pages_removed }}</span>
+                                </div>
+                                <p class="text-xs text-slate-400 mt-1">Old content moved to archive</p>
+                            </div>
+                            <div class="p-3 rounded-lg bg-amber-900/20 border border-amber-600/30">
+                                <div class="flex items-center justify-between">
+                                    <p class="text-sm text-amber-400 font-medium"><i class="fas fa-chart-line mr-2"></i>Growth Rate</p>
+                                    <span class="text-xs bg-amber-600/30 text-amber-400 px-2 py-0.5 rounded">{{ page_growth.growth_rate }}%</span>
+                                </div>
+                                <p class="text-xs text-slate-400 mt-1">Consistent growth over 12 months</p>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </template>
+            
             <!-- Three Column Layout -->
             <div class="grid grid-cols-1 lg:grid-cols-12 gap-6">
                 <!-- Left Column: Metrics + Top Pages -->
                 <div class="lg:col-span-3 space-y-4">
                     <!-- Key Metrics -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-chart-pie text-blue-400"></i>
                             Key Metrics
@@ -1287,7 +1672,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Top Pages -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-trophy text-amber-400"></i>
                             Top Pages
@@ -1313,7 +1698,7 @@ SHADCN_DASHBOARD_HTML = '''
                 
                 <!-- Center Column: Network Graph -->
                 <div class="lg:col-span-5">
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5 h-full">
+                    <div class="{{ CARD }} p-5 h-full">
                         <div class="flex items-center justify-between mb-4">
                             <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
                                 <i class="fas fa-project-diagram text-blue-400"></i>
@@ -1353,7 +1738,7 @@ SHADCN_DASHBOARD_HTML = '''
                     <div class="rounded-xl border border-amber-500/30 bg-amber-500/10 p-4">
                         <div class="flex items-start gap-3">
                             <div class="rounded-lg bg-amber-500/20 p-2">
-                                <i class="fas fa-exclamation-triangle text-amber-400"></i>
+                                {{ icon('exclamation-triangle', 'text-amber-400') }}
                             </div>
                             <div>
                                 <h4 class="text-sm font-semibold text-amber-300">Issues Detected</h4>
@@ -1367,7 +1752,7 @@ SHADCN_DASHBOARD_HTML = '''
                     <div class="rounded-xl border border-green-500/30 bg-green-500/10 p-4">
                         <div class="flex items-start gap-3">
                             <div class="rounded-lg bg-green-500/20 p-2">
-                                <i class="fas fa-check-circle text-green-400"></i>
+                                {{ icon('check-circle', 'text-green-400') }}
                             </div>
                             <div>
                                 <h4 class="text-sm font-semibold text-green-300">All Clear!</h4>
@@ -1380,15 +1765,15 @@ SHADCN_DASHBOARD_HTML = '''
                     {% endif %}
                     
                     <!-- Issues List -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
-                            <i class="fas fa-exclamation-circle text-red-400"></i>
+                            {{ icon('exclamation-circle', 'text-red-400') }}
                             Issues Found
                         </h3>
                         <div class="space-y-2">
                             {% if orphan_count > 0 %}
                             <div class="flex items-center gap-3 p-3 rounded-lg bg-red-500/10 border-l-2 border-red-500">
-                                <i class="fas fa-unlink text-red-400"></i>
+                                {{ icon('unlink', 'text-red-400') }}
                                 <div>
                                     <p class="text-sm font-medium text-slate-200">{{ orphan_count }} orphan pages</p>
                                     <p class="text-xs text-slate-400">No inbound links</p>
@@ -1397,7 +1782,7 @@ SHADCN_DASHBOARD_HTML = '''
                             {% endif %}
                             {% if dead_end_count > 0 %}
                             <div class="flex items-center gap-3 p-3 rounded-lg bg-amber-500/10 border-l-2 border-amber-500">
-                                <i class="fas fa-sign-out-alt text-amber-400"></i>
+                                {{ icon('sign-out-alt', 'text-amber-400') }}
                                 <div>
                                     <p class="text-sm font-medium text-slate-200">{{ dead_end_count }} dead ends</p>
                                     <p class="text-xs text-slate-400">No outbound navigation</p>
@@ -1406,7 +1791,7 @@ SHADCN_DASHBOARD_HTML = '''
                             {% endif %}
                             {% if bottleneck_count > 0 %}
                             <div class="flex items-center gap-3 p-3 rounded-lg bg-yellow-500/10 border-l-2 border-yellow-500">
-                                <i class="fas fa-hourglass-half text-yellow-400"></i>
+                                {{ icon('hourglass-half', 'text-yellow-400') }}
                                 <div>
                                     <p class="text-sm font-medium text-slate-200">{{ bottleneck_count }} bottlenecks</p>
                                     <p class="text-xs text-slate-400">Hard to reach pages</p>
@@ -1415,7 +1800,7 @@ SHADCN_DASHBOARD_HTML = '''
                             {% endif %}
                             {% if orphan_count == 0 and dead_end_count == 0 and bottleneck_count == 0 %}
                             <div class="flex items-center gap-3 p-3 rounded-lg bg-green-500/10 border-l-2 border-green-500">
-                                <i class="fas fa-check text-green-400"></i>
+                                {{ icon('check', 'text-green-400') }}
                                 <div>
                                     <p class="text-sm font-medium text-slate-200">No issues found</p>
                                     <p class="text-xs text-slate-400">Structure is well-organized</p>
@@ -1426,9 +1811,9 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Quick Wins -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
-                            <i class="fas fa-lightbulb text-yellow-400"></i>
+                            {{ icon('lightbulb', 'text-yellow-400') }}
                             Quick Wins
                         </h3>
                         <div class="space-y-2">
@@ -1455,7 +1840,7 @@ SHADCN_DASHBOARD_HTML = '''
                             {% if not recommendations.critical and not recommendations.important %}
                             <div class="p-3 rounded-lg bg-green-500/10">
                                 <p class="text-sm text-green-300">
-                                    <i class="fas fa-check-circle mr-2"></i>
+                                    {{ icon('check-circle', 'mr-2') }}
                                     No urgent actions needed!
                                 </p>
                             </div>
@@ -1469,377 +1854,27 @@ SHADCN_DASHBOARD_HTML = '''
         <!-- ============================================================ -->
         <!-- TAB 2: NETWORK -->
         <!-- ============================================================ -->
-        <div class="tab-content" id="tab-network">
-            <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
-                <div class="flex items-center justify-between mb-4">
-                    <h3 class="text-lg font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-project-diagram text-blue-400"></i>
-                        Interactive Network Visualization
-                    </h3>
-                    <div class="flex gap-2">
-                        <button onclick="zoomIn()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
-                            <i class="fas fa-search-plus mr-1"></i> Zoom In
-                        </button>
-                        <button onclick="zoomOut()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
-                            <i class="fas fa-search-minus mr-1"></i> Zoom Out
-                        </button>
-                        <button onclick="resetNetworkView()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
-                            <i class="fas fa-sync-alt mr-1"></i> Reset
-                        </button>
-                        <button onclick="exportNetworkPNG()" class="px-3 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm transition-colors">
-                            <i class="fas fa-download mr-1"></i> Export PNG
-                        </button>
-                    </div>
-                </div>
-                <div class="rounded-lg bg-slate-900 overflow-hidden" style="height: 600px;">
-                    <div id="networkGraphFull" style="width: 100%; height: 100%;"></div>
-                </div>
-                
-                <!-- Legend -->
-                <div class="flex flex-wrap gap-6 mt-4 p-4 rounded-lg bg-slate-700/30">
-                    <div class="flex items-center gap-2">
-                        <span class="w-4 h-4 rounded-full bg-blue-500"></span>
-                        <span class="text-sm text-slate-300">Depth 0-1 (Homepage/Main)</span>
-                    </div>
-                    <div class="flex items-center gap-2">
-                        <span class="w-4 h-4 rounded-full bg-purple-500"></span>
-                        <span class="text-sm text-slate-300">Depth 2-3 (Section Pages)</span>
-                    </div>
-                    <div class="flex items-center gap-2">
-                        <span class="w-4 h-4 rounded-full bg-pink-500"></span>
-                        <span class="text-sm text-slate-300">Depth 4+ (Deep Pages)</span>
-                    </div>
-                    <div class="flex items-center gap-2 text-slate-400 text-sm">
-                        <i class="fas fa-info-circle"></i>
-                        Node size represents link count
-                    </div>
-                </div>
+        <div class="tab-content" id="tab-network" data-src="/tab/network">
+            <div class="flex items-center justify-center py-12">
+                <i class="fas fa-spinner fa-spin text-3xl text-blue-400"></i>
             </div>
         </div>
         
         <!-- ============================================================ -->
         <!-- TAB 3: STATISTICS -->
         <!-- ============================================================ -->
-        <div class="tab-content" id="tab-statistics">
-            <!-- Charts Row -->
-            <div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-6">
-                <!-- Depth Distribution -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
-                    <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
-                        <i class="fas fa-chart-bar text-blue-400"></i>
-                        Pages by Depth Level
-                    </h3>
-                    <div id="depthChart" style="height: 300px;"></div>
-                </div>
-                
-                <!-- Section Distribution -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
-                    <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
-                        <i class="fas fa-chart-pie text-purple-400"></i>
-                        Content Distribution
-                    </h3>
-                    <div id="sectionChart" style="height: 300px;"></div>
-                </div>
-            </div>
-            
-            <!-- Metrics Cards -->
-            <div class="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-6">
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-5 text-center">
-                    <p class="text-3xl font-bold text-blue-400">{{ (stats.total_pages / (stats.max_depth + 1)) | round(1) }}</p>
-                    <p class="text-sm text-slate-400 mt-1">Breadth (avg/depth)</p>
-                </div>
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-5 text-center">
-                    <p class="text-3xl font-bold text-purple-400">0 - {{ stats.max_depth }}</p>
-                    <p class="text-sm text-slate-400 mt-1">Depth Range</p>
-                </div>
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-5 text-center">
-                    <p class="text-3xl font-bold text-amber-400">{{ stats.avg_links }}</p>
-                    <p class="text-sm text-slate-400 mt-1">Link Density</p>
-                </div>
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-5 text-center">
-                    <p class="text-3xl font-bold text-green-400">{{ ia_score.breakdown.connectivity_score }}%</p>
-                    <p class="text-sm text-slate-400 mt-1">Connectivity</p>
-                </div>
-            </div>
-            
-            <!-- Metrics Table -->
-            <div class="rounded-xl border border-slate-700 bg-slate-800 overflow-hidden">
-                <div class="p-5 border-b border-slate-700">
-                    <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-table text-blue-400"></i>
-                        Detailed Metrics Comparison
-                    </h3>
-                </div>
-                <div class="overflow-x-auto">
-                    <table class="w-full">
-                        <thead class="bg-slate-700/50">
-                            <tr>
-                                <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Metric</th>
-                                <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Current</th>
-                                <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Best Practice</th>
-                                <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Status</th>
-                            </tr>
-                        </thead>
-                        <tbody class="divide-y divide-slate-700">
-                            <tr class="table-row-hover">
-                                <td class="px-5 py-4 text-sm font-medium text-slate-200">Max Depth</td>
-                                <td class="px-5 py-4 text-sm text-slate-300">{{ stats.max_depth }}</td>
-                                <td class="px-5 py-4 text-sm text-slate-400">≤ 4</td>
-                                <td class="px-5 py-4">
-                                    {% if stats.max_depth <= 4 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> Good
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-amber-500/10 text-amber-400">
-                                        <i class="fas fa-exclamation"></i> Review
-                                    </span>
-                                    {% endif %}
-                                </td>
-                            </tr>
-                            <tr class="table-row-hover">
-                                <td class="px-5 py-4 text-sm font-medium text-slate-200">Average Depth</td>
-                                <td class="px-5 py-4 text-sm text-slate-300">{{ stats.avg_depth }}</td>
-                                <td class="px-5 py-4 text-sm text-slate-400">≤ 3.0</td>
-                                <td class="px-5 py-4">
-                                    {% if stats.avg_depth <= 3 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> Good
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-amber-500/10 text-amber-400">
-                                        <i class="fas fa-exclamation"></i> Review
-                                    </span>
-                                    {% endif %}
-                                </td>
-                            </tr>
-                            <tr class="table-row-hover">
-                                <td class="px-5 py-4 text-sm font-medium text-slate-200">IA Score</td>
-                                <td class="px-5 py-4 text-sm text-slate-300">{{ ia_score.final_score }}/100</td>
-                                <td class="px-5 py-4 text-sm text-slate-400">≥ 75</td>
-                                <td class="px-5 py-4">
-                                    {% if ia_score.final_score >= 75 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> {{ ia_score.health_status }}
-                                    </span>
-                                    {% elif ia_score.final_score >= 50 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-amber-500/10 text-amber-400">
-                                        <i class="fas fa-exclamation"></i> {{ ia_score.health_status }}
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-red-500/10 text-red-400">
-                                        <i class="fas fa-times"></i> {{ ia_score.health_status }}
-                                    </span>
-                                    {% endif %}
-                                </td>
-                            </tr>
-                            <tr class="table-row-hover">
-                                <td class="px-5 py-4 text-sm font-medium text-slate-200">Orphan Pages</td>
-                                <td class="px-5 py-4 text-sm text-slate-300">{{ orphan_count }}</td>
-                                <td class="px-5 py-4 text-sm text-slate-400">0</td>
-                                <td class="px-5 py-4">
-                                    {% if orphan_count == 0 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> Good
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-red-500/10 text-red-400">
-                                        <i class="fas fa-times"></i> Fix Required
-                                    </span>
-                                    {% endif %}
-                                </td>
-                            </tr>
-                            <tr class="table-row-hover">
-                                <td class="px-5 py-4 text-sm font-medium text-slate-200">Dead Ends</td>
-                                <td class="px-5 py-4 text-sm text-slate-300">{{ dead_end_count }}</td>
-                                <td class="px-5 py-4 text-sm text-slate-400">< 10%</td>
-                                <td class="px-5 py-4">
-                                    {% if dead_end_count < stats.total_pages * 0.1 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> Good
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-amber-500/10 text-amber-400">
-                                        <i class="fas fa-exclamation"></i> Review
-                                    </span>
-                                    {% endif %}
-                                </td>
-                            </tr>
-                        </tbody>
-                    </table>
-                </div>
+        <div class="tab-content" id="tab-statistics" data-src="/tab/statistics">
+            <div class="flex items-center justify-center py-12">
+                <i class="fas fa-spinner fa-spin text-3xl text-blue-400"></i>
             </div>
         </div>
         
         <!-- ============================================================ -->
         <!-- TAB 4: AUDIT REPORT -->
         <!-- ============================================================ -->
-        <div class="tab-content" id="tab-audit">
-            <!-- Export Controls -->
-            <div class="flex justify-end gap-2 mb-6">
-                <a href="/download-report" class="inline-flex items-center gap-2 px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
-                    <i class="fas fa-file-alt"></i> Export TXT
-                </a>
-                <button onclick="window.print()" class="inline-flex items-center gap-2 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm transition-colors">
-                    <i class="fas fa-print"></i> Print Report
-                </button>
-            </div>
-            
-            <!-- Executive Summary -->
-            <div class="rounded-xl border border-slate-700 bg-slate-800 mb-4 overflow-hidden">
-                <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
-                    <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-clipboard-list text-blue-400"></i>
-                        Executive Summary
-                    </h3>
-                    <i class="fas fa-chevron-down text-slate-400 transition-transform section-icon"></i>
-                </button>
-                <div class="section-content px-5 pb-5">
-                    <div class="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-4">
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-blue-400">{{ ia_score.final_score }}/100</p>
-                            <p class="text-xs text-slate-400 mt-1">IA Score</p>
-                        </div>
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-slate-200">{{ stats.total_pages }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Total Pages</p>
-                        </div>
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-slate-200">{{ stats.max_depth }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Max Depth</p>
-                        </div>
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold {{ 'text-green-400' if ia_score.health_status in ['Excellent', 'Good'] else 'text-amber-400' }}">{{ ia_score.health_status }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Status</p>
-                        </div>
-                    </div>
-                    <p class="text-sm text-slate-400">{{ ia_score.interpretation }}</p>
-                </div>
-            </div>
-            
-            <!-- Critical Issues -->
-            <div class="rounded-xl border border-slate-700 bg-slate-800 mb-4 overflow-hidden">
-                <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
-                    <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-exclamation-circle text-red-400"></i>
-                        Critical Issues ({{ orphan_count + dead_end_count + bottleneck_count }})
-                    </h3>
-                    <i class="fas fa-chevron-down text-slate-400 transition-transform section-icon"></i>
-                </button>
-                <div class="section-content px-5 pb-5 hidden">
-                    <div class="space-y-3">
-                        {% if orphan_count > 0 %}
-                        <div class="p-4 rounded-lg bg-red-500/10 border-l-4 border-red-500">
-                            <p class="text-sm font-medium text-slate-200"><i class="fas fa-unlink mr-2 text-red-400"></i>Orphan Pages: {{ orphan_count }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Pages with no inbound links. Add internal links to improve SEO.</p>
-                        </div>
-                        {% endif %}
-                        {% if dead_end_count > 0 %}
-                        <div class="p-4 rounded-lg bg-amber-500/10 border-l-4 border-amber-500">
-                            <p class="text-sm font-medium text-slate-200"><i class="fas fa-sign-out-alt mr-2 text-amber-400"></i>Dead-End Pages: {{ dead_end_count }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Pages with no outbound navigation. Add related links.</p>
-                        </div>
-                        {% endif %}
-                        {% if bottleneck_count > 0 %}
-                        <div class="p-4 rounded-lg bg-yellow-500/10 border-l-4 border-yellow-500">
-                            <p class="text-sm font-medium text-slate-200"><i class="fas fa-hourglass-half mr-2 text-yellow-400"></i>Navigation Bottlenecks: {{ bottleneck_count }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Pages requiring more than 3 clicks to reach.</p>
-                        </div>
-                        {% endif %}
-                        {% if orphan_count == 0 and dead_end_count == 0 and bottleneck_count == 0 %}
-                        <div class="p-4 rounded-lg bg-green-500/10 border-l-4 border-green-500">
-                            <p class="text-sm font-medium text-slate-200"><i class="fas fa-check-circle mr-2 text-green-400"></i>No Critical Issues Found!</p>
-                            <p class="text-xs text-slate-400 mt-1">Your website structure is well-organized.</p>
-                        </div>
-                        {% endif %}
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Recommendations -->
-            <div class="rounded-xl border border-slate-700 bg-slate-800 mb-4 overflow-hidden">
-                <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
-                    <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-lightbulb text-yellow-400"></i>
-                        Recommendations
-                    </h3>
-                    <i class="fas fa-chevron-down text-slate-400 transition-transform section-icon"></i>
-                </button>
-                <div class="section-content px-5 pb-5 hidden">
-                    {% if recommendations.critical %}
-                    <h4 class="text-sm font-semibold text-red-400 mb-3"><i class="fas fa-fire mr-2"></i>Critical (Do This Week)</h4>
-                    <div class="space-y-2 mb-4">
-                        {% for rec in recommendations.critical %}
-                        <div class="p-3 rounded-lg bg-slate-700/30">
-                            <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-red-500/20 text-red-400 mb-2">Critical</span>
-                            <p class="text-sm text-slate-300">{{ rec.action }}</p>
-                            <p class="text-xs text-slate-500 mt-1">Effort: {{ rec.effort_estimate }} | Impact: {{ rec.expected_impact }}</p>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% endif %}
-                    
-                    {% if recommendations.important %}
-                    <h4 class="text-sm font-semibold text-amber-400 mb-3"><i class="fas fa-exclamation-triangle mr-2"></i>Important (Do This Month)</h4>
-                    <div class="space-y-2 mb-4">
-                        {% for rec in recommendations.important %}
-                        <div class="p-3 rounded-lg bg-slate-700/30">
-                            <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-amber-500/20 text-amber-400 mb-2">Important</span>
-                            <p class="text-sm text-slate-300">{{ rec.action }}</p>
-                            <p class="text-xs text-slate-500 mt-1">Effort: {{ rec.effort_estimate }} | Difficulty: {{ rec.difficulty }}</p>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% endif %}
-                    
-                    {% if recommendations.nice_to_have %}
-                    <h4 class="text-sm font-semibold text-green-400 mb-3"><i class="fas fa-star mr-2"></i>Nice to Have (Long Term)</h4>
-                    <div class="space-y-2">
-                        {% for rec in recommendations.nice_to_have %}
-                        <div class="p-3 rounded-lg bg-slate-700/30">
-                            <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-green-500/20 text-green-400 mb-2">Enhancement</span>
-                            <p class="text-sm text-slate-300">{{ rec.action }}</p>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% endif %}
-                </div>
-            </div>
-            
-            <!-- Score Breakdown -->
-            <div class="rounded-xl border border-slate-700 bg-slate-800 overflow-hidden">
-                <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
-                    <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
-                        <i class="fas fa-chart-line text-green-400"></i>
-                        IA Score Breakdown
-                    </h3>
-                    <i class="fas fa-chevron-down text-slate-400 transition-transform section-icon"></i>
-                </button>
-                <div class="section-content px-5 pb-5 hidden">
-                    <div class="grid grid-cols-3 gap-4">
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-blue-400">{{ ia_score.breakdown.depth_score }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Depth Score</p>
-                            <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
-                                <div class="h-full bg-blue-500" style="width: {{ ia_score.breakdown.depth_score }}%"></div>
-                            </div>
-                        </div>
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-purple-400">{{ ia_score.breakdown.balance_score }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Balance Score</p>
-                            <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
-                                <div class="h-full bg-purple-500" style="width: {{ ia_score.breakdown.balance_score }}%"></div>
-                            </div>
-                        </div>
-                        <div class="p-4 rounded-lg bg-slate-700/30 text-center">
-                            <p class="text-2xl font-bold text-green-400">{{ ia_score.breakdown.connectivity_score }}</p>
-                            <p class="text-xs text-slate-400 mt-1">Connectivity Score</p>
-                            <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
-                                <div class="h-full bg-green-500" style="width: {{ ia_score.breakdown.connectivity_score }}%"></div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
+        <div class="tab-content" id="tab-audit" data-src="/tab/audit">
+            <div class="flex items-center justify-center py-12">
+                <i class="fas fa-spinner fa-spin text-3xl text-blue-400"></i>
             </div>
         </div>
         
@@ -1847,94 +1882,79 @@ SHADCN_DASHBOARD_HTML = '''
         <!-- TAB 5: DATA TABLE -->
         <!-- ============================================================ -->
         <div class="tab-content" id="tab-data">
-            <div class="rounded-xl border border-slate-700 bg-slate-800 overflow-hidden">
+            <div class="{{ CARD }} overflow-hidden">
                 <!-- Table Controls -->
                 <div class="p-4 border-b border-slate-700 flex flex-wrap gap-3 items-center bg-slate-800/50">
                     <div class="flex-1 min-w-[200px]">
                         <input type="text" id="tableSearch" placeholder="Search URLs, titles..." 
-                            class="w-full px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 placeholder-slate-400 focus:outline-none focus:border-blue-500 focus:ring-1 focus:ring-blue-500 text-sm"
-                            onkeyup="filterTable()">
+                            class="w-full px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 placeholder-slate-400 focus:outline-none focus:border-blue-500 focus:ring-1 focus:ring-blue-500 text-sm">
                     </div>
-                    <select id="depthFilter" onchange="filterTable()" class="px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm focus:outline-none focus:border-blue-500">
+                    <select id="depthFilter" class="px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm focus:outline-none focus:border-blue-500">
                         <option value="">All Depths</option>
                         {% for depth in range(stats.max_depth + 1) %}
                         <option value="{{ depth }}">Depth {{ depth }}</option>
                         {% endfor %}
                     </select>
-                    <select id="statusFilter" onchange="filterTable()" class="px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm focus:outline-none focus:border-blue-500">
+                    <select id="statusFilter" class="px-4 py-2.5 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm focus:outline-none focus:border-blue-500">
                         <option value="">All Status</option>
                         <option value="200">200 OK</option>
                         <option value="404">404 Not Found</option>
                     </select>
                     <a href="/download-data" class="inline-flex items-center gap-2 px-4 py-2.5 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm transition-colors">
-                        <i class="fas fa-download"></i> Export CSV
+                        {{ icon('download') }} Export CSV
                     </a>
                 </div>
                 
-                <!-- Table -->
-                <div class="overflow-x-auto max-h-[600px]">
+                <!-- Table (rows are rendered by the virtualizer below) -->
+                <div id="tableScroller" class="overflow-auto max-h-[600px]">
                     <table class="w-full">
                         <thead class="bg-slate-700/50 sticky top-0">
                             <tr>
                                 <th onclick="sortTable(0)" class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider cursor-pointer hover:bg-slate-700">
-                                    URL <i class="fas fa-sort ml-1 text-slate-500"></i>
+                                    URL {{ icon('sort', 'ml-1 text-slate-500') }}
                                 </th>
                                 <th onclick="sortTable(1)" class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider cursor-pointer hover:bg-slate-700">
-                                    Title <i class="fas fa-sort ml-1 text-slate-500"></i>
+                                    Title {{ icon('sort', 'ml-1 text-slate-500') }}
                                 </th>
                                 <th onclick="sortTable(2)" class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider cursor-pointer hover:bg-slate-700">
-                                    Depth <i class="fas fa-sort ml-1 text-slate-500"></i>
+                                    Depth {{ icon('sort', 'ml-1 text-slate-500') }}
                                 </th>
                                 <th onclick="sortTable(3)" class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider cursor-pointer hover:bg-slate-700">
-                                    Links <i class="fas fa-sort ml-1 text-slate-500"></i>
+                                    Links {{ icon('sort', 'ml-1 text-slate-500') }}
                                 </th>
                                 <th onclick="sortTable(4)" class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider cursor-pointer hover:bg-slate-700">
-                                    Status <i class="fas fa-sort ml-1 text-slate-500"></i>
+                                    Status {{ icon('sort', 'ml-1 text-slate-500') }}
                                 </th>
                             </tr>
                         </thead>
                         <tbody id="dataTableBody" class="divide-y divide-slate-700">
-                            {% for row in table_data %}
-                            <tr class="table-row-hover" data-depth="{{ row.depth }}" data-status="{{ row.status_code }}">
-                                <td class="px-5 py-3 text-sm">
-                                    <a href="{{ row.url }}" target="_blank" class="text-blue-400 hover:text-blue-300 truncate block max-w-xs" title="{{ row.url }}">
-                                        {{ row.url[:50] }}{% if row.url|length > 50 %}...{% endif %}
-                                    </a>
-                                </td>
-                                <td class="px-5 py-3 text-sm text-slate-300 truncate max-w-xs" title="{{ row.title }}">
-                                    {{ row.title[:40] }}{% if row.title|length > 40 %}...{% endif %}
-                                </td>
-                                <td class="px-5 py-3 text-sm">
-                                    <span class="inline-flex items-center rounded-full px-2.5 py-1 text-xs font-medium bg-blue-500/10 text-blue-400">
-                                        {{ row.depth }}
-                                    </span>
-                                </td>
-                                <td class="px-5 py-3 text-sm text-slate-300">{{ row.child_count }}</td>
-                                <td class="px-5 py-3 text-sm">
-                                    {% if row.status_code == 200 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-green-500/10 text-green-400">
-                                        <i class="fas fa-check"></i> {{ row.status_code }}
-                                    </span>
-                                    {% elif row.status_code < 400 %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-amber-500/10 text-amber-400">
-                                        {{ row.status_code }}
-                                    </span>
-                                    {% else %}
-                                    <span class="inline-flex items-center gap-1 rounded-full px-2.5 py-1 text-xs font-medium bg-red-500/10 text-red-400">
-                                        <i class="fas fa-times"></i> {{ row.status_code }}
-                                    </span>
-                                    {% endif %}
+                            <tr>
+                                <td colspan="5" class="py-12 text-center">
+                                    <i class="fas fa-spinner fa-spin text-2xl text-blue-400"></i>
                                 </td>
                             </tr>
-                            {% endfor %}
                         </tbody>
                     </table>
                 </div>
                 
-                <!-- Pagination Info -->
+                <!-- Row count -->
                 <div class="p-4 border-t border-slate-700 flex justify-between items-center text-sm text-slate-400">
-                    <span>Showing <span id="visibleCount">{{ table_data|length }}</span> of {{ stats.total_pages }} entries</span>
+                    <span>Showing <span id="filteredCount">0</span> of <span id="totalCount">{{ stats.total_pages|default(0) }}</span> entries</span>
                 </div>
+                <template id="rowTemplate">
+                    <tr class="table-row-hover">
+                        <td class="px-5 py-3 text-sm">
+                            <a target="_blank" class="text-blue-400 hover:text-blue-300 truncate block max-w-xs"></a>
+                        </td>
+                        <td class="px-5 py-3 text-sm text-slate-300 truncate max-w-xs"></td>
+                        <td class="px-5 py-3 text-sm">
+                            <span class="inline-flex items-center rounded-full px-2.5 py-1 text-xs font-medium bg-blue-500/10 text-blue-400"></span>
+                        </td>
+                        <td class="px-5 py-3 text-sm text-slate-300"></td>
+                        <td class="px-5 py-3 text-sm"></td>
+                    </tr>
+                </template>
+                <template id="statusBadgeTemplates"><span data-status-class="ok" class="status-badge status-badge-ok">{{ icon('check') }} </span><span data-status-class="redirect" class="status-badge status-badge-redirect"></span><span data-status-class="error" class="status-badge status-badge-error">{{ icon('times') }} </span></template>
             </div>
         </div>
         
@@ -1974,7 +1994,7 @@ SHADCN_DASHBOARD_HTML = '''
             <div class="grid grid-cols-1 lg:grid-cols-4 gap-6">
                 <!-- Main Mind Map -->
                 <div class="lg:col-span-3">
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+                    <div class="{{ CARD }} p-6">
                         <div class="flex items-center justify-between mb-4">
                             <h3 class="text-lg font-semibold text-slate-50 flex items-center gap-2">
                                 <i class="fas fa-sitemap text-purple-400"></i>
@@ -2021,16 +2041,16 @@ SHADCN_DASHBOARD_HTML = '''
                 <!-- Side Panel -->
                 <div class="lg:col-span-1 space-y-4">
                     <!-- Structure Summary -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-layer-group text-blue-400"></i>
                             Structure Summary
                         </h3>
                         <div class="space-y-3">
-                            {% for depth, count in stats.pages_by_depth.items() %}
+                            {% for depth, count, color in depth_summary %}
                             <div class="flex justify-between items-center py-2 border-b border-slate-700/50">
                                 <span class="text-sm text-slate-400 flex items-center gap-2">
-                                    <span class="w-3 h-3 rounded-full" style="background-color: {{ ['#3B82F6', '#10B981', '#F59E0B', '#FB923C', '#EF4444'][depth|int if depth|int < 5 else 4] }}"></span>
+                                    <span class="w-3 h-3 rounded-full" style="background-color: {{ color }}"></span>
                                     Depth {{ depth }}
                                 </span>
                                 <span class="text-sm font-semibold text-slate-200">{{ count }} pages</span>
@@ -2040,7 +2060,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Treemap -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-th-large text-amber-400"></i>
                             Content Treemap
@@ -2049,7 +2069,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Quick Stats -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-chart-pie text-green-400"></i>
                             Quick Stats
@@ -2075,7 +2095,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- View Controls Info -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-info-circle text-purple-400"></i>
                             View Controls
@@ -2134,7 +2154,7 @@ SHADCN_DASHBOARD_HTML = '''
             <!-- SEO Score Overview Cards -->
             <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4 mb-6">
                 <!-- Overall SEO Score -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6 hover:shadow-lg transition-shadow">
+                <div class="{{ CARD }} p-6 hover:shadow-lg transition-shadow">
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400">Overall SEO Score</p>
@@ -2155,7 +2175,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- Metadata Score -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6 hover:shadow-lg transition-shadow">
+                <div class="{{ CARD }} p-6 hover:shadow-lg transition-shadow">
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400">Metadata Score</p>
@@ -2169,7 +2189,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- URL Structure Score -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6 hover:shadow-lg transition-shadow">
+                <div class="{{ CARD }} p-6 hover:shadow-lg transition-shadow">
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400">URL Structure</p>
@@ -2183,7 +2203,7 @@ SHADCN_DASHBOARD_HTML = '''
                 </div>
                 
                 <!-- Internal Linking Score -->
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6 hover:shadow-lg transition-shadow">
+                <div class="{{ CARD }} p-6 hover:shadow-lg transition-shadow">
                     <div class="flex items-center justify-between">
                         <div>
                             <p class="text-sm font-medium text-slate-400">Internal Linking</p>
@@ -2202,7 +2222,7 @@ SHADCN_DASHBOARD_HTML = '''
                 <!-- Left Column: Issues & Charts -->
                 <div class="lg:col-span-2 space-y-6">
                     <!-- Score Breakdown Chart -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+                    <div class="{{ CARD }} p-6">
                         <h3 class="text-lg font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-chart-bar text-blue-400"></i>
                             SEO Score Breakdown
@@ -2211,7 +2231,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Issues Distribution Chart -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+                    <div class="{{ CARD }} p-6">
                         <h3 class="text-lg font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-exclamation-triangle text-amber-400"></i>
                             Issues Distribution
@@ -2220,7 +2240,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Critical Issues -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+                    <div class="{{ CARD }} p-6">
                         <h3 class="text-lg font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-bug text-red-400"></i>
                             Critical Issues to Fix
@@ -2257,7 +2277,7 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Issue Summary -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-list-check text-amber-400"></i>
                             Issue Summary
@@ -2291,29 +2311,46 @@ SHADCN_DASHBOARD_HTML = '''
                     </div>
                     
                     <!-- Priority Actions -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-tasks text-purple-400"></i>
                             Priority Actions
                         </h3>
                         <div id="seoPriorityActions" class="space-y-3">
+                            {% for action in seo_priority_actions %}
+                            <div class="p-3 rounded-lg border {{ action.color_class }}">
+                                <div class="flex items-center gap-2 mb-1">
+                                    <span class="text-xs font-medium px-2 py-0.5 rounded {{ action.color_class }}">{{ action.category }}</span>
+                                </div>
+                                <p class="text-sm text-slate-200">{{ action.action }}</p>
+                                <div class="flex gap-4 mt-2 text-xs text-slate-400">
+                                    <span><i class="fas fa-bolt mr-1"></i>{{ action.impact }}</span>
+                                    <span><i class="fas fa-clock mr-1"></i>{{ action.effort }}</span>
+                                </div>
+                            </div>
+                            {% else %}
                             <div class="animate-pulse flex space-x-4">
                                 <div class="flex-1 space-y-2 py-1">
                                     <div class="h-4 bg-slate-700 rounded w-full"></div>
                                     <div class="h-4 bg-slate-700 rounded w-2/3"></div>
                                 </div>
                             </div>
+                            {% endfor %}
                         </div>
                     </div>
                     
                     <!-- Top Keywords -->
-                    <div class="rounded-xl border border-slate-700 bg-slate-800 p-5">
+                    <div class="{{ CARD }} p-5">
                         <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
                             <i class="fas fa-key text-green-400"></i>
                             Top Keywords Found
                         </h3>
                         <div id="seoTopKeywords" class="flex flex-wrap gap-2">
+                            {% for keyword, count, color_class in seo_top_keywords %}
+                            <span class="px-3 py-1 rounded-full {{ color_class }} text-sm">{{ keyword }} ({{ count }})</span>
+                            {% else %}
                             <span class="px-3 py-1 rounded-full bg-slate-700 text-slate-300 text-sm">Loading...</span>
+                            {% endfor %}
                         </div>
                     </div>
                     
@@ -2321,14 +2358,14 @@ SHADCN_DASHBOARD_HTML = '''
             </div>
             
             <!-- Competitor Analysis Section -->
-            <div class="mt-6">
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+            <div class="mt-6 deferred-section">
+                <div class="{{ CARD }} p-6">
                     <div class="flex items-center justify-between mb-6">
                         <h3 class="text-lg font-semibold text-slate-50 flex items-center gap-2">
                             <i class="fas fa-chess text-amber-400"></i>
                             Competitor Analysis
                         </h3>
-                        <button onclick="toggleCompetitorForm()" class="px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm font-medium transition-colors">
+                        <button data-action="toggleCompetitorForm" class="px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm font-medium transition-colors">
                             <i class="fas fa-plus-circle mr-2"></i>Add Competitors
                         </button>
                     </div>
@@ -2344,10 +2381,10 @@ SHADCN_DASHBOARD_HTML = '''
                             The system will crawl each website and extract SEO metrics for comparison.
                         </p>
                         <div class="flex gap-2 mt-4">
-                            <button onclick="runCompetitorUrlAnalysis()" class="px-4 py-2 rounded-lg bg-green-600 hover:bg-green-700 text-white text-sm font-medium transition-colors">
+                            <button data-action="runCompetitorUrlAnalysis" class="px-4 py-2 rounded-lg bg-green-600 hover:bg-green-700 text-white text-sm font-medium transition-colors">
                                 <i class="fas fa-search mr-2"></i>Analyze Competitors
                             </button>
-                            <button onclick="toggleCompetitorForm()" class="px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+                            <button data-action="toggleCompetitorForm" class="px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
                                 Cancel
                             </button>
                         </div>
@@ -2428,8 +2465,8 @@ SHADCN_DASHBOARD_HTML = '''
             </div>
             
             <!-- Export SEO Report Section -->
-            <div class="mt-6">
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+            <div class="mt-6 deferred-section">
+                <div class="{{ CARD }} p-6">
                     <h3 class="text-lg font-semibold text-slate-50 mb-4 flex items-center gap-2">
                         <i class="fas fa-download text-blue-400"></i>
                         Export SEO Report
@@ -2448,25 +2485,25 @@ SHADCN_DASHBOARD_HTML = '''
             </div>
             
             <!-- Individual Page Scores Section -->
-            <div class="mt-6">
-                <div class="rounded-xl border border-slate-700 bg-slate-800 p-6">
+            <div class="mt-6 deferred-section">
+                <div class="{{ CARD }} p-6">
                     <div class="flex items-center justify-between mb-6">
                         <h3 class="text-lg font-semibold text-slate-50 flex items-center gap-2">
                             <i class="fas fa-th-list text-purple-400"></i>
                             Individual Page SEO Scores
                         </h3>
                         <div class="flex gap-2">
-                            <select id="seoPageScoreSort" onchange="loadPageScores()" class="px-3 py-2 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm">
+                            <select id="seoPageScoreSort" data-change-action="loadPageScores" class="px-3 py-2 rounded-lg bg-slate-700 border border-slate-600 text-slate-200 text-sm">
                                 <option value="asc">Worst First (Need Attention)</option>
                                 <option value="desc">Best First</option>
                             </select>
-                            <button onclick="loadPageScores()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+                            <button data-action="loadPageScores" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
                                 <i class="fas fa-sync-alt"></i>
                             </button>
                         </div>
                     </div>
                     
-                    <div id="seoPageScores" class="space-y-3">
+                    <div id="seoPageScores" class="overflow-y-auto max-h-[720px]">
                         <div class="animate-pulse flex space-x-4">
                             <div class="flex-1 space-y-2 py-1">
                                 <div class="h-4 bg-slate-700 rounded w-3/4"></div>
@@ -2474,12 +2511,6 @@ SHADCN_DASHBOARD_HTML = '''
                             </div>
                         </div>
                     </div>
-                    
-                    <div class="mt-4 text-center">
-                        <button onclick="loadMorePageScores()" class="px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
-                            <i class="fas fa-plus-circle mr-2"></i>Show More
-                        </button>
-                    </div>
                 </div>
             </div>
         </div>
@@ -2495,31 +2526,27 @@ SHADCN_DASHBOARD_HTML = '''
         </p>
     </footer>
     
+    <!-- Chart data and drilldown stats from the server, read with one JSON.parse -->
+    <script id="dashboardBootstrap" type="application/json">{"network": {{ network_graph_json | safe }}, "depth": {{ depth_chart_json | safe }}, "section": {{ section_chart_json | safe }}, "stats": {{ dashboard_stats | tojson }}, "traces": {{ drilldown_traces | tojson }}}</script>
+    
     <!-- JavaScript -->
     <script>
         // Chart data from server
-        const networkData = {{ network_graph_json | safe }};
-        const depthChartData = {{ depth_chart_json | safe }};
-        const sectionChartData = {{ section_chart_json | safe }};
-        const mindmapData = {{ mindmap_json | safe }};
-        const treeHierarchyData = {{ tree_hierarchy_json | safe }};
-        const treemapData = {{ treemap_json | safe }};
-        
-        // Dashboard stats for drilldown
-        const dashboardStats = {
-            total_pages: {{ stats.total_pages }},
-            avg_depth: {{ stats.avg_depth }},
-            max_depth: {{ stats.max_depth }},
-            avg_links: {{ stats.avg_links }},
-            ia_score: {{ ia_score.final_score }},
-            depth_score: {{ ia_score.breakdown.depth_score|default(70, true) }},
-            balance_score: {{ ia_score.breakdown.balance_score|default(75, true) }},
-            connectivity_score: {{ ia_score.breakdown.connectivity_score|default(80, true) }},
-            health_status: "{{ ia_score.health_status }}",
-            orphan_count: {{ orphan_count }},
-            dead_end_count: {{ dead_end_count }},
-            bottleneck_count: {{ bottleneck_count }}
-        };
+        const BOOTSTRAP = JSON.parse(document.getElementById('dashboardBootstrap').textContent);
+        const networkData = BOOTSTRAP.network;
+        const depthChartData = BOOTSTRAP.depth;
+        const sectionChartData = BOOTSTRAP.section;
+        // The Network tab draws the same graph taller; its layout is derived once, so
+        // repeat visits hand Plotly.react the same object and it has nothing to diff
+        const fullNetworkLayout = networkData ? { ...networkData.layout, height: 580 } : null;
+        const DATA_ETAG = {{ data_etag | tojson }};
+        let mindmapData = null;
+        let treeHierarchyData = null;
+        let treemapData = null;
+        
+        // Dashboard stats and prebuilt chart traces for drilldown
+        const dashboardStats = BOOTSTRAP.stats;
+        const drilldownTraces = BOOTSTRAP.traces;
         
         // Current mindmap view state
         let currentMindmapView = 'radial';
@@ -2527,24 +2554,93 @@ SHADCN_DASHBOARD_HTML = '''
         // Current date range
         let currentDateRange = 'month';
         
+        // Elements used by the date range and drilldown modals, looked up once
+        const dom = {
+            customDateModal: document.getElementById('customDateModal'),
+            customStartDate: document.getElementById('customStartDate'),
+            customEndDate: document.getElementById('customEndDate'),
+            drilldownModal: document.getElementById('drilldownModal'),
+            drilldownTitle: document.getElementById('drilldownTitle'),
+            drilldownContent: document.getElementById('drilldownContent'),
+            drilldownPagesTpl: document.getElementById('drilldownPagesTpl'),
+            dateRangeBtns: Array.from(document.querySelectorAll('.date-range-btn')),
+            tabList: document.querySelector('[role="tablist"]'),
+            // SEO tab (keyed by element id, so renderSEODashboard can look up by id)
+            seoOverallScore: document.getElementById('seoOverallScore'),
+            seoScoreBar: document.getElementById('seoScoreBar'),
+            seoGrade: document.getElementById('seoGrade'),
+            seoMetadataScore: document.getElementById('seoMetadataScore'),
+            seoUrlScore: document.getElementById('seoUrlScore'),
+            seoLinkingScore: document.getElementById('seoLinkingScore'),
+            seoMissingTitles: document.getElementById('seoMissingTitles'),
+            seoMissingDescs: document.getElementById('seoMissingDescs'),
+            seoOrphanPages: document.getElementById('seoOrphanPages'),
+            seoDeadEnds: document.getElementById('seoDeadEnds'),
+            seoDeepPages: document.getElementById('seoDeepPages'),
+            seoLongUrls: document.getElementById('seoLongUrls'),
+            seoTrafficBoost: document.getElementById('seoTrafficBoost'),
+            seoScoreChart: document.getElementById('seoScoreChart'),
+            seoIssuesChart: document.getElementById('seoIssuesChart'),
+            seoPriorityActions: document.getElementById('seoPriorityActions'),
+            seoTopKeywords: document.getElementById('seoTopKeywords'),
+            seoCriticalIssues: document.getElementById('seoCriticalIssues'),
+            seoPageScoreSort: document.getElementById('seoPageScoreSort'),
+            seoPageScores: document.getElementById('seoPageScores'),
+            // Competitor URL analysis results
+            compDefaultState: document.getElementById('compDefaultState'),
+            compSummaryCards: document.getElementById('compSummaryCards'),
+            compCharts: document.getElementById('compCharts'),
+            compAdvantages: document.getElementById('compAdvantages'),
+            compRecommendations: document.getElementById('compRecommendations'),
+            compPosition: document.getElementById('compPosition'),
+            compLeading: document.getElementById('compLeading'),
+            compCompetitive: document.getElementById('compCompetitive'),
+            compBehind: document.getElementById('compBehind'),
+            competitorRadarChart: document.getElementById('competitorRadarChart'),
+            competitorGapChart: document.getElementById('competitorGapChart'),
+            compLeadList: document.getElementById('compLeadList'),
+            compLagList: document.getElementById('compLagList'),
+            compRecList: document.getElementById('compRecList')
+        };
+        
         // =====================================================================
         // DATE RANGE FUNCTIONS
         // =====================================================================
         
+        // Date range notifications are built in idle time, off the click handler.
+        // A newer one replaces any still waiting, so quick clicks show only the last.
+        const whenIdle = window.requestIdleCallback || requestAnimationFrame;
+        const cancelIdle = window.cancelIdleCallback || cancelAnimationFrame;
+        let pendingRangeNotice = null;
+        let lastRangeTs = 0;
+        
+        function notifyWhenIdle(message, type) {
+            if (pendingRangeNotice !== null) cancelIdle(pendingRangeNotice);
+            pendingRangeNotice = whenIdle(function() {
+                pendingRangeNotice = null;
+                showNotification(message, type);
+            });
+        }
+        
         function setDateRange(range) {
+            // Ignore a repeat click on the same range within 50ms
+            const now = Date.now();
+            if (range === currentDateRange && now - lastRangeTs < 50) return;
+            lastRangeTs = now;
+            
             currentDateRange = range;
             
             // Update button states
-            document.querySelectorAll('.date-range-btn').forEach(function(btn) {
-                if (btn.dataset.range === range) {
-                    btn.className = 'date-range-btn px-3 py-1.5 rounded-lg text-xs font-medium bg-blue-600 text-white transition-colors';
-                } else {
-                    btn.className = 'date-range-btn px-3 py-1.5 rounded-lg text-xs font-medium bg-slate-700 text-slate-300 hover:bg-slate-600 transition-colors';
-                }
+            dom.dateRangeBtns.forEach(function(btn) {
+                const active = btn.dataset.range === range;
+                btn.classList.toggle('bg-blue-600', active);
+                btn.classList.toggle('text-white', active);
+                btn.classList.toggle('bg-slate-700', !active);
+                btn.classList.toggle('text-slate-300', !active);
+                btn.classList.toggle('hover:bg-slate-600', !active);
             });
             
-            // Show notification
-            showNotification('Date range updated to: ' + getDateRangeLabel(range), 'info');
+            notifyWhenIdle('Date range updated to: ' + getDateRangeLabel(range), 'info');
             
             // In a real app, this would fetch filtered data from the server
             console.log('Date range set to:', range);
@@ -2560,24 +2656,37 @@ SHADCN_DASHBOARD_HTML = '''
             return labels[range] || range;
         }
         
+        // Default custom range (today and 30 days back), recomputed once per day
+        const MS_PER_DAY = 86400000;
+        let defaultRangeCache = null;
+        function defaultCustomRange() {
+            const now = Date.now();
+            const day = Math.floor(now / MS_PER_DAY);
+            if (defaultRangeCache && defaultRangeCache.day === day) return defaultRangeCache;
+            defaultRangeCache = {
+                day: day,
+                end: new Date(now).toISOString().slice(0, 10),
+                start: new Date(now - 30 * MS_PER_DAY).toISOString().slice(0, 10)
+            };
+            return defaultRangeCache;
+        }
+        
         function openCustomDatePicker() {
-            document.getElementById('customDateModal').classList.remove('hidden');
+            dom.customDateModal.classList.remove('hidden');
             
             // Set default dates
-            const today = new Date();
-            const thirtyDaysAgo = new Date(today.getTime() - 30 * 24 * 60 * 60 * 1000);
-            
-            document.getElementById('customEndDate').value = today.toISOString().split('T')[0];
-            document.getElementById('customStartDate').value = thirtyDaysAgo.toISOString().split('T')[0];
+            const range = defaultCustomRange();
+            dom.customEndDate.value = range.end;
+            dom.customStartDate.value = range.start;
         }
         
         function closeCustomDatePicker() {
-            document.getElementById('customDateModal').classList.add('hidden');
+            dom.customDateModal.classList.add('hidden');
         }
         
         function applyCustomDateRange() {
-            const startDate = document.getElementById('customStartDate').value;
-            const endDate = document.getElementById('customEndDate').value;
+            const startDate = dom.customStartDate.value;
+            const endDate = dom.customEndDate.value;
             
             if (!startDate || !endDate) {
                 showNotification('Please select both start and end dates', 'error');
@@ -2589,580 +2698,654 @@ SHADCN_DASHBOARD_HTML = '''
                 return;
             }
             
-            currentDateRange = 'custom';
             setDateRange('custom');
             closeCustomDatePicker();
             
-            showNotification('Custom date range applied: ' + startDate + ' to ' + endDate, 'success');
+            notifyWhenIdle('Custom date range applied: ' + startDate + ' to ' + endDate, 'success');
         }
         
         // =====================================================================
         // DRILLDOWN MODAL FUNCTIONS
         // =====================================================================
         
+        // Rendered drilldowns are kept per metric and date range, so reopening one
+        // reattaches its nodes (charts included) instead of rebuilding them
+        const drilldownCache = new Map();
+        let drilldownKey = null;
+        
+        // Title and renderer for each drilldown metric. The renderers are
+        // function declarations further down, so they are hoisted.
+        const DRILLDOWNS = {
+            total_pages: { icon: 'fa-globe text-blue-400', label: 'Total Pages - Deep Dive Analysis', render: renderTotalPagesDrilldown },
+            ia_score: { icon: 'fa-star text-green-400', label: 'Architecture Score - Deep Dive Analysis', render: renderIAScoreDrilldown },
+            avg_depth: { icon: 'fa-layer-group text-amber-400', label: 'Average Depth - Deep Dive Analysis', render: renderDepthDrilldown },
+            health_status: { icon: 'fa-heartbeat text-purple-400', label: 'Health Status - Deep Dive Analysis', render: renderHealthDrilldown }
+        };
+        
         function openDrilldownModal(metricType) {
-            const modal = document.getElementById('drilldownModal');
-            const title = document.getElementById('drilldownTitle');
-            const content = document.getElementById('drilldownContent');
-            
-            modal.classList.remove('hidden');
-            document.body.style.overflow = 'hidden';
+            const drilldown = DRILLDOWNS[metricType];
+            if (!drilldown) return;
+            const content = dom.drilldownContent;
+            
+            dom.drilldownTitle.innerHTML = '<i class="fas ' + drilldown.icon + '"></i><span>' + drilldown.label + '</span>';
+            dom.drilldownModal.classList.remove('hidden');
+            document.body.classList.add('modal-open');
+            
+            drilldownKey = metricType + '|' + currentDateRange;
+            const cached = drilldownCache.get(drilldownKey);
+            if (cached) {
+                content.replaceChildren(...cached);
+                return;
+            }
             
             // Show loading
             content.innerHTML = '<div class="flex items-center justify-center py-12"><i class="fas fa-spinner fa-spin text-3xl text-blue-400"></i><p class="text-slate-400 ml-3">Loading analysis...</p></div>';
             
-            // Update title and content based on metric type
-            switch(metricType) {
-                case 'total_pages':
-                    title.innerHTML = '<i class="fas fa-globe text-blue-400"></i><span>Total Pages - Deep Dive Analysis</span>';
-                    setTimeout(function() { renderTotalPagesDrilldown(); }, 300);
-                    break;
-                case 'ia_score':
-                    title.innerHTML = '<i class="fas fa-star text-green-400"></i><span>Architecture Score - Deep Dive Analysis</span>';
-                    setTimeout(function() { renderIAScoreDrilldown(); }, 300);
-                    break;
-                case 'avg_depth':
-                    title.innerHTML = '<i class="fas fa-layer-group text-amber-400"></i><span>Average Depth - Deep Dive Analysis</span>';
-                    setTimeout(function() { renderDepthDrilldown(); }, 300);
-                    break;
-                case 'health_status':
-                    title.innerHTML = '<i class="fas fa-heartbeat text-purple-400"></i><span>Health Status - Deep Dive Analysis</span>';
-                    setTimeout(function() { renderHealthDrilldown(); }, 300);
-                    break;
-            }
+            // The modal has no open transition, so render right after the
+            // frame that paints it with the loading state
+            const key = drilldownKey;
+            requestAnimationFrame(function() {
+                requestAnimationFrame(function() {
+                    if (key === drilldownKey) drilldown.render();
+                });
+            });
         }
         
         function closeDrilldownModal() {
-            document.getElementById('drilldownModal').classList.add('hidden');
-            document.body.style.overflow = '';
+            dom.drilldownModal.classList.add('hidden');
+            document.body.classList.remove('modal-open');
         }
         
-        function renderTotalPagesDrilldown() {
-            const content = document.getElementById('drilldownContent');
-            
-            // Generate historical data
-            const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-            const currentMonth = new Date().getMonth();
-            const basePages = dashboardStats.total_pages;
-            const historicalData = months.map(function(m, i) {
-                return Math.round(basePages * (0.7 + (i * 0.025) + Math.random() * 0.05));
+        // Number formatters shared by the drilldown renderers
+        const wholeNumber = new Intl.NumberFormat('en', { maximumFractionDigits: 0 });
+        const oneDecimal = new Intl.NumberFormat('en', { maximumFractionDigits: 1 });
+        const signedOneDecimal = new Intl.NumberFormat('en', {
+            minimumFractionDigits: 1,
+            maximumFractionDigits: 1,
+            signDisplay: 'always'
+        });
+        
+        // Drilldown chart layouts, built once on a frozen dark base. Plotly keeps and
+        // mutates the layout it is given (zoom writes axis ranges into it), so each
+        // plot gets a structuredClone copy, never these objects.
+        const DARK_LAYOUT = Object.freeze({
+            paper_bgcolor: 'transparent',
+            plot_bgcolor: 'transparent',
+            font: Object.freeze({ color: '#94A3B8' }),
+            xaxis: Object.freeze({ gridcolor: '#334155' }),
+            yaxis: Object.freeze({ gridcolor: '#334155' })
+        });
+        const PAGES_TREND_LAYOUT = {
+            ...DARK_LAYOUT,
+            margin: { t: 30, r: 20, b: 40, l: 50 },
+            yaxis: { ...DARK_LAYOUT.yaxis, title: 'Pages' },
+            legend: { orientation: 'h', y: 1.1, font: { size: 10 } },
+            showlegend: true
+        };
+        const SCORE_TREND_LAYOUT = {
+            ...DARK_LAYOUT,
+            margin: { t: 10, r: 20, b: 40, l: 50 },
+            yaxis: { ...DARK_LAYOUT.yaxis, range: [0, 100], title: 'Score' },
+            // Target score of 85, drawn as a shape rather than a second trace
+            shapes: [{
+                type: 'line',
+                xref: 'paper', x0: 0, x1: 1,
+                yref: 'y', y0: 85, y1: 85,
+                line: { color: '#F59E0B', width: 2, dash: 'dash' }
+            }],
+            showlegend: false
+        };
+        
+        // Chart divs from earlier drilldown renders, by id. A rebuild (after the
+        // date range changes) moves the old div into the new markup, so drawChart
+        // diffs into it with Plotly.react instead of plotting from scratch.
+        const drilldownChartEls = new Map();
+        
+        function reuseDrilldownCharts(fragment) {
+            fragment.querySelectorAll('[id^="drilldown"][id$="Chart"]').forEach(function(el) {
+                const previous = drilldownChartEls.get(el.id);
+                if (previous) {
+                    el.replaceWith(previous);
+                } else {
+                    drilldownChartEls.set(el.id, el);
+                }
             });
-            
-            const lastMonthPages = historicalData[Math.max(0, currentMonth - 1)];
-            const thisMonthPages = historicalData[currentMonth];
-            const pagesAdded = Math.max(0, Math.round((thisMonthPages - lastMonthPages) * 0.8));
-            const pagesRemoved = Math.round(Math.random() * 3);
-            
-            const growthRate = ((historicalData[11] - historicalData[0]) / historicalData[0] * 100).toFixed(1);
-            const avgMonthlyGrowth = (historicalData[11] - historicalData[0]) / 12;
-            const projectedNextMonth = Math.round(basePages + avgMonthlyGrowth);
-            const projectedEndOfYear = Math.round(basePages + avgMonthlyGrowth * (12 - currentMonth));
-            
-            content.innerHTML = '' +
-                // Summary Cards
-                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-slate-600/30">' +
-                        '<p class="text-xs text-slate-400">Current Total</p>' +
-                        '<p class="text-2xl font-bold text-blue-400">' + basePages + '</p>' +
-                        '<p class="text-xs text-slate-500">pages</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-green-600/30">' +
-                        '<p class="text-xs text-slate-400">YoY Growth</p>' +
-                        '<p class="text-2xl font-bold text-green-400">+' + growthRate + '%</p>' +
-                        '<p class="text-xs text-slate-500">vs last year</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-amber-600/30">' +
-                        '<p class="text-xs text-slate-400">Monthly Avg</p>' +
-                        '<p class="text-2xl font-bold text-amber-400">+' + Math.round(avgMonthlyGrowth) + '</p>' +
-                        '<p class="text-xs text-slate-500">pages/month</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-purple-600/30">' +
-                        '<p class="text-xs text-slate-400">EOY Projected</p>' +
-                        '<p class="text-2xl font-bold text-purple-400">' + projectedEndOfYear + '</p>' +
-                        '<p class="text-xs text-slate-500">end of year</p>' +
-                    '</div>' +
-                '</div>' +
-                
-                // Monthly Comparison
-                '<div class="mb-6 p-4 rounded-xl bg-slate-700/20 border border-slate-600/30">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-calendar-alt text-cyan-400"></i>Monthly Comparison' +
-                    '</h4>' +
-                    '<div class="grid grid-cols-2 md:grid-cols-4 gap-4">' +
-                        '<div class="text-center p-3 rounded-lg bg-slate-800">' +
-                            '<p class="text-xs text-slate-400">Last Month</p>' +
-                            '<p class="text-xl font-bold text-slate-300">' + lastMonthPages + '</p>' +
-                        '</div>' +
-                        '<div class="text-center p-3 rounded-lg bg-slate-800">' +
-                            '<p class="text-xs text-slate-400">This Month</p>' +
-                            '<p class="text-xl font-bold text-blue-400">' + thisMonthPages + '</p>' +
-                        '</div>' +
-                        '<div class="text-center p-3 rounded-lg bg-green-900/30">' +
-                            '<p class="text-xs text-slate-400">Pages Added</p>' +
-                            '<p class="text-xl font-bold text-green-400">+' + pagesAdded + '</p>' +
-                        '</div>' +
-                        '<div class="text-center p-3 rounded-lg bg-red-900/30">' +
-                            '<p class="text-xs text-slate-400">Pages Removed</p>' +
-                            '<p class="text-xl font-bold text-red-400">-' + pagesRemoved + '</p>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>' +
-                
-                // 12-Month Trend Chart
-                '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-chart-line text-blue-400"></i>12-Month Historical Trend' +
-                    '</h4>' +
-                    '<div id="drilldownTrendChart" style="height: 250px;"></div>' +
-                '</div>' +
-                
-                // Two Column Layout
-                '<div class="grid grid-cols-1 md:grid-cols-2 gap-6">' +
-                    // Pages by Section
-                    '<div>' +
-                        '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                            '<i class="fas fa-folder-tree text-amber-400"></i>Pages by Section' +
-                        '</h4>' +
-                        '<div id="drilldownSectionChart" style="height: 200px;"></div>' +
-                    '</div>' +
-                    
-                    // Contributing Factors
-                    '<div>' +
-                        '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                            '<i class="fas fa-lightbulb text-green-400"></i>Contributing Factors (What Changed)' +
-                        '</h4>' +
-                        '<div class="space-y-2">' +
-                            '<div class="p-3 rounded-lg bg-green-900/20 border border-green-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-green-400 font-medium"><i class="fas fa-plus-circle mr-2"></i>New Content Added</p>' +
-                                    '<span class="text-xs bg-green-600/30 text-green-400 px-2 py-0.5 rounded">+' + pagesAdded + '</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">News and Events sections expanded</p>' +
-                            '</div>' +
-                            '<div class="p-3 rounded-lg bg-blue-900/20 border border-blue-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-blue-400 font-medium"><i class="fas fa-sitemap mr-2"></i>Structure Improved</p>' +
-                                    '<span class="text-xs bg-blue-600/30 text-blue-400 px-2 py-0.5 rounded">Better</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Navigation restructured for better UX</p>' +
-                            '</div>' +
-                            '<div class="p-3 rounded-lg bg-red-900/20 border border-red-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-red-400 font-medium"><i class="fas fa-archive mr-2"></i>Pages Archived</p>' +
-                                    '<span class="text-xs bg-red-600/30 text-red-400 px-2 py-0.5 rounded">-' + pagesRemoved + '</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Old content moved to archive</p>' +
-                            '</div>' +
-                            '<div class="p-3 rounded-lg bg-amber-900/20 border border-amber-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-amber-400 font-medium"><i class="fas fa-chart-line mr-2"></i>Growth Rate</p>' +
-                                    '<span class="text-xs bg-amber-600/30 text-amber-400 px-2 py-0.5 rounded">' + growthRate + '%</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Consistent growth over 12 months</p>' +
-                            '</div>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
-            
-            // Generate last year data for comparison
-            const lastYearData = historicalData.map(function(val) {
-                return Math.round(val * (0.75 + Math.random() * 0.1));
+        }
+        
+        const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+        
+        // Class strings repeated across the drilldown markup
+        const DD_CARD = '<div class="p-4 rounded-lg bg-slate-700/30 border border-';
+        const DD_LABEL = '<p class="text-xs text-slate-400">';
+        const DD_CAPTION = '<p class="text-xs text-slate-500">';
+        const DD_HEADING = '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">';
+        const DD_CHECK_ROW = '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30" data-check>';
+        
+        // Static recommendation cards for the IA score drilldown; {orphans} is filled in per render
+        const IA_RECOMMENDATIONS_HTML = [
+            '<div class="space-y-3">',
+                '<div class="p-3 rounded-lg bg-green-900/20 border border-green-600/30">',
+                    '<div class="flex items-center justify-between">',
+                        '<p class="text-sm text-green-400 font-medium">Fix Orphan Pages</p>',
+                        '<span class="text-xs bg-green-600/30 text-green-400 px-2 py-0.5 rounded">+8 pts</span>',
+                    '</div>',
+                    '<p class="text-xs text-slate-400 mt-1">Link {orphans} orphan pages to improve connectivity</p>',
+                '</div>',
+                '<div class="p-3 rounded-lg bg-blue-900/20 border border-blue-600/30">',
+                    '<div class="flex items-center justify-between">',
+                        '<p class="text-sm text-blue-400 font-medium">Reduce Deep Pages</p>',
+                        '<span class="text-xs bg-blue-600/30 text-blue-400 px-2 py-0.5 rounded">+5 pts</span>',
+                    '</div>',
+                    '<p class="text-xs text-slate-400 mt-1">Reorganize pages beyond depth 4 to improve navigation</p>',
+                '</div>',
+                '<div class="p-3 rounded-lg bg-amber-900/20 border border-amber-600/30">',
+                    '<div class="flex items-center justify-between">',
+                        '<p class="text-sm text-amber-400 font-medium">Balance Content</p>',
+                        '<span class="text-xs bg-amber-600/30 text-amber-400 px-2 py-0.5 rounded">+3 pts</span>',
+                    '</div>',
+                    '<p class="text-xs text-slate-400 mt-1">Distribute content more evenly across sections</p>',
+                '</div>',
+            '</div>'
+        ].join('');
+        
+        // Static recommendation lists for the depth drilldown; {maxDepth} is filled in per render
+        const DEPTH_RECOMMENDATIONS_HTML = [
+            '<div class="grid grid-cols-1 md:grid-cols-2 gap-4">',
+                '<div class="p-4 rounded-lg bg-green-900/20 border border-green-600/30">',
+                    '<p class="text-sm text-green-400 font-medium mb-2"><i class="fas fa-check-circle mr-2"></i>What is Working</p>',
+                    '<ul class="text-xs text-slate-400 space-y-1">',
+                        '<li>• Most content within 3 clicks</li>',
+                        '<li>• Clear navigation hierarchy</li>',
+                        '<li>• Good homepage connectivity</li>',
+                    '</ul>',
+                '</div>',
+                '<div class="p-4 rounded-lg bg-amber-900/20 border border-amber-600/30">',
+                    '<p class="text-sm text-amber-400 font-medium mb-2"><i class="fas fa-exclamation-triangle mr-2"></i>Needs Improvement</p>',
+                    '<ul class="text-xs text-slate-400 space-y-1">',
+                        '<li>• Some pages at depth {maxDepth} - consider moving up</li>',
+                        '<li>• Add breadcrumb navigation</li>',
+                        '<li>• Consider shortcut links for deep content</li>',
+                    '</ul>',
+                '</div>',
+            '</div>'
+        ].join('');
+        
+        // IA score components, ordered once by the size of their change
+        const COMPONENT_CHANGES = [
+            { key: 'depth', name: 'Depth Score', change: 3.2 },
+            { key: 'balance', name: 'Balance Score', change: 1.8 },
+            { key: 'connectivity', name: 'Connectivity', change: 5.1 }
+        ].sort(function(a, b) { return Math.abs(b.change) - Math.abs(a.change); });
+        
+        // Mock 12-month IA score history. It is random, so it is kept per score:
+        // reopening the drilldown shows the same trend and redraws nothing.
+        let scoreHistoryCache = { score: null, history: null };
+        function mockScoreHistory(iaScore) {
+            if (scoreHistoryCache.score !== iaScore) {
+                scoreHistoryCache = {
+                    score: iaScore,
+                    history: MONTHS.map(function(m, i) {
+                        return Math.min(100, Math.max(0, iaScore - 15 + (i * 1.5) + Math.random() * 5));
+                    })
+                };
+            }
+            return scoreHistoryCache.history;
+        }
+        
+        // Health drilldown gauge: a half-circle arc drawn as inline SVG. Every arc
+        // shares one path with pathLength 100, so dash lengths are score points.
+        const GAUGE_ARC = 'M 20 100 A 80 80 0 0 1 180 100';
+        const GAUGE_BANDS = [
+            { from: 0, to: 50, color: 'rgba(239, 68, 68, 0.1)' },
+            { from: 50, to: 75, color: 'rgba(245, 158, 11, 0.1)' },
+            { from: 75, to: 100, color: 'rgba(16, 185, 129, 0.1)' }
+        ];
+        
+        function healthGaugeSvg(score) {
+            const color = score >= 75 ? '#10B981' : score >= 50 ? '#F59E0B' : '#EF4444';
+            const parts = ['<svg viewBox="0 0 200 120" class="h-full mx-auto" role="img" aria-label="Architecture score ', score, ' out of 100">'];
+            parts.push('<path d="', GAUGE_ARC, '" fill="none" stroke="#1E293B" stroke-width="18" pathLength="100"/>');
+            GAUGE_BANDS.forEach(function(band) {
+                parts.push('<path d="', GAUGE_ARC, '" fill="none" stroke="', band.color, '" stroke-width="18" pathLength="100" stroke-dasharray="0 ', band.from, ' ', band.to - band.from, ' 100"/>');
+            });
+            parts.push(
+                '<path d="', GAUGE_ARC, '" fill="none" stroke="', color, '" stroke-width="10" pathLength="100" stroke-dasharray="', Math.max(0, Math.min(100, score)), ' 100"/>',
+                '<text x="100" y="96" text-anchor="middle" fill="#E2E8F0" font-size="28" font-weight="600">', wholeNumber.format(score), '<tspan font-size="14" fill="#94A3B8">/100</tspan></text>',
+                '</svg>'
+            );
+            return parts.join('');
+        }
+        
+        // Parsed drilldown markup by metric. A rebuild that produces the same HTML
+        // (the figures rarely change between date ranges) clones it instead of
+        // parsing the string again.
+        const drilldownTemplates = new Map();
+        
+        function drilldownFragment(metric, html) {
+            let cached = drilldownTemplates.get(metric);
+            if (!cached || cached.html !== html) {
+                const template = document.createElement('template');
+                template.innerHTML = html;
+                cached = { html: html, template: template };
+                drilldownTemplates.set(metric, cached);
+            }
+            return cached.template.content.cloneNode(true);
+        }
+        
+        // Swap in a drilldown's markup (an HTML string or a cloned fragment) during
+        // one frame, then draw its charts (if it has any) in the next
+        function showDrilldownContent(content, markup, drawCharts) {
+            const key = drilldownKey;
+            requestAnimationFrame(function() {
+                // Another drilldown may have been opened before this frame
+                if (key !== drilldownKey) return;
+                const fragment = typeof markup === 'string' ? drilldownFragment(key.split('|')[0], markup) : markup;
+                reuseDrilldownCharts(fragment);
+                content.replaceChildren(fragment);
+                if (!drawCharts) {
+                    drilldownCache.set(key, Array.from(content.childNodes));
+                    return;
+                }
+                requestAnimationFrame(function() {
+                    loadPlotly().then(function() {
+                        // Another drilldown may have replaced this one while Plotly loaded
+                        if (key !== drilldownKey) return;
+                        drawCharts();
+                        drilldownCache.set(key, Array.from(content.childNodes));
+                    });
+                });
             });
+        }
+        
+        function renderTotalPagesDrilldown() {
+            const content = dom.drilldownContent;
+            
+            // Trend traces and projections are precomputed by the server, which
+            // also fills the projections into the drilldownPagesTpl markup
+            const markup = dom.drilldownPagesTpl.content.cloneNode(true);
             
             // Render trend chart with comparison
-            setTimeout(function() {
-                Plotly.newPlot('drilldownTrendChart', [
-                    {
-                        x: months,
-                        y: historicalData,
-                        type: 'scatter',
-                        mode: 'lines+markers',
-                        name: 'This Year',
-                        line: { color: '#3B82F6', width: 3 },
-                        marker: { color: '#3B82F6', size: 8 },
-                        fill: 'tozeroy',
-                        fillcolor: 'rgba(59, 130, 246, 0.1)'
-                    },
-                    {
-                        x: months,
-                        y: lastYearData,
-                        type: 'scatter',
-                        mode: 'lines+markers',
-                        name: 'Last Year',
-                        line: { color: '#64748B', width: 2, dash: 'dot' },
-                        marker: { color: '#64748B', size: 6 }
-                    }
-                ], {
-                    paper_bgcolor: 'transparent',
-                    plot_bgcolor: 'transparent',
-                    font: { color: '#94A3B8' },
-                    margin: { t: 30, r: 20, b: 40, l: 50 },
-                    xaxis: { gridcolor: '#334155' },
-                    yaxis: { gridcolor: '#334155', title: 'Pages' },
-                    legend: { 
-                        orientation: 'h', 
-                        y: 1.1,
-                        font: { size: 10 }
-                    },
-                    showlegend: true
-                }, { responsive: true });
+            showDrilldownContent(content, markup, function() {
+                drawChart('drilldownTrendChart', structuredClone(drilldownTraces.total_pages), structuredClone(PAGES_TREND_LAYOUT), { responsive: true, displayModeBar: false });
                 
                 // Section chart
                 if (sectionChartData && sectionChartData.data) {
-                    Plotly.newPlot('drilldownSectionChart', sectionChartData.data, {
+                    drawChart('drilldownSectionChart', sectionChartData.data, {
                         ...sectionChartData.layout,
                         height: 200,
                         margin: { t: 10, r: 10, b: 10, l: 10 }
-                    }, { responsive: true });
+                    }, { responsive: true, staticPlot: true });
                 }
-            }, 100);
+            });
         }
         
         function renderIAScoreDrilldown() {
-            const content = document.getElementById('drilldownContent');
-            const iaScore = dashboardStats.ia_score;
-            const depthScore = dashboardStats.depth_score;
-            const balanceScore = dashboardStats.balance_score;
-            const connectivityScore = dashboardStats.connectivity_score;
-            
-            // Generate mock historical IA scores
-            const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-            const historicalScores = months.map(function(m, i) {
-                return Math.min(100, Math.max(0, iaScore - 15 + (i * 1.5) + Math.random() * 5));
+            const content = dom.drilldownContent;
+            const {
+                ia_score: iaScore,
+                depth_score: depthScore,
+                balance_score: balanceScore,
+                connectivity_score: connectivityScore,
+                health_status: healthStatus,
+                orphan_count: orphanCount
+            } = dashboardStats;
+            
+            const historicalScores = mockScoreHistory(iaScore);
+            
+            const yoyChange = historicalScores[11] - historicalScores[0];
+            const monthlyChange = historicalScores[11] - historicalScores[10];
+            
+            const currentScores = { depth: depthScore, balance: balanceScore, connectivity: connectivityScore };
+            
+            const yoyColor = yoyChange >= 0 ? 'text-green-400' : 'text-red-400';
+            const monthlyColor = monthlyChange >= 0 ? 'text-green-400' : 'text-red-400';
+            const gapToTarget = oneDecimal.format(Math.max(0, 85 - iaScore));
+            
+            const parts = [];
+            // Summary Cards
+            parts.push(
+                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">',
+                    DD_CARD, 'green-600/30">',
+                        DD_LABEL, 'Current Score</p>',
+                        '<p class="text-2xl font-bold text-green-400">', iaScore, '/100</p>',
+                        DD_CAPTION, healthStatus, '</p>',
+                    '</div>',
+                    DD_CARD, 'blue-600/30">',
+                        DD_LABEL, 'YoY Change</p>',
+                        '<p class="text-2xl font-bold ', yoyColor, '">', signedOneDecimal.format(yoyChange), '</p>',
+                        DD_CAPTION, 'points</p>',
+                    '</div>',
+                    DD_CARD, 'cyan-600/30">',
+                        DD_LABEL, 'Monthly Change</p>',
+                        '<p class="text-2xl font-bold ', monthlyColor, '">', signedOneDecimal.format(monthlyChange), '</p>',
+                        DD_CAPTION, 'vs last month</p>',
+                    '</div>',
+                    DD_CARD, 'purple-600/30">',
+                        DD_LABEL, 'Gap to Target (85)</p>',
+                        '<p class="text-2xl font-bold text-purple-400">', gapToTarget, '</p>',
+                        DD_CAPTION, 'points needed</p>',
+                    '</div>',
+                '</div>'
+            );
+            
+            // What Changed Most Section
+            parts.push(
+                '<div class="mb-6 p-4 rounded-xl bg-gradient-to-r from-blue-900/20 to-purple-900/20 border border-blue-600/30">',
+                    '<h4 class="text-base font-semibold text-slate-50 mb-3 flex items-center gap-2">',
+                        '<i class="fas fa-bolt text-yellow-400"></i>What Changed Most',
+                    '</h4>',
+                    '<div class="grid grid-cols-1 md:grid-cols-3 gap-4">'
+            );
+            COMPONENT_CHANGES.forEach(function(comp, idx) {
+                const color = idx === 0 ? 'green' : idx === 1 ? 'blue' : 'amber';
+                parts.push(
+                    '<div class="p-3 rounded-lg bg-slate-800/50">',
+                        '<div class="flex items-center justify-between mb-1">',
+                            '<span class="text-sm text-slate-300">', comp.name, '</span>',
+                            '<span class="text-xs px-2 py-0.5 rounded bg-', color, '-600/30 text-', color, '-400">', signedOneDecimal.format(comp.change), '</span>',
+                        '</div>',
+                        DD_CAPTION, 'Current: ', wholeNumber.format(currentScores[comp.key]), '/100</p>',
+                    '</div>'
+                );
             });
-            
-            const yoyChange = (historicalScores[11] - historicalScores[0]).toFixed(1);
-            const monthlyChange = ((historicalScores[11] - historicalScores[10])).toFixed(1);
-            
-            // Calculate which component changed most
-            const componentChanges = [
-                { name: 'Depth Score', change: 3.2, current: depthScore },
-                { name: 'Balance Score', change: 1.8, current: balanceScore },
-                { name: 'Connectivity', change: 5.1, current: connectivityScore }
-            ].sort(function(a, b) { return Math.abs(b.change) - Math.abs(a.change); });
-            
-            content.innerHTML = '' +
-                // Summary Cards
-                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-green-600/30">' +
-                        '<p class="text-xs text-slate-400">Current Score</p>' +
-                        '<p class="text-2xl font-bold text-green-400">' + iaScore + '/100</p>' +
-                        '<p class="text-xs text-slate-500">' + dashboardStats.health_status + '</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-blue-600/30">' +
-                        '<p class="text-xs text-slate-400">YoY Change</p>' +
-                        '<p class="text-2xl font-bold ' + (yoyChange >= 0 ? 'text-green-400' : 'text-red-400') + '">' + (yoyChange >= 0 ? '+' : '') + yoyChange + '</p>' +
-                        '<p class="text-xs text-slate-500">points</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-cyan-600/30">' +
-                        '<p class="text-xs text-slate-400">Monthly Change</p>' +
-                        '<p class="text-2xl font-bold ' + (monthlyChange >= 0 ? 'text-green-400' : 'text-red-400') + '">' + (monthlyChange >= 0 ? '+' : '') + monthlyChange + '</p>' +
-                        '<p class="text-xs text-slate-500">vs last month</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-purple-600/30">' +
-                        '<p class="text-xs text-slate-400">Gap to Target (85)</p>' +
-                        '<p class="text-2xl font-bold text-purple-400">' + Math.max(0, 85 - iaScore) + '</p>' +
-                        '<p class="text-xs text-slate-500">points needed</p>' +
-                    '</div>' +
-                '</div>' +
-                
-                // What Changed Most Section
-                '<div class="mb-6 p-4 rounded-xl bg-gradient-to-r from-blue-900/20 to-purple-900/20 border border-blue-600/30">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-3 flex items-center gap-2">' +
-                        '<i class="fas fa-bolt text-yellow-400"></i>What Changed Most' +
-                    '</h4>' +
-                    '<div class="grid grid-cols-1 md:grid-cols-3 gap-4">' +
-                        componentChanges.map(function(comp, idx) {
-                            const color = idx === 0 ? 'green' : idx === 1 ? 'blue' : 'amber';
-                            return '<div class="p-3 rounded-lg bg-slate-800/50">' +
-                                '<div class="flex items-center justify-between mb-1">' +
-                                    '<span class="text-sm text-slate-300">' + comp.name + '</span>' +
-                                    '<span class="text-xs px-2 py-0.5 rounded bg-' + color + '-600/30 text-' + color + '-400">' + 
-                                        (comp.change >= 0 ? '+' : '') + comp.change.toFixed(1) + 
-                                    '</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-500">Current: ' + comp.current.toFixed(0) + '/100</p>' +
-                            '</div>';
-                        }).join('') +
-                    '</div>' +
-                '</div>' +
-                
-                // Component Scores Breakdown
-                '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-chart-bar text-blue-400"></i>Component Scores Breakdown' +
-                    '</h4>' +
-                    '<div class="grid grid-cols-3 gap-4">' +
-                        '<div class="p-4 rounded-lg bg-slate-700/30">' +
-                            '<div class="flex items-center justify-between mb-2">' +
-                                '<span class="text-sm text-slate-400">Depth Score</span>' +
-                                '<span class="text-lg font-bold text-blue-400">' + depthScore.toFixed(0) + '</span>' +
-                            '</div>' +
-                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">' +
-                                '<div class="h-full bg-blue-500" style="width: ' + depthScore + '%"></div>' +
-                            '</div>' +
-                        '</div>' +
-                        '<div class="p-4 rounded-lg bg-slate-700/30">' +
-                            '<div class="flex items-center justify-between mb-2">' +
-                                '<span class="text-sm text-slate-400">Balance Score</span>' +
-                                '<span class="text-lg font-bold text-amber-400">' + balanceScore.toFixed(0) + '</span>' +
-                            '</div>' +
-                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">' +
-                                '<div class="h-full bg-amber-500" style="width: ' + balanceScore + '%"></div>' +
-                            '</div>' +
-                        '</div>' +
-                        '<div class="p-4 rounded-lg bg-slate-700/30">' +
-                            '<div class="flex items-center justify-between mb-2">' +
-                                '<span class="text-sm text-slate-400">Connectivity</span>' +
-                                '<span class="text-lg font-bold text-green-400">' + connectivityScore.toFixed(0) + '</span>' +
-                            '</div>' +
-                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">' +
-                                '<div class="h-full bg-green-500" style="width: ' + connectivityScore + '%"></div>' +
-                            '</div>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>' +
-                '<div class="grid grid-cols-1 md:grid-cols-2 gap-6">' +
-                    '<div>' +
-                        '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                            '<i class="fas fa-chart-line text-green-400"></i>Score Trend (12 Months)' +
-                        '</h4>' +
-                        '<div id="drilldownScoreTrendChart" style="height: 200px;"></div>' +
-                    '</div>' +
-                    '<div>' +
-                        '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                            '<i class="fas fa-rocket text-purple-400"></i>Recommendations to Improve' +
-                        '</h4>' +
-                        '<div class="space-y-3">' +
-                            '<div class="p-3 rounded-lg bg-green-900/20 border border-green-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-green-400 font-medium">Fix Orphan Pages</p>' +
-                                    '<span class="text-xs bg-green-600/30 text-green-400 px-2 py-0.5 rounded">+8 pts</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Link ' + dashboardStats.orphan_count + ' orphan pages to improve connectivity</p>' +
-                            '</div>' +
-                            '<div class="p-3 rounded-lg bg-blue-900/20 border border-blue-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-blue-400 font-medium">Reduce Deep Pages</p>' +
-                                    '<span class="text-xs bg-blue-600/30 text-blue-400 px-2 py-0.5 rounded">+5 pts</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Reorganize pages beyond depth 4 to improve navigation</p>' +
-                            '</div>' +
-                            '<div class="p-3 rounded-lg bg-amber-900/20 border border-amber-600/30">' +
-                                '<div class="flex items-center justify-between">' +
-                                    '<p class="text-sm text-amber-400 font-medium">Balance Content</p>' +
-                                    '<span class="text-xs bg-amber-600/30 text-amber-400 px-2 py-0.5 rounded">+3 pts</span>' +
-                                '</div>' +
-                                '<p class="text-xs text-slate-400 mt-1">Distribute content more evenly across sections</p>' +
-                            '</div>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
+            parts.push(
+                    '</div>',
+                '</div>'
+            );
+            
+            // Component Scores Breakdown
+            parts.push(
+                '<div class="mb-6">',
+                    DD_HEADING,
+                        '<i class="fas fa-chart-bar text-blue-400"></i>Component Scores Breakdown',
+                    '</h4>',
+                    '<div class="grid grid-cols-3 gap-4">',
+                        '<div class="p-4 rounded-lg bg-slate-700/30">',
+                            '<div class="flex items-center justify-between mb-2">',
+                                '<span class="text-sm text-slate-400">Depth Score</span>',
+                                '<span class="text-lg font-bold text-blue-400">', wholeNumber.format(depthScore), '</span>',
+                            '</div>',
+                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">',
+                                '<div class="h-full bg-blue-500" style="width: ', depthScore, '%"></div>',
+                            '</div>',
+                        '</div>',
+                        '<div class="p-4 rounded-lg bg-slate-700/30">',
+                            '<div class="flex items-center justify-between mb-2">',
+                                '<span class="text-sm text-slate-400">Balance Score</span>',
+                                '<span class="text-lg font-bold text-amber-400">', wholeNumber.format(balanceScore), '</span>',
+                            '</div>',
+                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">',
+                                '<div class="h-full bg-amber-500" style="width: ', balanceScore, '%"></div>',
+                            '</div>',
+                        '</div>',
+                        '<div class="p-4 rounded-lg bg-slate-700/30">',
+                            '<div class="flex items-center justify-between mb-2">',
+                                '<span class="text-sm text-slate-400">Connectivity</span>',
+                                '<span class="text-lg font-bold text-green-400">', wholeNumber.format(connectivityScore), '</span>',
+                            '</div>',
+                            '<div class="h-2 rounded-full bg-slate-600 overflow-hidden">',
+                                '<div class="h-full bg-green-500" style="width: ', connectivityScore, '%"></div>',
+                            '</div>',
+                        '</div>',
+                    '</div>',
+                '</div>',
+                '<div class="grid grid-cols-1 md:grid-cols-2 gap-6">',
+                    '<div>',
+                        DD_HEADING,
+                            '<i class="fas fa-chart-line text-green-400"></i>Score Trend (12 Months)',
+                        '</h4>',
+                        '<div id="drilldownScoreTrendChart" style="height: 200px;"></div>',
+                    '</div>',
+                    '<div>',
+                        DD_HEADING,
+                            '<i class="fas fa-rocket text-purple-400"></i>Recommendations to Improve',
+                        '</h4>',
+                        IA_RECOMMENDATIONS_HTML.replace('{orphans}', orphanCount),
+                    '</div>',
+                '</div>'
+            );
+            const html = parts.join('');
             
             // Render score trend chart
-            setTimeout(function() {
-                Plotly.newPlot('drilldownScoreTrendChart', [{
-                    x: months,
+            showDrilldownContent(content, html, function() {
+                drawChart('drilldownScoreTrendChart', [{
+                    x: MONTHS,
                     y: historicalScores,
-                    type: 'scatter',
+                    type: 'scattergl',
                     mode: 'lines+markers',
                     line: { color: '#10B981', width: 2 },
                     marker: { color: '#10B981', size: 6 }
-                }, {
-                    x: months,
-                    y: months.map(function() { return 85; }),
-                    type: 'scatter',
-                    mode: 'lines',
-                    line: { color: '#F59E0B', width: 2, dash: 'dash' },
-                    name: 'Target'
-                }], {
-                    paper_bgcolor: 'transparent',
-                    plot_bgcolor: 'transparent',
-                    font: { color: '#94A3B8' },
-                    margin: { t: 10, r: 20, b: 40, l: 50 },
-                    xaxis: { gridcolor: '#334155' },
-                    yaxis: { gridcolor: '#334155', range: [0, 100], title: 'Score' },
-                    showlegend: false
-                }, { responsive: true });
-            }, 100);
+                }], structuredClone(SCORE_TREND_LAYOUT), { responsive: true, displayModeBar: false });
+            });
         }
         
         function renderDepthDrilldown() {
-            const content = document.getElementById('drilldownContent');
-            const avgDepth = dashboardStats.avg_depth;
-            const maxDepth = dashboardStats.max_depth;
-            
-            content.innerHTML = '' +
-                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-amber-600/30">' +
-                        '<p class="text-xs text-slate-400">Average Depth</p>' +
-                        '<p class="text-2xl font-bold text-amber-400">' + avgDepth + '</p>' +
-                        '<p class="text-xs text-slate-500">clicks from home</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-red-600/30">' +
-                        '<p class="text-xs text-slate-400">Maximum Depth</p>' +
-                        '<p class="text-2xl font-bold text-red-400">' + maxDepth + '</p>' +
-                        '<p class="text-xs text-slate-500">deepest page</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-green-600/30">' +
-                        '<p class="text-xs text-slate-400">Optimal Range</p>' +
-                        '<p class="text-2xl font-bold text-green-400">2-3</p>' +
-                        '<p class="text-xs text-slate-500">recommended</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-blue-600/30">' +
-                        '<p class="text-xs text-slate-400">Status</p>' +
-                        '<p class="text-lg font-bold ' + (avgDepth <= 3 ? 'text-green-400' : 'text-amber-400') + '">' + (avgDepth <= 3 ? 'Optimal' : 'Needs Work') + '</p>' +
-                        '<p class="text-xs text-slate-500">' + (avgDepth <= 3 ? 'Great navigation' : 'Consider restructuring') + '</p>' +
-                    '</div>' +
-                '</div>' +
-                '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-layer-group text-amber-400"></i>Depth Distribution' +
-                    '</h4>' +
-                    '<div id="drilldownDepthChart" style="height: 250px;"></div>' +
-                '</div>' +
-                '<div>' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-tasks text-blue-400"></i>Recommendations' +
-                    '</h4>' +
-                    '<div class="grid grid-cols-1 md:grid-cols-2 gap-4">' +
-                        '<div class="p-4 rounded-lg bg-green-900/20 border border-green-600/30">' +
-                            '<p class="text-sm text-green-400 font-medium mb-2"><i class="fas fa-check-circle mr-2"></i>What is Working</p>' +
-                            '<ul class="text-xs text-slate-400 space-y-1">' +
-                                '<li>• Most content within 3 clicks</li>' +
-                                '<li>• Clear navigation hierarchy</li>' +
-                                '<li>• Good homepage connectivity</li>' +
-                            '</ul>' +
-                        '</div>' +
-                        '<div class="p-4 rounded-lg bg-amber-900/20 border border-amber-600/30">' +
-                            '<p class="text-sm text-amber-400 font-medium mb-2"><i class="fas fa-exclamation-triangle mr-2"></i>Needs Improvement</p>' +
-                            '<ul class="text-xs text-slate-400 space-y-1">' +
-                                '<li>• Some pages at depth ' + maxDepth + ' - consider moving up</li>' +
-                                '<li>• Add breadcrumb navigation</li>' +
-                                '<li>• Consider shortcut links for deep content</li>' +
-                            '</ul>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
+            const content = dom.drilldownContent;
+            const {
+                avg_depth: avgDepth,
+                max_depth: maxDepth
+            } = dashboardStats;
+            const depthOk = avgDepth <= 3;
+            
+            const parts = [];
+            parts.push(
+                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">',
+                    DD_CARD, 'amber-600/30">',
+                        DD_LABEL, 'Average Depth</p>',
+                        '<p class="text-2xl font-bold text-amber-400">', avgDepth, '</p>',
+                        DD_CAPTION, 'clicks from home</p>',
+                    '</div>',
+                    DD_CARD, 'red-600/30">',
+                        DD_LABEL, 'Maximum Depth</p>',
+                        '<p class="text-2xl font-bold text-red-400">', maxDepth, '</p>',
+                        DD_CAPTION, 'deepest page</p>',
+                    '</div>',
+                    DD_CARD, 'green-600/30">',
+                        DD_LABEL, 'Optimal Range</p>',
+                        '<p class="text-2xl font-bold text-green-400">2-3</p>',
+                        DD_CAPTION, 'recommended</p>',
+                    '</div>',
+                    DD_CARD, 'blue-600/30">',
+                        DD_LABEL, 'Status</p>',
+                        '<p class="text-lg font-bold ', (depthOk ? 'text-green-400' : 'text-amber-400'), '">', (depthOk ? 'Optimal' : 'Needs Work'), '</p>',
+                        DD_CAPTION, (depthOk ? 'Great navigation' : 'Consider restructuring'), '</p>',
+                    '</div>',
+                '</div>',
+                '<div class="mb-6">',
+                    DD_HEADING,
+                        '<i class="fas fa-layer-group text-amber-400"></i>Depth Distribution',
+                    '</h4>',
+                    '<div id="drilldownDepthChart" style="height: 250px;"></div>',
+                '</div>',
+                '<div>',
+                    DD_HEADING,
+                        '<i class="fas fa-tasks text-blue-400"></i>Recommendations',
+                    '</h4>',
+                    DEPTH_RECOMMENDATIONS_HTML.replace('{maxDepth}', maxDepth),
+                '</div>'
+            );
+            const html = parts.join('');
             
             // Render depth chart
-            setTimeout(function() {
+            showDrilldownContent(content, html, function() {
                 if (depthChartData && depthChartData.data) {
-                    Plotly.newPlot('drilldownDepthChart', depthChartData.data, {
+                    drawChart('drilldownDepthChart', depthChartData.data, {
                         ...depthChartData.layout,
                         height: 250
-                    }, { responsive: true });
+                    }, { responsive: true, staticPlot: true });
                 }
-            }, 100);
+            });
         }
         
         function renderHealthDrilldown() {
-            const content = document.getElementById('drilldownContent');
-            const healthStatus = dashboardStats.health_status;
-            const iaScore = dashboardStats.ia_score;
+            const content = dom.drilldownContent;
+            const {
+                health_status: healthStatus,
+                ia_score: iaScore,
+                orphan_count: orphanCount,
+                dead_end_count: deadEndCount,
+                avg_depth: avgDepth,
+                bottleneck_count: bottleneckCount,
+                avg_links: avgLinks
+            } = dashboardStats;
             
             const healthColor = healthStatus === 'Excellent' || healthStatus === 'Good' ? 'green' : healthStatus === 'Needs Improvement' ? 'amber' : 'red';
             
-            content.innerHTML = '' +
-                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-' + healthColor + '-600/30">' +
-                        '<p class="text-xs text-slate-400">Current Status</p>' +
-                        '<p class="text-xl font-bold text-' + healthColor + '-400">' + healthStatus + '</p>' +
-                        '<p class="text-xs text-slate-500">overall health</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-red-600/30">' +
-                        '<p class="text-xs text-slate-400">Critical Issues</p>' +
-                        '<p class="text-2xl font-bold text-red-400">' + dashboardStats.orphan_count + '</p>' +
-                        '<p class="text-xs text-slate-500">orphan pages</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-amber-600/30">' +
-                        '<p class="text-xs text-slate-400">Warnings</p>' +
-                        '<p class="text-2xl font-bold text-amber-400">' + dashboardStats.dead_end_count + '</p>' +
-                        '<p class="text-xs text-slate-500">dead ends</p>' +
-                    '</div>' +
-                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-blue-600/30">' +
-                        '<p class="text-xs text-slate-400">Bottlenecks</p>' +
-                        '<p class="text-2xl font-bold text-blue-400">' + dashboardStats.bottleneck_count + '</p>' +
-                        '<p class="text-xs text-slate-500">hard to reach</p>' +
-                    '</div>' +
-                '</div>' +
-                '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-heartbeat text-purple-400"></i>Health Score Breakdown' +
-                    '</h4>' +
-                    '<div id="drilldownHealthChart" style="height: 200px;"></div>' +
-                '</div>' +
-                '<div>' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">' +
-                        '<i class="fas fa-stethoscope text-green-400"></i>Health Checklist' +
-                    '</h4>' +
-                    '<div class="grid grid-cols-1 md:grid-cols-2 gap-4">' +
-                        '<div class="space-y-2">' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (dashboardStats.orphan_count === 0 ? 'fa-check-circle text-green-400' : 'fa-times-circle text-red-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">No orphan pages</span>' +
-                            '</div>' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (dashboardStats.dead_end_count < 5 ? 'fa-check-circle text-green-400' : 'fa-exclamation-circle text-amber-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">Minimal dead ends</span>' +
-                            '</div>' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (dashboardStats.avg_depth <= 3 ? 'fa-check-circle text-green-400' : 'fa-exclamation-circle text-amber-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">Optimal depth (≤3)</span>' +
-                            '</div>' +
-                        '</div>' +
-                        '<div class="space-y-2">' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (dashboardStats.bottleneck_count === 0 ? 'fa-check-circle text-green-400' : 'fa-exclamation-circle text-amber-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">No navigation bottlenecks</span>' +
-                            '</div>' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (dashboardStats.avg_links >= 5 ? 'fa-check-circle text-green-400' : 'fa-exclamation-circle text-amber-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">Good link density</span>' +
-                            '</div>' +
-                            '<div class="flex items-center gap-3 p-3 rounded-lg bg-slate-700/30">' +
-                                '<i class="fas ' + (iaScore >= 70 ? 'fa-check-circle text-green-400' : 'fa-exclamation-circle text-amber-400') + '"></i>' +
-                                '<span class="text-sm text-slate-300">IA Score ≥ 70</span>' +
-                            '</div>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
-            
-            // Render health gauge chart
-            setTimeout(function() {
-                Plotly.newPlot('drilldownHealthChart', [{
-                    type: 'indicator',
-                    mode: 'gauge+number',
-                    value: iaScore,
-                    gauge: {
-                        axis: { range: [0, 100], tickcolor: '#64748B' },
-                        bar: { color: iaScore >= 75 ? '#10B981' : iaScore >= 50 ? '#F59E0B' : '#EF4444' },
-                        bgcolor: '#1E293B',
-                        borderwidth: 0,
-                        steps: [
-                            { range: [0, 50], color: 'rgba(239, 68, 68, 0.1)' },
-                            { range: [50, 75], color: 'rgba(245, 158, 11, 0.1)' },
-                            { range: [75, 100], color: 'rgba(16, 185, 129, 0.1)' }
-                        ]
-                    },
-                    number: { suffix: '/100', font: { color: '#E2E8F0' } }
-                }], {
-                    paper_bgcolor: 'transparent',
-                    font: { color: '#94A3B8' },
-                    margin: { t: 30, r: 30, b: 30, l: 30 }
-                }, { responsive: true });
-            }, 100);
+            // Checklist icons
+            const passIcon = 'fa-check-circle text-green-400';
+            const warnIcon = 'fa-exclamation-circle text-amber-400';
+            const orphanIcon = orphanCount === 0 ? passIcon : 'fa-times-circle text-red-400';
+            const deadEndIcon = deadEndCount < 5 ? passIcon : warnIcon;
+            const depthIcon = avgDepth <= 3 ? passIcon : warnIcon;
+            const bottleneckIcon = bottleneckCount === 0 ? passIcon : warnIcon;
+            const linkIcon = avgLinks >= 5 ? passIcon : warnIcon;
+            const scoreIcon = iaScore >= 70 ? passIcon : warnIcon;
+            
+            const parts = [];
+            parts.push(
+                '<div class="grid grid-cols-1 md:grid-cols-4 gap-4 mb-6">',
+                    DD_CARD, healthColor, '-600/30">',
+                        DD_LABEL, 'Current Status</p>',
+                        '<p class="text-xl font-bold text-', healthColor, '-400">', healthStatus, '</p>',
+                        DD_CAPTION, 'overall health</p>',
+                    '</div>',
+                    DD_CARD, 'red-600/30">',
+                        DD_LABEL, 'Critical Issues</p>',
+                        '<p class="text-2xl font-bold text-red-400">', orphanCount, '</p>',
+                        DD_CAPTION, 'orphan pages</p>',
+                    '</div>',
+                    DD_CARD, 'amber-600/30">',
+                        DD_LABEL, 'Warnings</p>',
+                        '<p class="text-2xl font-bold text-amber-400">', deadEndCount, '</p>',
+                        DD_CAPTION, 'dead ends</p>',
+                    '</div>',
+                    DD_CARD, 'blue-600/30">',
+                        DD_LABEL, 'Bottlenecks</p>',
+                        '<p class="text-2xl font-bold text-blue-400">', bottleneckCount, '</p>',
+                        DD_CAPTION, 'hard to reach</p>',
+                    '</div>',
+                '</div>',
+                '<div class="mb-6">',
+                    DD_HEADING,
+                        '<i class="fas fa-heartbeat text-purple-400"></i>Health Score Breakdown',
+                    '</h4>',
+                    '<div style="height: 200px;">', healthGaugeSvg(iaScore), '</div>',
+                '</div>',
+                '<div>',
+                    DD_HEADING,
+                        '<i class="fas fa-stethoscope text-green-400"></i>Health Checklist',
+                    '</h4>',
+                    '<div class="grid grid-cols-1 md:grid-cols-2 gap-4">',
+                        '<div class="space-y-2">',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', orphanIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">No orphan pages</span>',
+                            '</div>',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', deadEndIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">Minimal dead ends</span>',
+                            '</div>',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', depthIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">Optimal depth (≤3)</span>',
+                            '</div>',
+                        '</div>',
+                        '<div class="space-y-2">',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', bottleneckIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">No navigation bottlenecks</span>',
+                            '</div>',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', linkIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">Good link density</span>',
+                            '</div>',
+                            DD_CHECK_ROW,
+                                '<i class="fas ', scoreIcon, '"></i>',
+                                '<span class="text-sm text-slate-300">IA Score ≥ 70</span>',
+                            '</div>',
+                        '</div>',
+                    '</div>',
+                '</div>'
+            );
+            const html = parts.join('');
+            
+            showDrilldownContent(content, html);
         }
         
         // =====================================================================
         // EXPORT FUNCTIONS
         // =====================================================================
         
+        // PDF libraries are only fetched when an export is requested
+        const PDF_LIBS = [
+            'https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js'
+        ];
+        let pdfLibsPromise = null;
+        let pdfLibsPreloaded = false;
+        
+        function loadScript(src) {
+            return new Promise(function(resolve, reject) {
+                const script = document.createElement('script');
+                script.src = src;
+                script.onload = resolve;
+                script.onerror = reject;
+                document.head.appendChild(script);
+            });
+        }
+        
+        function loadPdfLibs() {
+            if (!pdfLibsPromise) {
+                pdfLibsPromise = Promise.all(PDF_LIBS.map(loadScript));
+                pdfLibsPromise.catch(function() { pdfLibsPromise = null; });
+            }
+            return pdfLibsPromise;
+        }
+        
+        // Multi-line doc.text() blocks keep the report's 6mm line spacing (at 10pt)
+        const PDF_LINES = { lineHeightFactor: 1.7 };
+        
+        // Warm the cache when the pointer or focus reaches a PDF button
+        function preloadPdfLibs() {
+            if (pdfLibsPreloaded || pdfLibsPromise) return;
+            pdfLibsPreloaded = true;
+            PDF_LIBS.forEach(function(src) {
+                const link = document.createElement('link');
+                link.rel = 'preload';
+                link.as = 'script';
+                link.href = src;
+                document.head.appendChild(link);
+            });
+        }
+        
+        function pdfLibsFailed(error) {
+            console.error('Error loading PDF libraries:', error);
+            showNotification('Could not load the PDF export libraries. Please try again.', 'error');
+        }
+        
         function exportDashboardPDF() {
             showNotification('Generating PDF report... This may take a moment.', 'info');
+            loadPdfLibs().then(renderDashboardPDF, pdfLibsFailed);
+        }
+        
+        function renderDashboardPDF() {
+            const {
+                total_pages: totalPages,
+                ia_score: iaScore,
+                health_status: healthStatus,
+                avg_depth: avgDepth,
+                max_depth: maxDepth,
+                orphan_count: orphanCount,
+                dead_end_count: deadEndCount,
+                bottleneck_count: bottleneckCount,
+                avg_links: avgLinks,
+                depth_score: depthScore,
+                balance_score: balanceScore,
+                connectivity_score: connectivityScore
+            } = dashboardStats;
             
             const { jsPDF } = window.jspdf;
             const doc = new jsPDF('p', 'mm', 'a4');
+            const now = new Date();
             
             // Title
             doc.setFontSize(20);
@@ -3172,7 +3355,7 @@ SHADCN_DASHBOARD_HTML = '''
             // Date
             doc.setFontSize(10);
             doc.setTextColor(100);
-            doc.text('Generated: ' + new Date().toLocaleString(), 20, 28);
+            doc.text('Generated: ' + now.toLocaleString(), 20, 28);
             doc.text('Date Range: ' + getDateRangeLabel(currentDateRange), 20, 34);
             
             // Summary Section
@@ -3183,10 +3366,12 @@ SHADCN_DASHBOARD_HTML = '''
             doc.setFontSize(10);
             doc.setTextColor(60);
             const summaryY = 56;
-            doc.text('Total Pages: ' + dashboardStats.total_pages, 25, summaryY);
-            doc.text('Architecture Score: ' + dashboardStats.ia_score + '/100 (' + dashboardStats.health_status + ')', 25, summaryY + 6);
-            doc.text('Average Depth: ' + dashboardStats.avg_depth + ' clicks', 25, summaryY + 12);
-            doc.text('Max Depth: ' + dashboardStats.max_depth + ' clicks', 25, summaryY + 18);
+            doc.text([
+                'Total Pages: ' + totalPages,
+                'Architecture Score: ' + iaScore + '/100 (' + healthStatus + ')',
+                'Average Depth: ' + avgDepth + ' clicks',
+                'Max Depth: ' + maxDepth + ' clicks'
+            ], 25, summaryY, PDF_LINES);
             
             // Key Metrics
             doc.setFontSize(14);
@@ -3196,10 +3381,12 @@ SHADCN_DASHBOARD_HTML = '''
             doc.setFontSize(10);
             doc.setTextColor(60);
             const metricsY = summaryY + 40;
-            doc.text('Orphan Pages: ' + dashboardStats.orphan_count, 25, metricsY);
-            doc.text('Dead End Pages: ' + dashboardStats.dead_end_count, 25, metricsY + 6);
-            doc.text('Bottleneck Pages: ' + dashboardStats.bottleneck_count, 25, metricsY + 12);
-            doc.text('Avg Links per Page: ' + dashboardStats.avg_links, 25, metricsY + 18);
+            doc.text([
+                'Orphan Pages: ' + orphanCount,
+                'Dead End Pages: ' + deadEndCount,
+                'Bottleneck Pages: ' + bottleneckCount,
+                'Avg Links per Page: ' + avgLinks
+            ], 25, metricsY, PDF_LINES);
             
             // Score Breakdown
             doc.setFontSize(14);
@@ -3209,9 +3396,11 @@ SHADCN_DASHBOARD_HTML = '''
             doc.setFontSize(10);
             doc.setTextColor(60);
             const scoresY = metricsY + 40;
-            doc.text('Depth Score: ' + dashboardStats.depth_score.toFixed(1) + '/100', 25, scoresY);
-            doc.text('Balance Score: ' + dashboardStats.balance_score.toFixed(1) + '/100', 25, scoresY + 6);
-            doc.text('Connectivity Score: ' + dashboardStats.connectivity_score.toFixed(1) + '/100', 25, scoresY + 12);
+            doc.text([
+                'Depth Score: ' + depthScore.toFixed(1) + '/100',
+                'Balance Score: ' + balanceScore.toFixed(1) + '/100',
+                'Connectivity Score: ' + connectivityScore.toFixed(1) + '/100'
+            ], 25, scoresY, PDF_LINES);
             
             // Recommendations
             doc.setFontSize(14);
@@ -3221,14 +3410,18 @@ SHADCN_DASHBOARD_HTML = '''
             doc.setFontSize(10);
             doc.setTextColor(60);
             const recsY = scoresY + 34;
-            if (dashboardStats.orphan_count > 0) {
-                doc.text('1. Fix ' + dashboardStats.orphan_count + ' orphan pages to improve connectivity', 25, recsY);
+            const recs = [];
+            if (orphanCount > 0) {
+                recs.push('Fix ' + orphanCount + ' orphan pages to improve connectivity');
             }
-            if (dashboardStats.dead_end_count > 0) {
-                doc.text('2. Add navigation to ' + dashboardStats.dead_end_count + ' dead-end pages', 25, recsY + 6);
+            if (deadEndCount > 0) {
+                recs.push('Add navigation to ' + deadEndCount + ' dead-end pages');
             }
-            if (dashboardStats.avg_depth > 3) {
-                doc.text('3. Reduce page depth - optimal is 2-3 clicks from homepage', 25, recsY + 12);
+            if (avgDepth > 3) {
+                recs.push('Reduce page depth - optimal is 2-3 clicks from homepage');
+            }
+            if (recs.length > 0) {
+                doc.text(recs.map(function(rec, i) { return (i + 1) + '. ' + rec; }), 25, recsY, PDF_LINES);
             }
             
             // Footer
@@ -3237,26 +3430,40 @@ SHADCN_DASHBOARD_HTML = '''
             doc.text('TSM Website Structure Dashboard - Confidential Report', 20, 285);
             
             // Save
-            doc.save('TSM_Dashboard_Report_' + new Date().toISOString().split('T')[0] + '.pdf');
+            doc.save('TSM_Dashboard_Report_' + now.toISOString().slice(0, 10) + '.pdf');
             showNotification('PDF report generated successfully!', 'success');
         }
         
         function exportDashboardCSV() {
+            const {
+                total_pages: totalPages,
+                ia_score: iaScore,
+                health_status: healthStatus,
+                avg_depth: avgDepth,
+                max_depth: maxDepth,
+                avg_links: avgLinks,
+                orphan_count: orphanCount,
+                dead_end_count: deadEndCount,
+                bottleneck_count: bottleneckCount,
+                depth_score: depthScore,
+                balance_score: balanceScore,
+                connectivity_score: connectivityScore
+            } = dashboardStats;
+            
             // Generate CSV data from dashboard stats
-            const csvContent = [
-                'Metric,Value,Status',
-                'Total Pages,' + dashboardStats.total_pages + ',Crawled',
-                'IA Score,' + dashboardStats.ia_score + '/100,' + dashboardStats.health_status,
-                'Average Depth,' + dashboardStats.avg_depth + ',' + (dashboardStats.avg_depth <= 3 ? 'Optimal' : 'Needs Optimization'),
-                'Max Depth,' + dashboardStats.max_depth + ',',
-                'Average Links per Page,' + dashboardStats.avg_links + ',',
-                'Orphan Pages,' + dashboardStats.orphan_count + ',' + (dashboardStats.orphan_count === 0 ? 'Good' : 'Needs Attention'),
-                'Dead End Pages,' + dashboardStats.dead_end_count + ',' + (dashboardStats.dead_end_count < 5 ? 'Good' : 'Needs Attention'),
-                'Bottleneck Pages,' + dashboardStats.bottleneck_count + ',' + (dashboardStats.bottleneck_count === 0 ? 'Good' : 'Needs Attention'),
-                'Depth Score,' + dashboardStats.depth_score.toFixed(1) + '/100,',
-                'Balance Score,' + dashboardStats.balance_score.toFixed(1) + '/100,',
-                'Connectivity Score,' + dashboardStats.connectivity_score.toFixed(1) + '/100,'
-            ].join('\\n');
+            const csvContent =
+                'Metric,Value,Status\\n' +
+                'Total Pages,' + totalPages + ',Crawled\\n' +
+                'IA Score,' + iaScore + '/100,' + healthStatus + '\\n' +
+                'Average Depth,' + avgDepth + ',' + (avgDepth <= 3 ? 'Optimal' : 'Needs Optimization') + '\\n' +
+                'Max Depth,' + maxDepth + ',\\n' +
+                'Average Links per Page,' + avgLinks + ',\\n' +
+                'Orphan Pages,' + orphanCount + ',' + (orphanCount === 0 ? 'Good' : 'Needs Attention') + '\\n' +
+                'Dead End Pages,' + deadEndCount + ',' + (deadEndCount < 5 ? 'Good' : 'Needs Attention') + '\\n' +
+                'Bottleneck Pages,' + bottleneckCount + ',' + (bottleneckCount === 0 ? 'Good' : 'Needs Attention') + '\\n' +
+                'Depth Score,' + depthScore.toFixed(1) + '/100,\\n' +
+                'Balance Score,' + balanceScore.toFixed(1) + '/100,\\n' +
+                'Connectivity Score,' + connectivityScore.toFixed(1) + '/100,';
             
             downloadFile('tsm_dashboard_export.csv', csvContent, 'text/csv');
             showNotification('Dashboard data exported as CSV', 'success');
@@ -3264,11 +3471,91 @@ SHADCN_DASHBOARD_HTML = '''
         
         function exportDrilldownPDF() {
             showNotification('Generating drilldown PDF...', 'info');
-            
+            loadPdfLibs().then(renderDrilldownPDF, pdfLibsFailed);
+        }
+        
+        // Check rows mark pass/warn/fail with an icon; the PDF spells it out
+        const PDF_CHECK_LABELS = {
+            'fa-check-circle': 'Pass',
+            'fa-exclamation-circle': 'Warning',
+            'fa-times-circle': 'Fail'
+        };
+        // The standard PDF fonts have no glyphs for these
+        const PDF_TEXT_REPLACEMENTS = [[/≤/g, '<='], [/≥/g, '>=']];
+        
+        function pdfText(text) {
+            let result = text.replace(/\\s+/g, ' ').trim();
+            for (const [pattern, replacement] of PDF_TEXT_REPLACEMENTS) {
+                result = result.replace(pattern, replacement);
+            }
+            return result;
+        }
+        
+        // One line of text for a block with no nested blocks: "label: value caption"
+        function pdfLineText(el) {
+            const texts = Array.from(el.children, function(child) { return pdfText(child.textContent); }).filter(Boolean);
+            let text = texts.length > 1 ? texts[0] + ': ' + texts.slice(1).join(' ') : texts[0] || pdfText(el.textContent);
+            if (el.hasAttribute('data-check')) {
+                const icon = el.querySelector('i');
+                const mark = icon && Object.keys(PDF_CHECK_LABELS).find(function(name) { return icon.classList.contains(name); });
+                if (mark) text = PDF_CHECK_LABELS[mark] + ' - ' + text;
+            }
+            return text;
+        }
+        
+        // Walk the drilldown panel in document order: headings, lines of text,
+        // drawn charts and SVG visuals (the health gauge) are the blocks the PDF lays out
+        function collectPdfBlocks(root, blocks) {
+            for (const el of root.children) {
+                if (plottedCharts.has(el)) {
+                    blocks.push({ chart: el });
+                } else if (el.matches('svg[role="img"]')) {
+                    blocks.push({ svg: el });
+                } else if (el.tagName === 'H4') {
+                    blocks.push({ heading: pdfText(el.textContent) });
+                } else if (el.tagName === 'UL' || el.tagName === 'OL') {
+                    for (const item of el.children) blocks.push({ text: pdfText(item.textContent) });
+                } else if (el.querySelector('div, h4, ul, ol, svg')) {
+                    collectPdfBlocks(el, blocks);
+                } else {
+                    const text = pdfLineText(el);
+                    if (text) blocks.push({ text: text });
+                }
+            }
+            return blocks;
+        }
+        
+        // Rasterize an inline SVG through an <img>, at twice its on-screen size
+        function svgToImage(svg) {
+            const box = svg.getBoundingClientRect();
+            const width = Math.round(box.width) || 400;
+            const height = Math.round(box.height) || 240;
+            const clone = svg.cloneNode(true);
+            clone.setAttribute('width', width);
+            clone.setAttribute('height', height);
+            const markup = new XMLSerializer().serializeToString(clone);
+            
+            return new Promise(function(resolve, reject) {
+                const img = new Image();
+                img.onload = function() {
+                    const canvas = document.createElement('canvas');
+                    canvas.width = width * 2;
+                    canvas.height = height * 2;
+                    canvas.getContext('2d').drawImage(img, 0, 0, canvas.width, canvas.height);
+                    resolve({ dataUrl: canvas.toDataURL('image/png'), width: width, height: height });
+                };
+                img.onerror = reject;
+                img.src = 'data:image/svg+xml;charset=utf-8,' + encodeURIComponent(markup);
+            });
+        }
+        
+        function renderDrilldownPDF() {
             const { jsPDF } = window.jspdf;
             const doc = new jsPDF('p', 'mm', 'a4');
+            const now = new Date();
             
-            const title = document.getElementById('drilldownTitle').textContent;
+            const title = dom.drilldownTitle.textContent;
+            const content = dom.drilldownContent;
             
             // Title
             doc.setFontSize(18);
@@ -3278,22 +3565,57 @@ SHADCN_DASHBOARD_HTML = '''
             // Date
             doc.setFontSize(10);
             doc.setTextColor(100);
-            doc.text('Generated: ' + new Date().toLocaleString(), 20, 28);
+            doc.text('Generated: ' + now.toLocaleString(), 20, 28);
             
-            // Capture drilldown content
-            const content = document.getElementById('drilldownContent');
+            let y = 40;
+            function ensureSpace(height) {
+                if (y + height > 280) {
+                    doc.addPage();
+                    y = 20;
+                }
+            }
             
-            html2canvas(content, { 
-                scale: 2,
-                backgroundColor: '#1E293B',
-                useCORS: true
-            }).then(function(canvas) {
-                const imgData = canvas.toDataURL('image/png');
+            // Plotly renders each drawn chart straight to a PNG at its on-screen size
+            // and SVG visuals go through a canvas; text blocks are written with
+            // doc.text() once every image is ready
+            const blocks = collectPdfBlocks(content, []);
+            Promise.all(blocks.map(function(block) {
+                if (block.svg) return svgToImage(block.svg);
+                if (!block.chart) return null;
+                const width = block.chart.clientWidth || 800;
+                const height = block.chart.clientHeight || 400;
+                return Plotly.toImage(block.chart, { format: 'png', width: width, height: height }).then(function(dataUrl) {
+                    return { dataUrl: dataUrl, width: width, height: height };
+                });
+            })).then(function(images) {
                 const imgWidth = 170;
-                const imgHeight = (canvas.height * imgWidth) / canvas.width;
-                
-                doc.addImage(imgData, 'PNG', 20, 35, imgWidth, Math.min(imgHeight, 240));
-                doc.save('TSM_Drilldown_' + new Date().toISOString().split('T')[0] + '.pdf');
+                blocks.forEach(function(block, i) {
+                    if (block.heading) {
+                        ensureSpace(14);
+                        y += 4;
+                        doc.setFontSize(13);
+                        doc.setTextColor(0);
+                        doc.text(block.heading, 20, y);
+                        y += 7;
+                    } else if (block.text) {
+                        const lines = doc.splitTextToSize(block.text, 165);
+                        doc.setFontSize(10);
+                        ensureSpace(lines.length * 5);
+                        doc.setTextColor(60);
+                        doc.text(lines, 25, y);
+                        y += lines.length * 5;
+                    } else if (images[i]) {
+                        const image = images[i];
+                        const imgHeight = imgWidth * image.height / image.width;
+                        ensureSpace(imgHeight);
+                        // Charts and gauges have transparent backgrounds; keep them on the dark panel colour
+                        doc.setFillColor(30, 41, 59);
+                        doc.rect(20, y, imgWidth, imgHeight, 'F');
+                        doc.addImage(image.dataUrl, 'PNG', 20, y, imgWidth, imgHeight);
+                        y += imgHeight + 8;
+                    }
+                });
+                doc.save('TSM_Drilldown_' + now.toISOString().slice(0, 10) + '.pdf');
                 showNotification('Drilldown PDF generated!', 'success');
             }).catch(function(error) {
                 console.error('Error generating PDF:', error);
@@ -3301,69 +3623,96 @@ SHADCN_DASHBOARD_HTML = '''
             });
         }
         
+        // One row per metric in the drilldown CSV. dashboardStats never changes
+        // after load, so the file is built on the first export and reused.
+        const DRILLDOWN_CSV_ROWS = [
+            { label: 'Total Pages', change: '+12%', value: s => s.total_pages, status: () => 'Active' },
+            { label: 'IA Score', change: '+5.2', value: s => s.ia_score + '/100', status: () => 'Improving' },
+            { label: 'Average Depth', change: '0', value: s => s.avg_depth, status: s => s.avg_depth <= 3 ? 'Optimal' : 'Needs Work' },
+            { label: 'Max Depth', change: '0', value: s => s.max_depth },
+            { label: 'Orphan Pages', change: '-2', value: s => s.orphan_count, status: s => s.orphan_count === 0 ? 'Resolved' : 'Pending' },
+            { label: 'Dead Ends', change: '+1', value: s => s.dead_end_count, status: s => s.dead_end_count < 5 ? 'OK' : 'Review' },
+            { label: 'Bottlenecks', change: '0', value: s => s.bottleneck_count, status: s => s.bottleneck_count === 0 ? 'Clear' : 'Review' },
+            { label: 'Depth Score', change: '+2.1', value: s => s.depth_score.toFixed(1) },
+            { label: 'Balance Score', change: '+1.5', value: s => s.balance_score.toFixed(1) },
+            { label: 'Connectivity Score', change: '+3.2', value: s => s.connectivity_score.toFixed(1) }
+        ];
+        let drilldownCsv = null;
+        
         function exportDrilldownCSV() {
             showNotification('Exporting drilldown data as CSV...', 'info');
             
-            const csvData = [
-                'Metric,Value,Change,Status',
-                'Total Pages,' + dashboardStats.total_pages + ',+12%,Active',
-                'IA Score,' + dashboardStats.ia_score + '/100,+5.2,Improving',
-                'Average Depth,' + dashboardStats.avg_depth + ',0,' + (dashboardStats.avg_depth <= 3 ? 'Optimal' : 'Needs Work'),
-                'Max Depth,' + dashboardStats.max_depth + ',0,',
-                'Orphan Pages,' + dashboardStats.orphan_count + ',-2,' + (dashboardStats.orphan_count === 0 ? 'Resolved' : 'Pending'),
-                'Dead Ends,' + dashboardStats.dead_end_count + ',+1,' + (dashboardStats.dead_end_count < 5 ? 'OK' : 'Review'),
-                'Bottlenecks,' + dashboardStats.bottleneck_count + ',0,' + (dashboardStats.bottleneck_count === 0 ? 'Clear' : 'Review'),
-                'Depth Score,' + dashboardStats.depth_score.toFixed(1) + ',+2.1,',
-                'Balance Score,' + dashboardStats.balance_score.toFixed(1) + ',+1.5,',
-                'Connectivity Score,' + dashboardStats.connectivity_score.toFixed(1) + ',+3.2,'
-            ].join('\\n');
-            
-            downloadFile('TSM_Drilldown_' + new Date().toISOString().split('T')[0] + '.csv', csvData, 'text/csv');
+            if (drilldownCsv === null) {
+                drilldownCsv = 'Metric,Value,Change,Status';
+                for (const row of DRILLDOWN_CSV_ROWS) {
+                    drilldownCsv += '\\n' + row.label + ',' + row.value(dashboardStats) + ',' + row.change + ',' +
+                        (row.status ? row.status(dashboardStats) : '');
+                }
+            }
+            
+            downloadFile('TSM_Drilldown_' + new Date().toISOString().split('T')[0] + '.csv', drilldownCsv, 'text/csv');
             showNotification('Drilldown data exported as CSV', 'success');
         }
         
+        // Small exports (every CSV here is a few KB) go out as a data: URL, which
+        // skips allocating and revoking a Blob URL; larger content still uses a Blob
+        const DATA_URL_MAX_LENGTH = 512 * 1024;
         function downloadFile(filename, content, mimeType) {
+            const a = document.createElement('a');
+            a.download = filename;
+            
+            if (content.length < DATA_URL_MAX_LENGTH) {
+                a.href = 'data:' + mimeType + ';charset=utf-8,' + encodeURIComponent(content);
+                document.body.appendChild(a);
+                a.click();
+                document.body.removeChild(a);
+                return;
+            }
+            
             const blob = new Blob([content], { type: mimeType });
             const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
             a.href = url;
-            a.download = filename;
             document.body.appendChild(a);
             a.click();
             document.body.removeChild(a);
             window.URL.revokeObjectURL(url);
         }
         
+        // Toast nodes are recycled: up to NOTIFICATION_POOL_SIZE removed toasts
+        // wait in the pool instead of being rebuilt for the next message
+        const NOTIFICATION_CLASS = 'fixed bottom-4 right-4 z-50 px-4 py-3 rounded-lg shadow-lg flex items-center gap-3 animate-slide-up ';
+        const NOTIFICATION_COLORS = {
+            success: 'bg-green-600 text-white',
+            error: 'bg-red-600 text-white',
+            warning: 'bg-amber-600 text-white',
+            info: 'bg-blue-600 text-white'
+        };
+        const NOTIFICATION_ICONS = {
+            success: 'fa-check-circle',
+            error: 'fa-times-circle',
+            warning: 'fa-exclamation-triangle',
+            info: 'fa-info-circle'
+        };
+        const NOTIFICATION_POOL_SIZE = 3;
+        const notificationPool = [];
+        
         function showNotification(message, type) {
-            // Create notification element
-            const notification = document.createElement('div');
-            notification.className = 'fixed bottom-4 right-4 z-50 px-4 py-3 rounded-lg shadow-lg flex items-center gap-3 animate-slide-up';
-            
-            const colors = {
-                success: 'bg-green-600 text-white',
-                error: 'bg-red-600 text-white',
-                warning: 'bg-amber-600 text-white',
-                info: 'bg-blue-600 text-white'
-            };
-            
-            const icons = {
-                success: 'fa-check-circle',
-                error: 'fa-times-circle',
-                warning: 'fa-exclamation-triangle',
-                info: 'fa-info-circle'
-            };
-            
-            notification.classList.add(...colors[type].split(' '));
-            notification.innerHTML = '<i class="fas ' + icons[type] + '"></i><span>' + message + '</span>';
+            const notification = notificationPool.pop() || document.createElement('div');
+            notification.className = NOTIFICATION_CLASS + NOTIFICATION_COLORS[type];
+            notification.innerHTML = '<i class="fas ' + NOTIFICATION_ICONS[type] + '"></i><span>' + message + '</span>';
             
+            // Keep the toast on its own compositor layer only while it is shown
+            notification.style.willChange = 'transform, opacity';
             document.body.appendChild(notification);
             
-            // Remove after 4 seconds
+            // Fade out after 4 seconds and recycle once the exit animation ends
             setTimeout(function() {
-                notification.style.opacity = '0';
-                notification.style.transform = 'translateY(20px)';
-                notification.style.transition = 'all 0.3s ease';
-                setTimeout(function() { notification.remove(); }, 300);
+                notification.addEventListener('animationend', function() {
+                    notification.style.willChange = 'auto';
+                    notification.remove();
+                    if (notificationPool.length < NOTIFICATION_POOL_SIZE) notificationPool.push(notification);
+                }, { once: true });
+                notification.classList.add('notification-exit');
             }, 4000);
         }
         
@@ -3371,75 +3720,317 @@ SHADCN_DASHBOARD_HTML = '''
         document.addEventListener('DOMContentLoaded', function() {
             initCharts();
             initTabs();
+            initDataTable();
+            restoreTableFilters();
+            
+            // Warm Plotly in idle time so the first drilldown doesn't wait on it
+            (window.requestIdleCallback || function(cb) { return setTimeout(cb, 2000); })(function() {
+                loadPlotly().catch(function() {});
+            }, { timeout: 5000 });
+        });
+        
+        // Clicks (and select changes) on [data-action] elements go through one
+        // delegated listener instead of per-element inline handlers
+        const ACTIONS = {
+            openDrilldown: function(el) { openDrilldownModal(el.dataset.metric); },
+            toggleCompetitorForm: function() { toggleCompetitorForm(); },
+            runCompetitorUrlAnalysis: function() { runCompetitorUrlAnalysis(); },
+            loadPageScores: function() { loadPageScores(); }
+        };
+        
+        document.addEventListener('click', function(event) {
+            const el = event.target.closest('[data-action]');
+            if (el && ACTIONS[el.dataset.action]) ACTIONS[el.dataset.action](el, event);
+        });
+        
+        document.addEventListener('change', function(event) {
+            const el = event.target.closest('[data-change-action]');
+            if (el && ACTIONS[el.dataset.changeAction]) ACTIONS[el.dataset.changeAction](el, event);
         });
         
         function initCharts() {
-            // Overview network graph
+            // Overview network graph, drawn once it is near the viewport
             if (networkData && Object.keys(networkData).length > 0) {
-                Plotly.newPlot('networkGraphOverview', networkData.data, networkData.layout, {
-                    responsive: true,
-                    displayModeBar: false
+                whenVisible(document.getElementById('networkGraphOverview'), function() {
+                    queueChart(function() {
+                        drawChart('networkGraphOverview', networkData.data, networkData.layout, {
+                            responsive: true,
+                            displayModeBar: false
+                        });
+                    });
                 });
             }
             
+        }
+        
+        // Plotly is preloaded from <head> but only executed here, so parsing it
+        // no longer blocks the first paint
+        const PLOTLY_SRC = 'https://cdn.plot.ly/plotly-2.35.2.min.js';
+        let plotlyPromise = null;
+        function loadPlotly() {
+            if (window.Plotly) return Promise.resolve(window.Plotly);
+            if (!plotlyPromise) {
+                plotlyPromise = loadScript(PLOTLY_SRC).then(function() { return window.Plotly; });
+                plotlyPromise.catch(function() { plotlyPromise = null; });
+            }
+            return plotlyPromise;
+        }
+        
+        // Run a render callback the first time its element comes near the viewport
+        const lazyRenders = new WeakMap();
+        const lazyObserver = 'IntersectionObserver' in window
+            ? new IntersectionObserver(function(entries) {
+                entries.forEach(function(entry) {
+                    if (!entry.isIntersecting) return;
+                    const render = lazyRenders.get(entry.target);
+                    lazyRenders.delete(entry.target);
+                    lazyObserver.unobserve(entry.target);
+                    if (render) render();
+                });
+            }, { rootMargin: '200px' })
+            : null;
+        
+        function whenVisible(element, render) {
+            if (!lazyObserver) {
+                render();
+                return;
+            }
+            lazyRenders.set(element, render);
+            lazyObserver.observe(element);
+        }
+        
+        // The first draw into a chart div uses newPlot; later draws into the same
+        // div go through Plotly.react, which diffs against the existing plot
+        const plottedCharts = new WeakSet();
+        function drawChart(id, data, layout, config) {
+            const el = document.getElementById(id);
+            if (plottedCharts.has(el)) {
+                return Plotly.react(el, data, layout, config);
+            }
+            plottedCharts.add(el);
+            return Plotly.newPlot(el, data, layout, config);
+        }
+        
+        // Plotly draws synchronously on the main thread, so charts that appear
+        // together are drawn one per task, letting scroll and input run between them.
+        const chartJobs = [];
+        function queueChart(job) {
+            chartJobs.push(job);
+            if (chartJobs.length === 1) {
+                loadPlotly().then(function() {
+                    setTimeout(runChartJob, 0);
+                }, function(error) {
+                    console.error('Error loading Plotly:', error);
+                    chartJobs.length = 0;
+                });
+            }
+        }
+        
+        function runChartJob() {
+            const job = chartJobs[0];
+            try {
+                job();
+            } catch (error) {
+                console.error('Error drawing chart:', error);
+            }
+            chartJobs.shift();
+            if (chartJobs.length > 0) setTimeout(runChartJob, 0);
+        }
+        
+        function initStatisticsCharts() {
             // Depth chart
             if (depthChartData && Object.keys(depthChartData).length > 0) {
-                Plotly.newPlot('depthChart', depthChartData.data, depthChartData.layout, {
-                    responsive: true,
-                    displayModeBar: false
+                whenVisible(document.getElementById('depthChart'), function() {
+                    queueChart(function() {
+                        drawChart('depthChart', depthChartData.data, depthChartData.layout, {
+                            responsive: true,
+                            displayModeBar: false
+                        });
+                    });
                 });
             }
             
             // Section chart
             if (sectionChartData && Object.keys(sectionChartData).length > 0) {
-                Plotly.newPlot('sectionChart', sectionChartData.data, sectionChartData.layout, {
-                    responsive: true,
-                    displayModeBar: false
+                whenVisible(document.getElementById('sectionChart'), function() {
+                    queueChart(function() {
+                        drawChart('sectionChart', sectionChartData.data, sectionChartData.layout, {
+                            responsive: true,
+                            displayModeBar: false
+                        });
+                    });
                 });
             }
         }
         
-        function initTabs() {
-            document.querySelectorAll('.tab-btn').forEach(btn => {
-                btn.addEventListener('click', function() {
-                    // Update tab buttons
-                    document.querySelectorAll('.tab-btn').forEach(b => {
-                        b.classList.remove('border-blue-500', 'text-blue-400');
-                        b.classList.add('border-transparent', 'text-slate-400');
-                        b.setAttribute('aria-selected', 'false');
+        // Fetch a tab's chart data once, reusing a sessionStorage copy for the same data ETag
+        const tabDataCache = {};
+        function loadTabData(tabName) {
+            if (tabDataCache[tabName]) {
+                return tabDataCache[tabName];
+            }
+            
+            const storageKey = 'tabData:' + tabName + ':' + DATA_ETAG;
+            let stored = null;
+            try {
+                stored = sessionStorage.getItem(storageKey);
+            } catch (e) {
+                // Storage may be disabled; fall through to the network
+            }
+            
+            tabDataCache[tabName] = stored
+                ? Promise.resolve(JSON.parse(stored))
+                : fetch('/api/tab/' + tabName)
+                    .then(function(response) { return response.text(); })
+                    .then(function(text) {
+                        try {
+                            sessionStorage.setItem(storageKey, text);
+                        } catch (e) {
+                            // Quota exceeded; the in-memory copy still applies
+                        }
+                        return JSON.parse(text);
                     });
-                    this.classList.remove('border-transparent', 'text-slate-400');
-                    this.classList.add('border-blue-500', 'text-blue-400');
-                    this.setAttribute('aria-selected', 'true');
-                    
-                    // Update tab content
-                    document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-                    document.getElementById('tab-' + this.dataset.tab).classList.add('active');
-                    
+            tabDataCache[tabName].catch(function() { delete tabDataCache[tabName]; });
+            return tabDataCache[tabName];
+        }
+        
+        // Fetch JSON through a short-lived sessionStorage copy. The key includes the
+        // data ETag, so a new crawl never serves results cached for the old one.
+        // Once the copy expires it is revalidated with If-None-Match, and a 304
+        // reuses the stored body.
+        const FETCH_CACHE_TTL = 60000;
+        function cachedFetch(url, ttlMs) {
+            const storageKey = 'fetch:' + DATA_ETAG + ':' + url;
+            const maxAge = ttlMs === undefined ? FETCH_CACHE_TTL : ttlMs;
+            let stored = null;
+            try {
+                stored = JSON.parse(sessionStorage.getItem(storageKey));
+                if (stored && Date.now() - stored.t < maxAge) {
+                    return Promise.resolve(JSON.parse(stored.body));
+                }
+            } catch (e) {
+                // Storage may be disabled or hold a bad entry; fall through to the network
+                stored = null;
+            }
+            
+            function remember(etag, text) {
+                try {
+                    sessionStorage.setItem(storageKey, JSON.stringify({ t: Date.now(), etag: etag, body: text }));
+                } catch (e) {
+                    // Quota exceeded; the response is still returned
+                }
+            }
+            
+            const headers = stored && stored.etag ? { 'If-None-Match': stored.etag } : {};
+            return fetch(url, { headers: headers }).then(function(response) {
+                if (response.status === 304) {
+                    remember(stored.etag, stored.body);
+                    return JSON.parse(stored.body);
+                }
+                return response.text().then(function(text) {
+                    if (response.ok) remember(response.headers.get('ETag'), text);
+                    return JSON.parse(text);
+                });
+            });
+        }
+        
+        // Load a server-rendered tab partial the first time its tab is opened
+        function loadTabContent(tabName) {
+            const panel = document.getElementById('tab-' + tabName);
+            if (!panel.dataset.src || panel.dataset.loaded) {
+                return Promise.resolve(false);
+            }
+            
+            return fetch(panel.dataset.src)
+                .then(function(response) { return response.text(); })
+                .then(function(html) {
+                    panel.innerHTML = html;
+                    panel.dataset.loaded = 'true';
+                    return true;
+                })
+                .catch(function(error) {
+                    console.error('Error loading tab:', error);
+                    panel.innerHTML = '<p class="text-red-400 text-center py-12">Error loading tab. Please try again.</p>';
+                    return false;
+                });
+        }
+        
+        // Tab renders wait for the next frame; clicking the same tab again before
+        // then replaces the pending render instead of queueing another one
+        const pendingPlots = new Map();
+        function schedulePlot(key, fn) {
+            if (pendingPlots.has(key)) cancelAnimationFrame(pendingPlots.get(key));
+            pendingPlots.set(key, requestAnimationFrame(function() {
+                pendingPlots.delete(key);
+                fn();
+            }));
+        }
+        
+        function initTabs() {
+            // One delegated listener on the tab bar handles every tab button
+            const tabBtns = dom.tabList.querySelectorAll('.tab-btn');
+            dom.tabList.addEventListener('click', function(event) {
+                const btn = event.target.closest('.tab-btn');
+                if (!btn) return;
+                
+                // Update tab buttons
+                tabBtns.forEach(b => {
+                    b.classList.remove('border-blue-500', 'text-blue-400');
+                    b.classList.add('border-transparent', 'text-slate-400');
+                    b.setAttribute('aria-selected', 'false');
+                });
+                btn.classList.remove('border-transparent', 'text-slate-400');
+                btn.classList.add('border-blue-500', 'text-blue-400');
+                btn.setAttribute('aria-selected', 'true');
+                
+                // Update tab content
+                const tab = btn.dataset.tab;
+                document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+                document.getElementById('tab-' + tab).classList.add('active');
+                
+                loadTabContent(tab).then(function(justLoaded) {
                     // Initialize full network graph when network tab is selected
-                    if (this.dataset.tab === 'network' && networkData) {
-                        setTimeout(() => {
-                            Plotly.newPlot('networkGraphFull', networkData.data, {
-                                ...networkData.layout,
-                                height: 580
-                            }, {responsive: true});
-                        }, 100);
-                    }
-                    
-                    // Initialize mindmap when mindmap tab is selected
-                    if (this.dataset.tab === 'mindmap') {
-                        setTimeout(() => {
-                            initMindmapCharts();
-                        }, 100);
+                    if (tab === 'network' && networkData) {
+                        schedulePlot('network', function() {
+                            queueChart(() => {
+                                drawChart('networkGraphFull', networkData.data, fullNetworkLayout, {responsive: true});
+                            });
+                        });
                     }
                     
-                    // Initialize SEO tab when selected
-                    if (this.dataset.tab === 'seo') {
-                        setTimeout(() => {
-                            initSEOTab();
-                        }, 100);
+                    // Statistics charts are drawn once, after the partial arrives
+                    if (tab === 'statistics' && justLoaded) {
+                        initStatisticsCharts();
                     }
                 });
+                
+                // Fetch the data table rows the first time its tab is selected
+                if (tab === 'data') {
+                    loadTableRows();
+                }
+                
+                // Initialize mindmap when mindmap tab is selected
+                if (tab === 'mindmap') {
+                    loadTabData('mindmap')
+                        .then(function(data) {
+                            mindmapData = data.mindmap;
+                            treeHierarchyData = data.tree_hierarchy;
+                            treemapData = data.treemap;
+                            // Plot once the shown tab has been laid out
+                            requestAnimationFrame(function() {
+                                requestAnimationFrame(initMindmapCharts);
+                            });
+                        })
+                        .catch(function(error) {
+                            console.error('Error loading mind map data:', error);
+                            showNotification('Error loading mind map data. Please try again.', 'error');
+                        });
+                }
+                
+                // Initialize SEO tab when selected
+                if (tab === 'seo') {
+                    schedulePlot('seo', initSEOTab);
+                }
             });
         }
         
@@ -3447,73 +4038,106 @@ SHADCN_DASHBOARD_HTML = '''
         let seoDataLoaded = false;
         let seoData = null;
         
+        // Colour lookups shared by the SEO renderers
+        const SEO_GRADE_COLORS = {
+            'A': 'bg-green-600/20 text-green-400',
+            'B': 'bg-blue-600/20 text-blue-400',
+            'C': 'bg-amber-600/20 text-amber-400',
+            'D': 'bg-red-600/20 text-red-400'
+        };
+        const PRIORITY_COLORS = {
+            1: 'bg-red-600/20 text-red-400 border-red-600/30',
+            2: 'bg-amber-600/20 text-amber-400 border-amber-600/30',
+            3: 'bg-blue-600/20 text-blue-400 border-blue-600/30',
+            4: 'bg-slate-600/20 text-slate-400 border-slate-600/30'
+        };
+        const KEYWORD_COLORS = ['bg-blue-600/30 text-blue-300', 'bg-green-600/30 text-green-300', 
+                               'bg-purple-600/30 text-purple-300', 'bg-amber-600/30 text-amber-300',
+                               'bg-red-600/30 text-red-300'];
+        
+        // [minimum score, text colour, bar colour], best bucket first
+        const SCORE_BUCKETS = [
+            [80, 'text-green-400', 'bg-green-600'],
+            [60, 'text-blue-400', 'bg-blue-600'],
+            [40, 'text-amber-400', 'bg-amber-600'],
+            [-Infinity, 'text-red-400', 'bg-red-600']
+        ];
+        function scoreBucket(score) {
+            for (const bucket of SCORE_BUCKETS) {
+                if (score >= bucket[0]) return bucket;
+            }
+            return SCORE_BUCKETS[SCORE_BUCKETS.length - 1];
+        }
+        
         function initSEOTab() {
             if (seoDataLoaded) return;
             
-            fetch('/api/seo/data')
-                .then(function(response) { return response.json(); })
+            cachedFetch('/api/seo/data')
                 .then(function(data) {
                     seoData = data;
                     seoDataLoaded = true;
                     renderSEODashboard(data);
                     
-                    // Load page scores
-                    loadPageScores();
+                    // Page scores sit below the fold; fetch them once scrolled into view
+                    whenVisible(dom.seoPageScores, function() {
+                        loadPageScores();
+                    });
                 })
                 .catch(function(error) {
                     console.error('Error loading SEO data:', error);
-                    document.getElementById('seoCriticalIssues').innerHTML = 
+                    dom.seoCriticalIssues.innerHTML = 
                         '<p class="text-red-400">Error loading SEO data. Please try again.</p>';
                 });
         }
         
+        // Signature of the last SEO payload rendered; an identical one is skipped
+        let lastSeoSignature = null;
+        
         function renderSEODashboard(data) {
-            // Update score cards
+            const signature = JSON.stringify(data);
+            if (signature === lastSeoSignature) return;
+            lastSeoSignature = signature;
+            
+            // Work out every value first, then write them all in one frame
             const score = data.overall_score || 0;
-            document.getElementById('seoOverallScore').textContent = score + '/100';
-            document.getElementById('seoScoreBar').style.width = score + '%';
-            
-            // Update grade badge
-            const gradeColors = {
-                'A': 'bg-green-600/20 text-green-400',
-                'B': 'bg-blue-600/20 text-blue-400',
-                'C': 'bg-amber-600/20 text-amber-400',
-                'D': 'bg-red-600/20 text-red-400'
-            };
             const grade = data.grade || 'N/A';
-            const gradeClass = gradeColors[grade] || 'bg-slate-700 text-slate-300';
-            document.getElementById('seoGrade').innerHTML = 
-                '<span class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium ' + gradeClass + '">Grade: ' + grade + ' - ' + (data.status || '') + '</span>';
+            const gradeClass = SEO_GRADE_COLORS[grade] || 'bg-slate-700 text-slate-300';
+            const gradeHtml = '<span class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium ' + gradeClass + '">Grade: ' + grade + ' - ' + (data.status || '') + '</span>';
             
-            // Update individual scores
             const scores = data.scores || {};
-            document.getElementById('seoMetadataScore').textContent = (scores.metadata || 0) + '/100';
-            document.getElementById('seoUrlScore').textContent = (scores.url_structure || 0) + '/100';
-            document.getElementById('seoLinkingScore').textContent = (scores.internal_linking || 0) + '/100';
-            
-            // Update issue counts
             const issues = data.issues || {};
-            document.getElementById('seoMissingTitles').textContent = issues.missing_titles || 0;
-            document.getElementById('seoMissingDescs').textContent = issues.missing_descriptions || 0;
-            document.getElementById('seoOrphanPages').textContent = issues.orphan_pages || 0;
-            document.getElementById('seoDeadEnds').textContent = issues.dead_ends || 0;
-            document.getElementById('seoDeepPages').textContent = issues.pages_too_deep || 0;
-            document.getElementById('seoLongUrls').textContent = issues.long_urls || 0;
-            
-            // Update traffic boost
-            document.getElementById('seoTrafficBoost').textContent = '+' + (data.estimated_traffic_boost || '25-40%');
-            
-            // Render charts
-            renderSEOCharts(data);
-            
-            // Render priority actions
-            renderPriorityActions(data.priority_actions || []);
-            
-            // Render top keywords
-            renderTopKeywords(data.metrics?.top_keywords || []);
+            const texts = {
+                // Score cards
+                seoOverallScore: score + '/100',
+                seoMetadataScore: (scores.metadata || 0) + '/100',
+                seoUrlScore: (scores.url_structure || 0) + '/100',
+                seoLinkingScore: (scores.internal_linking || 0) + '/100',
+                // Issue counts
+                seoMissingTitles: issues.missing_titles || 0,
+                seoMissingDescs: issues.missing_descriptions || 0,
+                seoOrphanPages: issues.orphan_pages || 0,
+                seoDeadEnds: issues.dead_ends || 0,
+                seoDeepPages: issues.pages_too_deep || 0,
+                seoLongUrls: issues.long_urls || 0,
+                // Traffic boost
+                seoTrafficBoost: '+' + (data.estimated_traffic_boost || '25-40%')
+            };
             
-            // Render critical issues
-            renderCriticalIssues(data);
+            requestAnimationFrame(function() {
+                for (const id in texts) {
+                    const text = String(texts[id]);
+                    if (dom[id].textContent !== text) dom[id].textContent = text;
+                }
+                dom.seoScoreBar.style.width = score + '%';
+                dom.seoGrade.innerHTML = gradeHtml;
+                
+                renderPriorityActions(data.priority_actions || []);
+                renderTopKeywords(data.metrics?.top_keywords || []);
+                renderCriticalIssues(data);
+                
+                // Charts are queued behind the writes above
+                renderSEOCharts(data);
+            });
         }
         
         function renderSEOCharts(data) {
@@ -3564,7 +4188,11 @@ SHADCN_DASHBOARD_HTML = '''
                     }]
                 };
                 
-                Plotly.newPlot('seoScoreChart', [scoreTrace], scoreLayout, {responsive: true, displayModeBar: false});
+                whenVisible(dom.seoScoreChart, function() {
+                    queueChart(function() {
+                        drawChart('seoScoreChart', [scoreTrace], scoreLayout, {responsive: true, displayModeBar: false});
+                    });
+                });
             }
             
             // Issues distribution chart
@@ -3596,64 +4224,59 @@ SHADCN_DASHBOARD_HTML = '''
                     }]
                 };
                 
-                Plotly.newPlot('seoIssuesChart', [issuesTrace], issuesLayout, {responsive: true, displayModeBar: false});
+                whenVisible(dom.seoIssuesChart, function() {
+                    queueChart(function() {
+                        drawChart('seoIssuesChart', [issuesTrace], issuesLayout, {responsive: true, displayModeBar: false});
+                    });
+                });
             }
         }
         
         function renderPriorityActions(actions) {
-            const container = document.getElementById('seoPriorityActions');
+            const container = dom.seoPriorityActions;
             if (!actions || actions.length === 0) {
                 container.innerHTML = '<p class="text-slate-400 text-sm">No priority actions identified.</p>';
                 return;
             }
             
-            const priorityColors = {
-                1: 'bg-red-600/20 text-red-400 border-red-600/30',
-                2: 'bg-amber-600/20 text-amber-400 border-amber-600/30',
-                3: 'bg-blue-600/20 text-blue-400 border-blue-600/30',
-                4: 'bg-slate-600/20 text-slate-400 border-slate-600/30'
-            };
-            
-            let html = '';
+            const parts = [];
             actions.slice(0, 5).forEach(function(action) {
-                const colorClass = priorityColors[action.priority] || priorityColors[4];
-                html += '<div class="p-3 rounded-lg border ' + colorClass + '">' +
-                    '<div class="flex items-center gap-2 mb-1">' +
-                        '<span class="text-xs font-medium px-2 py-0.5 rounded ' + colorClass + '">' + action.category + '</span>' +
-                    '</div>' +
-                    '<p class="text-sm text-slate-200">' + action.action + '</p>' +
-                    '<div class="flex gap-4 mt-2 text-xs text-slate-400">' +
-                        '<span><i class="fas fa-bolt mr-1"></i>' + action.impact + '</span>' +
-                        '<span><i class="fas fa-clock mr-1"></i>' + action.effort + '</span>' +
-                    '</div>' +
-                '</div>';
+                const colorClass = PRIORITY_COLORS[action.priority] || PRIORITY_COLORS[4];
+                parts.push(
+                    '<div class="p-3 rounded-lg border ', colorClass, '">',
+                        '<div class="flex items-center gap-2 mb-1">',
+                            '<span class="text-xs font-medium px-2 py-0.5 rounded ', colorClass, '">', action.category, '</span>',
+                        '</div>',
+                        '<p class="text-sm text-slate-200">', action.action, '</p>',
+                        '<div class="flex gap-4 mt-2 text-xs text-slate-400">',
+                            '<span><i class="fas fa-bolt mr-1"></i>', action.impact, '</span>',
+                            '<span><i class="fas fa-clock mr-1"></i>', action.effort, '</span>',
+                        '</div>',
+                    '</div>'
+                );
             });
-            container.innerHTML = html;
+            container.innerHTML = parts.join('');
         }
         
         function renderTopKeywords(keywords) {
-            const container = document.getElementById('seoTopKeywords');
+            const container = dom.seoTopKeywords;
             if (!keywords || keywords.length === 0) {
                 container.innerHTML = '<span class="text-slate-400 text-sm">No keywords found</span>';
                 return;
             }
             
-            const colors = ['bg-blue-600/30 text-blue-300', 'bg-green-600/30 text-green-300', 
-                           'bg-purple-600/30 text-purple-300', 'bg-amber-600/30 text-amber-300',
-                           'bg-red-600/30 text-red-300'];
-            
-            let html = '';
+            const parts = [];
             keywords.slice(0, 10).forEach(function(kw, idx) {
                 const keyword = Array.isArray(kw) ? kw[0] : kw;
                 const count = Array.isArray(kw) ? kw[1] : 0;
-                const colorClass = colors[idx % colors.length];
-                html += '<span class="px-3 py-1 rounded-full ' + colorClass + ' text-sm">' + keyword + ' (' + count + ')</span>';
+                const colorClass = KEYWORD_COLORS[idx % KEYWORD_COLORS.length];
+                parts.push('<span class="px-3 py-1 rounded-full ', colorClass, ' text-sm">', keyword, ' (', count, ')</span>');
             });
-            container.innerHTML = html;
+            container.innerHTML = parts.join('');
         }
         
         function renderCriticalIssues(data) {
-            const container = document.getElementById('seoCriticalIssues');
+            const container = dom.seoCriticalIssues;
             const issues = data.issues || {};
             
             const criticalItems = [];
@@ -3721,39 +4344,64 @@ SHADCN_DASHBOARD_HTML = '''
                 return;
             }
             
-            let html = '';
+            const parts = [];
             criticalItems.forEach(function(item) {
-                html += '<div class="p-4 rounded-lg bg-slate-700/30 border border-slate-600/30 hover:bg-slate-700/50 transition-colors">' +
-                    '<div class="flex items-start gap-3">' +
-                        '<i class="fas ' + item.icon + ' text-xl ' + item.color + ' mt-0.5"></i>' +
-                        '<div class="flex-1">' +
-                            '<p class="text-slate-200 font-medium">' + item.title + '</p>' +
-                            '<p class="text-sm text-slate-400 mt-1">' + item.desc + '</p>' +
-                            '<div class="mt-2 flex items-center gap-2">' +
-                                '<span class="text-xs px-2 py-1 rounded bg-green-600/20 text-green-400">' +
-                                    '<i class="fas fa-chart-line mr-1"></i>' + item.impact +
-                                '</span>' +
-                            '</div>' +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
+                parts.push(
+                    '<div class="p-4 rounded-lg bg-slate-700/30 border border-slate-600/30 hover:bg-slate-700/50 transition-colors">',
+                        '<div class="flex items-start gap-3">',
+                            '<i class="fas ', item.icon, ' text-xl ', item.color, ' mt-0.5"></i>',
+                            '<div class="flex-1">',
+                                '<p class="text-slate-200 font-medium">', item.title, '</p>',
+                                '<p class="text-sm text-slate-400 mt-1">', item.desc, '</p>',
+                                '<div class="mt-2 flex items-center gap-2">',
+                                    '<span class="text-xs px-2 py-1 rounded bg-green-600/20 text-green-400">',
+                                        '<i class="fas fa-chart-line mr-1"></i>', item.impact,
+                                    '</span>',
+                                '</div>',
+                            '</div>',
+                        '</div>',
+                    '</div>'
+                );
             });
-            container.innerHTML = html;
+            container.innerHTML = parts.join('');
         }
         
         // SEO Page Scores Functions
-        let currentPageScoresLimit = 5;
+        // Every score is fetched once and only the cards in view are rendered,
+        // between two spacers that keep the scroll height. Cards have a fixed
+        // height (long titles, URLs and fixes are truncated).
+        const PAGE_SCORE_ROW_HEIGHT = 236;
+        const PAGE_SCORE_OVERSCAN = 5;
+        
+        const PAGE_SCORE_ICONS = {
+            'title': 'fa-heading',
+            'meta': 'fa-align-left',
+            'h1': 'fa-h-square',
+            'url': 'fa-link',
+            'links': 'fa-project-diagram'
+        };
+        const FIX_IMPACT_COLORS = {
+            'high': 'text-red-400',
+            'medium': 'text-amber-400'
+        };
         
-        function loadPageScores(limit) {
-            if (limit) currentPageScoresLimit = limit;
+        let allPageScores = [];
+        const pageScoreWindow = { start: -1, end: -1, frame: null, bound: false };
+        
+        function loadPageScores() {
+            const sortBy = dom.seoPageScoreSort.value;
+            const container = dom.seoPageScores;
             
-            const sortBy = document.getElementById('seoPageScoreSort').value;
-            const container = document.getElementById('seoPageScores');
+            if (!pageScoreWindow.bound) {
+                pageScoreWindow.bound = true;
+                container.addEventListener('scroll', schedulePageScoreRender, { passive: true });
+                window.addEventListener('resize', schedulePageScoreRender, { passive: true });
+            }
             
+            allPageScores = [];
             container.innerHTML = '<div class="text-center py-4"><i class="fas fa-spinner fa-spin text-2xl text-blue-400"></i></div>';
             
-            fetch('/api/seo/page-scores?limit=' + currentPageScoresLimit + '&sort=' + sortBy)
-                .then(function(response) { return response.json(); })
+            cachedFetch('/api/seo/page-scores?limit=0&sort=' + sortBy)
                 .then(function(data) {
                     if (data.error) {
                         container.innerHTML = '<p class="text-red-400">' + data.error + '</p>';
@@ -3767,95 +4415,120 @@ SHADCN_DASHBOARD_HTML = '''
                 });
         }
         
-        function loadMorePageScores() {
-            currentPageScoresLimit += 5;
-            loadPageScores();
-        }
-        
         function renderPageScores(pages) {
-            const container = document.getElementById('seoPageScores');
+            const container = dom.seoPageScores;
             
             if (!pages || pages.length === 0) {
                 container.innerHTML = '<p class="text-slate-400">No page scores available.</p>';
                 return;
             }
             
-            let html = '';
-            pages.forEach(function(page) {
-                const scoreColor = page.overall_score >= 80 ? 'text-green-400' : 
-                                 page.overall_score >= 60 ? 'text-blue-400' :
-                                 page.overall_score >= 40 ? 'text-amber-400' : 'text-red-400';
-                
-                const scoreBarColor = page.overall_score >= 80 ? 'bg-green-600' : 
-                                    page.overall_score >= 60 ? 'bg-blue-600' :
-                                    page.overall_score >= 40 ? 'bg-amber-600' : 'bg-red-600';
-                
-                // Build component scores HTML
-                let scoresHtml = '';
-                const iconMap = {
-                    'title': 'fa-heading',
-                    'meta': 'fa-align-left',
-                    'h1': 'fa-h-square',
-                    'url': 'fa-link',
-                    'links': 'fa-project-diagram'
-                };
-                
-                Object.keys(page.scores).forEach(function(key) {
-                    const score = page.scores[key];
-                    const icon = iconMap[key] || 'fa-check';
-                    const color = score >= 80 ? 'text-green-400' :
-                                score >= 60 ? 'text-blue-400' :
-                                score >= 40 ? 'text-amber-400' : 'text-red-400';
-                    
-                    scoresHtml += '<div class="text-center">' +
-                        '<i class="fas ' + icon + ' ' + color + ' text-xs"></i>' +
-                        '<div class="text-xs ' + color + ' mt-1">' + score + '</div>' +
-                        '</div>';
-                });
+            allPageScores = pages;
+            container.scrollTop = 0;
+            // Paint just the cards in view now; the overscan cards follow next frame
+            renderPageScoreWindow(true, 0);
+            schedulePageScoreRender();
+        }
+        
+        function schedulePageScoreRender() {
+            if (pageScoreWindow.frame || allPageScores.length === 0) return;
+            pageScoreWindow.frame = requestAnimationFrame(function() {
+                pageScoreWindow.frame = null;
+                renderPageScoreWindow(false);
+            });
+        }
+        
+        function renderPageScoreWindow(force, overscan = PAGE_SCORE_OVERSCAN) {
+            const container = dom.seoPageScores;
+            // Hidden tabs report a zero height; fall back to the container's max height.
+            const viewportHeight = container.clientHeight || 720;
+            const first = Math.floor(container.scrollTop / PAGE_SCORE_ROW_HEIGHT);
+            const start = Math.max(0, first - overscan);
+            const end = Math.min(allPageScores.length, first + Math.ceil(viewportHeight / PAGE_SCORE_ROW_HEIGHT) + overscan);
+            
+            if (!force && start === pageScoreWindow.start && end === pageScoreWindow.end) return;
+            pageScoreWindow.start = start;
+            pageScoreWindow.end = end;
+            
+            const parts = ['<div style="height: ', start * PAGE_SCORE_ROW_HEIGHT, 'px"></div>'];
+            for (let i = start; i < end; i++) {
+                pushPageScoreRow(parts, allPageScores[i]);
+            }
+            parts.push('<div style="height: ', (allPageScores.length - end) * PAGE_SCORE_ROW_HEIGHT, 'px"></div>');
+            container.innerHTML = parts.join('');
+        }
+        
+        // Appends one card's markup to parts, including its component scores
+        // and fixes, so no per-card string is built.
+        function pushPageScoreRow(parts, page) {
+            const [, scoreColor, scoreBarColor] = scoreBucket(page.overall_score);
+            
+            parts.push(
+                '<div class="pb-3" style="height: ', PAGE_SCORE_ROW_HEIGHT, 'px">',
+                '<div class="h-full overflow-hidden p-4 rounded-lg bg-slate-700/30 border border-slate-600/30 hover:bg-slate-700/50 transition-colors">',
+                    '<div class="flex items-start gap-4">',
+                        '<div class="text-center min-w-[60px]">',
+                            '<div class="text-2xl font-bold ', scoreColor, '">', page.overall_score, '</div>',
+                            '<div class="text-xs text-slate-500">score</div>',
+                        '</div>',
+                        '<div class="flex-1 min-w-0">',
+                            '<div class="flex items-start justify-between mb-2">',
+                                '<div class="flex-1 min-w-0">',
+                                    '<p class="text-slate-200 font-medium mb-1 truncate">', page.title, '</p>',
+                                    '<p class="text-xs text-slate-400 truncate">', page.url, '</p>',
+                                '</div>',
+                                '<span class="ml-2 px-2 py-1 rounded text-xs bg-slate-600 text-slate-300">Depth ', page.depth, '</span>',
+                            '</div>',
+                            '<div class="grid grid-cols-5 gap-2 mb-3">'
+            );
+            
+            // Component scores
+            for (const key in page.scores) {
+                const score = page.scores[key];
+                const icon = PAGE_SCORE_ICONS[key] || 'fa-check';
+                const color = scoreBucket(score)[1];
                 
-                // Build fixes HTML
-                let fixesHtml = '';
-                if (page.fixes && page.fixes.length > 0) {
-                    fixesHtml = '<div class="space-y-1">';
-                    page.fixes.slice(0, 3).forEach(function(fix) {
-                        const impactColor = fix.impact === 'high' ? 'text-red-400' :
-                                          fix.impact === 'medium' ? 'text-amber-400' : 'text-blue-400';
-                        fixesHtml += '<div class="flex items-start gap-2 text-xs">' +
-                            '<i class="fas fa-wrench ' + impactColor + ' mt-0.5"></i>' +
-                            '<span class="text-slate-300">' + fix.fix + '</span>' +
-                            '</div>';
-                    });
-                    if (page.fix_count > 3) {
-                        fixesHtml += '<div class="text-xs text-slate-500 mt-1">+' + (page.fix_count - 3) + ' more fixes needed</div>';
-                    }
-                    fixesHtml += '</div>';
+                parts.push(
+                    '<div class="text-center">',
+                        '<i class="fas ', icon, ' ', color, ' text-xs"></i>',
+                        '<div class="text-xs ', color, ' mt-1">', score, '</div>',
+                    '</div>'
+                );
+            }
+            
+            parts.push(
+                            '</div>',
+                            '<div class="h-1.5 rounded-full bg-slate-600 overflow-hidden mb-3">',
+                                '<div class="', scoreBarColor, ' h-full transition-all" style="width: ', page.overall_score, '%"></div>',
+                            '</div>'
+            );
+            
+            // Fixes
+            if (page.fixes && page.fixes.length > 0) {
+                parts.push('<div class="space-y-1">');
+                const fixCount = Math.min(page.fixes.length, 3);
+                for (let i = 0; i < fixCount; i++) {
+                    const fix = page.fixes[i];
+                    const impactColor = FIX_IMPACT_COLORS[fix.impact] || 'text-blue-400';
+                    parts.push(
+                        '<div class="flex items-start gap-2 text-xs min-w-0">',
+                            '<i class="fas fa-wrench ', impactColor, ' mt-0.5"></i>',
+                            '<span class="text-slate-300 truncate">', fix.fix, '</span>',
+                        '</div>'
+                    );
                 }
-                
-                html += '<div class="p-4 rounded-lg bg-slate-700/30 border border-slate-600/30 hover:bg-slate-700/50 transition-colors">' +
-                    '<div class="flex items-start gap-4">' +
-                        '<div class="text-center min-w-[60px]">' +
-                            '<div class="text-2xl font-bold ' + scoreColor + '">' + page.overall_score + '</div>' +
-                            '<div class="text-xs text-slate-500">score</div>' +
-                        '</div>' +
-                        '<div class="flex-1">' +
-                            '<div class="flex items-start justify-between mb-2">' +
-                                '<div class="flex-1">' +
-                                    '<p class="text-slate-200 font-medium mb-1">' + page.title + '</p>' +
-                                    '<p class="text-xs text-slate-400 truncate">' + page.url + '</p>' +
-                                '</div>' +
-                                '<span class="ml-2 px-2 py-1 rounded text-xs bg-slate-600 text-slate-300">Depth ' + page.depth + '</span>' +
-                            '</div>' +
-                            '<div class="grid grid-cols-5 gap-2 mb-3">' + scoresHtml + '</div>' +
-                            '<div class="h-1.5 rounded-full bg-slate-600 overflow-hidden mb-3">' +
-                                '<div class="' + scoreBarColor + ' h-full transition-all" style="width: ' + page.overall_score + '%"></div>' +
-                            '</div>' +
-                            fixesHtml +
-                        '</div>' +
-                    '</div>' +
-                '</div>';
-            });
+                if (page.fix_count > 3) {
+                    parts.push('<div class="text-xs text-slate-500 mt-1">+', page.fix_count - 3, ' more fixes needed</div>');
+                }
+                parts.push('</div>');
+            }
             
-            container.innerHTML = html;
+            parts.push(
+                        '</div>',
+                    '</div>',
+                '</div>',
+                '</div>'
+            );
         }
         
         // Competitor Analysis Functions
@@ -3886,7 +4559,24 @@ SHADCN_DASHBOARD_HTML = '''
             // Hide form
             document.getElementById('competitorForm').classList.add('hidden');
             
-            fetch('/api/seo/competitor-analysis', {
+            // Each competitor streams back as its own NDJSON line, so progress shows
+            // per site instead of after the whole batch
+            const progress = [];
+            function handleLine(line) {
+                if (!line) return;
+                const data = JSON.parse(line);
+                if (data.error) {
+                    resultsContainer.innerHTML = '<p class="text-red-400">' + data.error + '</p>';
+                } else if (data.competitor) {
+                    progress.push(data.competitor);
+                    renderCompetitorProgress(progress, domains.length);
+                } else if (data.results) {
+                    competitorAnalysisResults = data.results;
+                    renderCompetitorResults(data.results);
+                }
+            }
+            
+            fetch('/api/seo/competitor-analysis?stream=1', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
@@ -3894,14 +4584,27 @@ SHADCN_DASHBOARD_HTML = '''
                     max_pages: 50
                 })
             })
-            .then(function(response) { return response.json(); })
-            .then(function(data) {
-                if (data.error) {
-                    resultsContainer.innerHTML = '<p class="text-red-400">' + data.error + '</p>';
-                    return;
+            .then(function(response) {
+                if (!response.body || !window.TextDecoder) {
+                    return response.text().then(function(text) { text.split('\\n').forEach(handleLine); });
                 }
-                competitorAnalysisResults = data.results;
-                renderCompetitorResults(data.results);
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffered = '';
+                function pump() {
+                    return reader.read().then(function(chunk) {
+                        buffered += decoder.decode(chunk.value || new Uint8Array(), { stream: !chunk.done });
+                        const lines = buffered.split('\\n');
+                        buffered = lines.pop();
+                        lines.forEach(handleLine);
+                        if (chunk.done) {
+                            handleLine(buffered);
+                            return;
+                        }
+                        return pump();
+                    });
+                }
+                return pump();
             })
             .catch(function(error) {
                 console.error('Error in competitor analysis:', error);
@@ -3909,6 +4612,28 @@ SHADCN_DASHBOARD_HTML = '''
             });
         }
         
+        function renderCompetitorProgress(done, total) {
+            const parts = ['<div class="text-center py-8">',
+                '<i class="fas fa-spinner fa-spin text-3xl text-blue-400"></i>',
+                '<p class="text-slate-400 mt-3">Analyzed ', done.length, ' of ', total, ' competitors...</p>',
+                '<ul class="mt-4 space-y-1 text-sm">'];
+            done.forEach(function(site) {
+                parts.push(
+                    '<li class="', site.error ? 'text-red-400' : 'text-slate-300', '">',
+                        '<i class="fas ', site.error ? 'fa-times-circle' : 'fa-check-circle text-green-400', ' mr-2"></i>',
+                        site.domain, site.error ? ' (failed)' : ' - score ' + (site.seo_score || 0),
+                    '</li>'
+                );
+            });
+            parts.push('</ul></div>');
+            document.getElementById('competitorResults').innerHTML = parts.join('');
+        }
+        
+        const OPPORTUNITY_COLORS = {
+            high: 'bg-red-600/20 text-red-400 border-red-600/30',
+            medium: 'bg-amber-600/20 text-amber-400 border-amber-600/30'
+        };
+        
         function renderCompetitorResults(results) {
             const container = document.getElementById('competitorResults');
             const summary = results.summary || {};
@@ -3916,79 +4641,89 @@ SHADCN_DASHBOARD_HTML = '''
             const gaps = results.gap_analysis || {};
             const opportunities = results.opportunities || [];
             
-            let html = '';
+            const parts = [];
             
             // Summary section
             const statusColor = summary.status === 'good' ? 'text-green-400' : 
                               summary.status === 'moderate' ? 'text-amber-400' : 'text-red-400';
             
-            html += '<div class="mb-6 p-4 rounded-lg bg-gradient-to-br from-blue-900/30 to-slate-800 border border-blue-700/30">' +
-                '<h4 class="text-lg font-semibold text-slate-50 mb-3 flex items-center gap-2">' +
-                    '<i class="fas fa-trophy text-amber-400"></i>Competitive Position</h4>' +
-                '<div class="grid grid-cols-2 md:grid-cols-4 gap-4">' +
-                    '<div class="text-center"><div class="text-2xl font-bold text-blue-400">' + (summary.our_seo_score || 0) + '</div><div class="text-xs text-slate-400">Our Score</div></div>' +
-                    '<div class="text-center"><div class="text-2xl font-bold text-slate-300">' + (summary.avg_competitor_score || 0) + '</div><div class="text-xs text-slate-400">Avg Competitor</div></div>' +
-                    '<div class="text-center"><div class="text-2xl font-bold text-amber-400">' + (summary.our_rank || 'N/A') + '</div><div class="text-xs text-slate-400">Our Rank</div></div>' +
-                    '<div class="text-center"><div class="text-sm font-semibold ' + statusColor + '">' + (summary.our_position || 'Unknown') + '</div><div class="text-xs text-slate-400">Position</div></div>' +
-                '</div>';
+            parts.push(
+                '<div class="mb-6 p-4 rounded-lg bg-gradient-to-br from-blue-900/30 to-slate-800 border border-blue-700/30">',
+                '<h4 class="text-lg font-semibold text-slate-50 mb-3 flex items-center gap-2">',
+                    '<i class="fas fa-trophy text-amber-400"></i>Competitive Position</h4>',
+                '<div class="grid grid-cols-2 md:grid-cols-4 gap-4">',
+                    '<div class="text-center"><div class="text-2xl font-bold text-blue-400">', (summary.our_seo_score || 0), '</div><div class="text-xs text-slate-400">Our Score</div></div>',
+                    '<div class="text-center"><div class="text-2xl font-bold text-slate-300">', (summary.avg_competitor_score || 0), '</div><div class="text-xs text-slate-400">Avg Competitor</div></div>',
+                    '<div class="text-center"><div class="text-2xl font-bold text-amber-400">', (summary.our_rank || 'N/A'), '</div><div class="text-xs text-slate-400">Our Rank</div></div>',
+                    '<div class="text-center"><div class="text-sm font-semibold ', statusColor, '">', (summary.our_position || 'Unknown'), '</div><div class="text-xs text-slate-400">Position</div></div>',
+                '</div>'
+            );
             
             if (summary.key_insight) {
-                html += '<div class="mt-4 p-3 rounded-lg bg-slate-700/50">' +
-                    '<p class="text-sm text-slate-300"><i class="fas fa-lightbulb text-amber-400 mr-2"></i>' + summary.key_insight + '</p></div>';
+                parts.push(
+                    '<div class="mt-4 p-3 rounded-lg bg-slate-700/50">',
+                    '<p class="text-sm text-slate-300"><i class="fas fa-lightbulb text-amber-400 mr-2"></i>', summary.key_insight, '</p></div>'
+                );
             }
-            html += '</div>';
+            parts.push('</div>');
             
             // Opportunities
             if (opportunities.length > 0) {
-                html += '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-3 flex items-center gap-2">' +
-                    '<i class="fas fa-rocket text-green-400"></i>Opportunities</h4>' +
-                    '<div class="space-y-3">';
+                parts.push(
+                    '<div class="mb-6">',
+                    '<h4 class="text-base font-semibold text-slate-50 mb-3 flex items-center gap-2">',
+                    '<i class="fas fa-rocket text-green-400"></i>Opportunities</h4>',
+                    '<div class="space-y-3">'
+                );
                 
                 opportunities.slice(0, 5).forEach(function(opp) {
-                    const colorClass = opp.priority === 'high' ? 'bg-red-600/20 text-red-400 border-red-600/30' :
-                                     opp.priority === 'medium' ? 'bg-amber-600/20 text-amber-400 border-amber-600/30' :
-                                     'bg-blue-600/20 text-blue-400 border-blue-600/30';
+                    const colorClass = OPPORTUNITY_COLORS[opp.priority] || 'bg-blue-600/20 text-blue-400 border-blue-600/30';
                     
-                    html += '<div class="p-4 rounded-lg border ' + colorClass + '">' +
-                        '<div class="flex items-start justify-between mb-2">' +
-                            '<h5 class="font-medium text-slate-200">' + opp.title + '</h5>' +
-                            '<span class="text-xs px-2 py-1 rounded ' + colorClass + '">' + opp.priority + '</span>' +
-                        '</div>' +
-                        '<p class="text-sm text-slate-300 mb-2">' + opp.description + '</p>' +
-                        '<div class="flex gap-4 text-xs text-slate-400">' +
-                            '<span><i class="fas fa-bolt mr-1"></i>' + opp.impact + '</span>' +
-                            '<span><i class="fas fa-clock mr-1"></i>' + opp.effort + '</span>' +
-                        '</div>';
+                    parts.push(
+                        '<div class="p-4 rounded-lg border ', colorClass, '">',
+                            '<div class="flex items-start justify-between mb-2">',
+                                '<h5 class="font-medium text-slate-200">', opp.title, '</h5>',
+                                '<span class="text-xs px-2 py-1 rounded ', colorClass, '">', opp.priority, '</span>',
+                            '</div>',
+                            '<p class="text-sm text-slate-300 mb-2">', opp.description, '</p>',
+                            '<div class="flex gap-4 text-xs text-slate-400">',
+                                '<span><i class="fas fa-bolt mr-1"></i>', opp.impact, '</span>',
+                                '<span><i class="fas fa-clock mr-1"></i>', opp.effort, '</span>',
+                            '</div>'
+                    );
                     
                     if (opp.actions && opp.actions.length > 0) {
-                        html += '<ul class="mt-2 space-y-1">';
+                        parts.push('<ul class="mt-2 space-y-1">');
                         opp.actions.forEach(function(action) {
-                            html += '<li class="text-xs text-slate-400">• ' + action + '</li>';
+                            parts.push('<li class="text-xs text-slate-400">• ', action, '</li>');
                         });
-                        html += '</ul>';
+                        parts.push('</ul>');
                     }
-                    html += '</div>';
+                    parts.push('</div>');
                 });
-                html += '</div></div>';
+                parts.push('</div></div>');
             }
             
             // Gap Analysis
             if (gaps.keywords && gaps.keywords.length > 0) {
-                html += '<div class="mb-6">' +
-                    '<h4 class="text-base font-semibold text-slate-50 mb-3">Keyword Gaps</h4>' +
-                    '<div class="space-y-2">';
+                parts.push(
+                    '<div class="mb-6">',
+                    '<h4 class="text-base font-semibold text-slate-50 mb-3">Keyword Gaps</h4>',
+                    '<div class="space-y-2">'
+                );
                 
                 gaps.keywords.slice(0, 3).forEach(function(gap) {
-                    html += '<div class="p-3 rounded-lg bg-slate-700/30">' +
-                        '<p class="text-sm text-slate-300 mb-1">vs ' + gap.competitor + '</p>' +
-                        '<p class="text-xs text-slate-400">' + gap.recommendation + '</p>' +
-                    '</div>';
+                    parts.push(
+                        '<div class="p-3 rounded-lg bg-slate-700/30">',
+                            '<p class="text-sm text-slate-300 mb-1">vs ', gap.competitor, '</p>',
+                            '<p class="text-xs text-slate-400">', gap.recommendation, '</p>',
+                        '</div>'
+                    );
                 });
-                html += '</div></div>';
+                parts.push('</div></div>');
             }
             
-            container.innerHTML = html;
+            container.innerHTML = parts.join('');
         }
         
         // Enhanced Competitor Analysis Functions
@@ -4022,8 +4757,8 @@ SHADCN_DASHBOARD_HTML = '''
             
             // Hide form and show loading
             document.getElementById('competitorForm').classList.add('hidden');
-            document.getElementById('compDefaultState').classList.remove('hidden');
-            document.getElementById('compDefaultState').innerHTML = 
+            dom.compDefaultState.classList.remove('hidden');
+            dom.compDefaultState.innerHTML = 
                 '<div class="py-8">' +
                 '<i class="fas fa-spider fa-spin text-4xl text-blue-400 mb-4"></i>' +
                 '<p class="text-slate-300 font-medium">Crawling competitor websites...</p>' +
@@ -4042,11 +4777,11 @@ SHADCN_DASHBOARD_HTML = '''
             .then(function(response) { return response.json(); })
             .then(function(data) {
                 if (data.error) {
-                    document.getElementById('compDefaultState').innerHTML = 
+                    dom.compDefaultState.innerHTML = 
                         '<div class="py-8">' +
                         '<i class="fas fa-exclamation-triangle text-4xl text-red-400 mb-4"></i>' +
                         '<p class="text-red-400">' + data.error + '</p>' +
-                        '<button onclick="toggleCompetitorForm()" class="mt-4 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm">Try Again</button>' +
+                        '<button data-action="toggleCompetitorForm" class="mt-4 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm">Try Again</button>' +
                         '</div>';
                     return;
                 }
@@ -4055,142 +4790,176 @@ SHADCN_DASHBOARD_HTML = '''
             })
             .catch(function(error) {
                 console.error('Error:', error);
-                document.getElementById('compDefaultState').innerHTML = 
+                dom.compDefaultState.innerHTML = 
                     '<div class="py-8">' +
                     '<i class="fas fa-exclamation-triangle text-4xl text-red-400 mb-4"></i>' +
                     '<p class="text-red-400">Error analyzing competitors. Please try again.</p>' +
-                    '<button onclick="toggleCompetitorForm()" class="mt-4 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm">Try Again</button>' +
+                    '<button data-action="toggleCompetitorForm" class="mt-4 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm">Try Again</button>' +
                     '</div>';
             });
         }
         
         function renderCompetitorUrlResults(data) {
-            // Hide default state
-            document.getElementById('compDefaultState').classList.add('hidden');
-            
-            // Show all result sections
-            document.getElementById('compSummaryCards').classList.remove('hidden');
-            document.getElementById('compCharts').classList.remove('hidden');
-            document.getElementById('compAdvantages').classList.remove('hidden');
-            document.getElementById('compRecommendations').classList.remove('hidden');
-            
-            // Update summary cards
             const summary = data.comparison_matrix?.summary || {};
-            document.getElementById('compPosition').textContent = summary.overall_position || 'Moderate';
-            document.getElementById('compLeading').textContent = (summary.leading_in || 0) + ' metrics';
-            document.getElementById('compCompetitive').textContent = (summary.competitive_in || 0) + ' metrics';
-            document.getElementById('compBehind').textContent = (summary.behind_in || 0) + ' metrics';
-            
-            // Render charts directly from API response
-            if (data.radar_chart) {
-                Plotly.newPlot('competitorRadarChart', data.radar_chart.data, {
-                    ...data.radar_chart.layout,
-                    height: 350
-                }, {responsive: true});
-            }
-            
-            if (data.gap_chart) {
-                Plotly.newPlot('competitorGapChart', data.gap_chart.data, {
-                    ...data.gap_chart.layout,
-                    height: 350
-                }, {responsive: true});
-            }
-            
-            // Render advantages
-            renderAdvantages(data.advantages);
             
-            // Render recommendations
-            renderRecommendations(data.recommendations);
+            // Every DOM write happens in one frame; the charts are only observed
+            // afterwards, so Plotly measures the already-revealed sections
+            requestAnimationFrame(function() {
+                // Hide default state
+                dom.compDefaultState.classList.add('hidden');
+                
+                // Show all result sections
+                dom.compSummaryCards.classList.remove('hidden');
+                dom.compCharts.classList.remove('hidden');
+                dom.compAdvantages.classList.remove('hidden');
+                dom.compRecommendations.classList.remove('hidden');
+                
+                // Update summary cards
+                dom.compPosition.textContent = summary.overall_position || 'Moderate';
+                dom.compLeading.textContent = (summary.leading_in || 0) + ' metrics';
+                dom.compCompetitive.textContent = (summary.competitive_in || 0) + ' metrics';
+                dom.compBehind.textContent = (summary.behind_in || 0) + ' metrics';
+                
+                // Render advantages
+                renderAdvantages(data.advantages);
+                
+                // Render recommendations
+                renderRecommendations(data.recommendations);
+                
+                // Render charts directly from API response
+                if (data.radar_chart) {
+                    whenVisible(dom.competitorRadarChart, function() {
+                        queueChart(function() {
+                            drawChart('competitorRadarChart', data.radar_chart.data, {
+                                ...data.radar_chart.layout,
+                                height: 350
+                            }, {responsive: true});
+                        });
+                    });
+                }
+                
+                if (data.gap_chart) {
+                    whenVisible(dom.competitorGapChart, function() {
+                        queueChart(function() {
+                            drawChart('competitorGapChart', data.gap_chart.data, {
+                                ...data.gap_chart.layout,
+                                height: 350
+                            }, {responsive: true});
+                        });
+                    });
+                }
+            });
         }
         
+        // Item wrappers and priority borders shared by the advantage and recommendation lists
+        const COMP_LEAD_ITEM = '<div class="p-2 rounded bg-green-900/30 text-sm">';
+        const COMP_LAG_ITEM = '<div class="p-2 rounded bg-red-900/30 text-sm">';
+        const REC_PRIORITY_COLORS = {
+            1: 'border-red-600/50 bg-red-900/20',
+            2: 'border-amber-600/50 bg-amber-900/20',
+            3: 'border-blue-600/50 bg-blue-900/20'
+        };
+        
         function renderAdvantages(advantages) {
-            const leadList = document.getElementById('compLeadList');
-            const lagList = document.getElementById('compLagList');
+            const leadList = dom.compLeadList;
+            const lagList = dom.compLagList;
             
             // Render where we lead
-            let leadHtml = '';
+            const lead = [];
             const adv = advantages?.advantages || advantages?.top_3_advantages || [];
             if (adv.length > 0) {
                 adv.forEach(function(item) {
-                    leadHtml += '<div class="p-2 rounded bg-green-900/30 text-sm">' +
-                        '<p class="text-green-300 font-medium">' + item.metric + '</p>' +
-                        '<p class="text-green-400/70 text-xs">' + item.description + '</p>' +
-                        '<p class="text-slate-400 text-xs mt-1"><i class="fas fa-arrow-right mr-1"></i>' + item.suggestion + '</p>' +
-                    '</div>';
+                    lead.push(
+                        COMP_LEAD_ITEM,
+                            '<p class="text-green-300 font-medium">', item.metric, '</p>',
+                            '<p class="text-green-400/70 text-xs">', item.description, '</p>',
+                            '<p class="text-slate-400 text-xs mt-1"><i class="fas fa-arrow-right mr-1"></i>', item.suggestion, '</p>',
+                        '</div>'
+                    );
                 });
             } else {
-                leadHtml = '<p class="text-slate-500 text-sm">No clear advantages identified yet.</p>';
+                lead.push('<p class="text-slate-500 text-sm">No clear advantages identified yet.</p>');
             }
-            leadList.innerHTML = leadHtml;
+            leadList.innerHTML = lead.join('');
             
             // Render where we lag
-            let lagHtml = '';
+            const lag = [];
             const disadv = advantages?.disadvantages || advantages?.top_3_weaknesses || [];
             if (disadv.length > 0) {
                 disadv.forEach(function(item) {
-                    lagHtml += '<div class="p-2 rounded bg-red-900/30 text-sm">' +
-                        '<p class="text-red-300 font-medium">' + item.metric + '</p>' +
-                        '<p class="text-red-400/70 text-xs">' + item.description + '</p>' +
-                        '<p class="text-slate-400 text-xs mt-1"><i class="fas fa-wrench mr-1"></i>' + item.suggestion + '</p>' +
-                    '</div>';
+                    lag.push(
+                        COMP_LAG_ITEM,
+                            '<p class="text-red-300 font-medium">', item.metric, '</p>',
+                            '<p class="text-red-400/70 text-xs">', item.description, '</p>',
+                            '<p class="text-slate-400 text-xs mt-1"><i class="fas fa-wrench mr-1"></i>', item.suggestion, '</p>',
+                        '</div>'
+                    );
                 });
             } else {
-                lagHtml = '<p class="text-slate-500 text-sm">No significant gaps identified.</p>';
+                lag.push('<p class="text-slate-500 text-sm">No significant gaps identified.</p>');
             }
-            lagList.innerHTML = lagHtml;
+            lagList.innerHTML = lag.join('');
         }
         
         function renderRecommendations(recommendations) {
-            const container = document.getElementById('compRecList');
-            let html = '';
+            const container = dom.compRecList;
+            const parts = [];
             
             if (recommendations && recommendations.length > 0) {
-                recommendations.slice(0, 6).forEach(function(rec, idx) {
-                    const priorityColors = {
-                        1: 'border-red-600/50 bg-red-900/20',
-                        2: 'border-amber-600/50 bg-amber-900/20',
-                        3: 'border-blue-600/50 bg-blue-900/20'
-                    };
-                    const colorClass = priorityColors[rec.priority] || priorityColors[3];
+                recommendations.slice(0, 6).forEach(function(rec) {
+                    const colorClass = REC_PRIORITY_COLORS[rec.priority] || REC_PRIORITY_COLORS[3];
                     
-                    html += '<div class="p-4 rounded-lg border ' + colorClass + '">' +
-                        '<div class="flex items-start justify-between">' +
-                            '<div class="flex-1">' +
-                                '<div class="flex items-center gap-2 mb-1">' +
-                                    '<span class="text-xs px-2 py-0.5 rounded bg-slate-700 text-slate-300">Priority ' + rec.priority + '</span>' +
-                                    '<span class="text-xs text-slate-400">' + rec.category + '</span>' +
-                                '</div>' +
-                                '<h5 class="text-slate-200 font-medium">' + rec.metric + '</h5>' +
-                                '<p class="text-sm text-slate-400 mt-1">' + rec.action + '</p>' +
-                            '</div>' +
-                        '</div>' +
-                        '<div class="flex gap-4 mt-3 text-xs text-slate-500">' +
-                            '<span><i class="fas fa-clock mr-1"></i>' + (rec.effort || 'TBD') + '</span>' +
-                            '<span><i class="fas fa-calendar mr-1"></i>' + (rec.timeline || 'TBD') + '</span>' +
-                            '<span><i class="fas fa-chart-line mr-1"></i>' + (rec.expected_impact || 'Significant') + '</span>' +
-                        '</div>' +
-                    '</div>';
+                    parts.push(
+                        '<div class="p-4 rounded-lg border ', colorClass, '">',
+                            '<div class="flex items-start justify-between">',
+                                '<div class="flex-1">',
+                                    '<div class="flex items-center gap-2 mb-1">',
+                                        '<span class="text-xs px-2 py-0.5 rounded bg-slate-700 text-slate-300">Priority ', rec.priority, '</span>',
+                                        '<span class="text-xs text-slate-400">', rec.category, '</span>',
+                                    '</div>',
+                                    '<h5 class="text-slate-200 font-medium">', rec.metric, '</h5>',
+                                    '<p class="text-sm text-slate-400 mt-1">', rec.action, '</p>',
+                                '</div>',
+                            '</div>',
+                            '<div class="flex gap-4 mt-3 text-xs text-slate-500">',
+                                '<span><i class="fas fa-clock mr-1"></i>', (rec.effort || 'TBD'), '</span>',
+                                '<span><i class="fas fa-calendar mr-1"></i>', (rec.timeline || 'TBD'), '</span>',
+                                '<span><i class="fas fa-chart-line mr-1"></i>', (rec.expected_impact || 'Significant'), '</span>',
+                            '</div>',
+                        '</div>'
+                    );
                 });
             } else {
-                html = '<p class="text-slate-500 text-sm">No recommendations available yet.</p>';
+                parts.push('<p class="text-slate-500 text-sm">No recommendations available yet.</p>');
             }
             
-            container.innerHTML = html;
+            container.innerHTML = parts.join('');
         }
         
         // Mind Map Functions
         let mindmapInitialized = false;
         
+        const MINDMAP_CONFIG = {
+            responsive: true,
+            displayModeBar: true,
+            modeBarButtonsToRemove: ['lasso2d', 'select2d'],
+            displaylogo: false
+        };
+        
         function initMindmapCharts() {
             // Initialize with radial view by default
-            renderMindmapView('radial');
+            queueChart(function() {
+                renderMindmapView('radial');
+            });
             
             // Treemap chart
             if (treemapData && Object.keys(treemapData).length > 0) {
-                Plotly.newPlot('treemapChart', treemapData.data, {
-                    ...treemapData.layout,
-                    height: 230
-                }, {responsive: true});
+                queueChart(function() {
+                    drawChart('treemapChart', treemapData.data, {
+                        ...treemapData.layout,
+                        height: 230
+                    }, {responsive: true});
+                });
             }
             
             mindmapInitialized = true;
@@ -4200,9 +4969,6 @@ SHADCN_DASHBOARD_HTML = '''
             const container = document.getElementById('mindmapGraph');
             if (!container) return;
             
-            // Clear existing plot
-            Plotly.purge('mindmapGraph');
-            
             // Select data based on view
             let data, layout;
             
@@ -4232,13 +4998,8 @@ SHADCN_DASHBOARD_HTML = '''
                 return;
             }
             
-            // Render the selected view
-            Plotly.newPlot('mindmapGraph', data, layout, {
-                responsive: true,
-                displayModeBar: true,
-                modeBarButtonsToRemove: ['lasso2d', 'select2d'],
-                displaylogo: false
-            });
+            // Render the selected view; switching views diffs into the existing plot
+            drawChart('mindmapGraph', data, layout, MINDMAP_CONFIG);
             
             currentMindmapView = view;
         }
@@ -4299,10 +5060,10 @@ SHADCN_DASHBOARD_HTML = '''
                 return trace;
             });
             
-            Plotly.react('mindmapGraph', filteredData, {
+            drawChart('mindmapGraph', filteredData, {
                 ...currentData.layout,
                 height: 580
-            });
+            }, MINDMAP_CONFIG);
         }
         
         function resetMindmapView() {
@@ -4338,91 +5099,408 @@ SHADCN_DASHBOARD_HTML = '''
             btn.innerHTML = isDark ? '<i class="fas fa-moon"></i>' : '<i class="fas fa-sun"></i>';
         }
         
-        function toggleSection(btn) {
-            const content = btn.nextElementSibling;
-            const icon = btn.querySelector('.section-icon');
-            content.classList.toggle('hidden');
-            icon.style.transform = content.classList.contains('hidden') ? 'rotate(0deg)' : 'rotate(180deg)';
+        function toggleSection(btn) {
+            const content = btn.nextElementSibling;
+            const icon = btn.querySelector('.section-icon');
+            content.classList.toggle('hidden');
+            icon.style.transform = content.classList.contains('hidden') ? 'rotate(0deg)' : 'rotate(180deg)';
+        }
+        
+        function refreshData() {
+            window.location.href = '/?refresh=1';
+        }
+        
+        function resetNetworkView() {
+            const chartId = document.getElementById('networkGraphFull') ? 'networkGraphFull' : 'networkGraphOverview';
+            Plotly.relayout(chartId, {
+                'xaxis.autorange': true,
+                'yaxis.autorange': true
+            });
+        }
+        
+        function zoomIn() {
+            // Simplified zoom
+            console.log('Zoom in');
+        }
+        
+        function zoomOut() {
+            // Simplified zoom
+            console.log('Zoom out');
+        }
+        
+        function exportNetworkPNG() {
+            Plotly.downloadImage('networkGraphFull', {
+                format: 'png',
+                width: 1200,
+                height: 800,
+                filename: 'tsm_network_graph'
+            });
+        }
+        
+        // Data table: rows are fetched as NDJSON when the tab is first opened
+        // and only the rows in view are rendered, between two spacer rows
+        // that keep the scroll height.
+        const TABLE_ROW_HEIGHT = 44;
+        const TABLE_OVERSCAN = 10;
+        
+        let tableRows = [];
+        let rowOrder = [];
+        let rowNodeCache = [];
+        // The view holds row indices: the current sort order, minus rows
+        // rejected by the filters (matches[i] === 0).
+        const tableVirtualizer = {
+            view: rowOrder,
+            matches: null,
+            start: -1,
+            end: -1,
+            frame: null
+        };
+        let tableFilterTimer = null;
+        let tableRowsRequest = null;
+        
+        function initDataTable() {
+            const scroller = document.getElementById('tableScroller');
+            scroller.addEventListener('scroll', scheduleTableRender, { passive: true });
+            window.addEventListener('resize', scheduleTableRender, { passive: true });
+            document.getElementById('tableSearch').addEventListener('input', filterTable);
+            document.getElementById('depthFilter').addEventListener('change', function() {
+                requestAnimationFrame(applyTableFilters);
+            });
+            document.getElementById('statusFilter').addEventListener('change', function() {
+                requestAnimationFrame(applyTableFilters);
+            });
+        }
+        
+        function loadTableRows() {
+            if (tableRowsRequest) return tableRowsRequest;
+            
+            tableRowsRequest = fetch('/api/rows.ndjson')
+                .then(function(response) { return response.text(); })
+                .then(function(text) {
+                    // Each line: [url, title, depth, child_count, status_code, url_disp, title_disp, status_class]
+                    const rows = [];
+                    text.split('\\n').forEach(function(line) {
+                        if (!line) return;
+                        const f = JSON.parse(line);
+                        rows.push({
+                            url: f[0], title: f[1], depth: f[2], child_count: f[3], status_code: f[4],
+                            url_disp: f[5], title_disp: f[6], status_class: f[7]
+                        });
+                    });
+                    setTableRows(rows);
+                })
+                .catch(function(error) {
+                    tableRowsRequest = null;
+                    console.error('Error loading table data:', error);
+                    showNotification('Error loading table data. Please try again.', 'error');
+                });
+            return tableRowsRequest;
+        }
+        
+        // Row indices bucketed by depth and by status code, for the facet filters
+        let rowsByDepth = new Map();
+        let rowsByStatus = new Map();
+        
+        function bucketRows(keys) {
+            const buckets = new Map();
+            for (let i = 0; i < keys.length; i++) {
+                if (!buckets.has(keys[i])) buckets.set(keys[i], []);
+                buckets.get(keys[i]).push(i);
+            }
+            buckets.forEach(function(indices, key) {
+                buckets.set(key, Uint32Array.from(indices));
+            });
+            return buckets;
+        }
+        
+        function markBucket(mask, bucket, flag) {
+            if (!bucket) return;
+            for (let i = 0; i < bucket.length; i++) {
+                mask[bucket[i]] |= flag;
+            }
         }
         
-        function refreshData() {
-            window.location.href = '/?refresh=1';
+        function setTableRows(rows) {
+            tableRows = rows;
+            rowOrder = Array.from(rows.keys());
+            rowNodeCache = [];
+            sortKeys = buildSortKeys(rows);
+            rowsByDepth = bucketRows(sortKeys[2]);
+            rowsByStatus = bucketRows(sortKeys[4]);
+            sortOrderCache.clear();
+            searchIndex = null;
+            lastSearch = { query: '', result: null };
+            document.getElementById('totalCount').textContent = rows.length;
+            applyTableFilters();
         }
         
-        function resetNetworkView() {
-            const chartId = document.getElementById('networkGraphFull') ? 'networkGraphFull' : 'networkGraphOverview';
-            Plotly.relayout(chartId, {
-                'xaxis.autorange': true,
-                'yaxis.autorange': true
+        function scheduleTableRender() {
+            if (tableVirtualizer.frame) return;
+            tableVirtualizer.frame = requestAnimationFrame(function() {
+                tableVirtualizer.frame = null;
+                renderTableWindow(false, readTableViewport());
             });
         }
         
-        function zoomIn() {
-            // Simplified zoom
-            console.log('Zoom in');
+        // Layout reads happen here, before any DOM writes in the same frame.
+        function readTableViewport() {
+            const scroller = document.getElementById('tableScroller');
+            // Hidden tabs report a zero height; fall back to the scroller's max height.
+            return { scrollTop: scroller.scrollTop, height: scroller.clientHeight || 600 };
         }
         
-        function zoomOut() {
-            // Simplified zoom
-            console.log('Zoom out');
+        function renderTableWindow(force, viewport) {
+            const view = tableVirtualizer.view;
+            const viewportHeight = viewport.height;
+            const first = Math.floor(viewport.scrollTop / TABLE_ROW_HEIGHT);
+            const start = Math.max(0, first - TABLE_OVERSCAN);
+            const end = Math.min(view.length, first + Math.ceil(viewportHeight / TABLE_ROW_HEIGHT) + TABLE_OVERSCAN);
+            
+            if (!force && start === tableVirtualizer.start && end === tableVirtualizer.end) return;
+            tableVirtualizer.start = start;
+            tableVirtualizer.end = end;
+            
+            const frag = document.createDocumentFragment();
+            frag.appendChild(spacerRow('spacer-top', start * TABLE_ROW_HEIGHT));
+            for (let i = start; i < end; i++) {
+                frag.appendChild(buildRow(view[i]));
+            }
+            frag.appendChild(spacerRow('spacer-bottom', (view.length - end) * TABLE_ROW_HEIGHT));
+            document.getElementById('dataTableBody').replaceChildren(frag);
         }
         
-        function exportNetworkPNG() {
-            Plotly.downloadImage('networkGraphFull', {
-                format: 'png',
-                width: 1200,
-                height: 800,
-                filename: 'tsm_network_graph'
-            });
+        function spacerRow(className, height) {
+            const tr = document.createElement('tr');
+            tr.className = className;
+            tr.style.height = height + 'px';
+            return tr;
         }
         
         function filterTable() {
-            const search = document.getElementById('tableSearch').value.toLowerCase();
+            clearTimeout(tableFilterTimer);
+            tableFilterTimer = setTimeout(function() {
+                requestAnimationFrame(applyTableFilters);
+            }, 100);
+        }
+        
+        function applyTableFilters() {
+            // Reads first...
+            const rawSearch = document.getElementById('tableSearch').value;
+            const search = rawSearch.trim().toLowerCase();
             const depthFilter = document.getElementById('depthFilter').value;
             const statusFilter = document.getElementById('statusFilter').value;
-            
-            const rows = document.querySelectorAll('#dataTableBody tr');
-            let visibleCount = 0;
-            
-            rows.forEach(row => {
-                const text = row.textContent.toLowerCase();
-                const depth = row.dataset.depth;
-                const status = row.dataset.status;
-                
-                const matchSearch = text.includes(search);
-                const matchDepth = !depthFilter || depth === depthFilter;
-                const matchStatus = !statusFilter || status === statusFilter;
-                
-                if (matchSearch && matchDepth && matchStatus) {
-                    row.style.display = '';
-                    visibleCount++;
+            const viewport = readTableViewport();
+            
+            // Each active facet sets its own bit; a row matches when it has all of them.
+            let matches = null;
+            if (search || depthFilter || statusFilter) {
+                matches = new Uint8Array(tableRows.length);
+                let required = 0;
+                if (search) {
+                    required |= 1;
+                    searchRows(search).forEach(function(i) { matches[i] |= 1; });
+                }
+                if (depthFilter) {
+                    required |= 2;
+                    markBucket(matches, rowsByDepth.get(Number(depthFilter)), 2);
+                }
+                if (statusFilter) {
+                    required |= 4;
+                    markBucket(matches, rowsByStatus.get(Number(statusFilter)), 4);
+                }
+                for (let i = 0; i < matches.length; i++) {
+                    matches[i] = matches[i] === required ? 1 : 0;
+                }
+            }
+            tableVirtualizer.matches = matches;
+            updateTableView();
+            
+            // ...then writes
+            saveTableFilters(rawSearch.trim(), depthFilter, statusFilter);
+            document.getElementById('filteredCount').textContent = tableVirtualizer.view.length;
+            document.getElementById('tableScroller').scrollTop = 0;
+            renderTableWindow(true, { scrollTop: 0, height: viewport.height });
+        }
+        
+        // Table filters live in the query string (?q=&depth=&status=) so a
+        // reload or shared link opens the Data tab already filtered.
+        const TABLE_URL_PARAMS = { q: 'tableSearch', depth: 'depthFilter', status: 'statusFilter' };
+        
+        function restoreTableFilters() {
+            const params = new URLSearchParams(window.location.search);
+            let restored = false;
+            Object.keys(TABLE_URL_PARAMS).forEach(function(name) {
+                const value = params.get(name);
+                if (value) {
+                    document.getElementById(TABLE_URL_PARAMS[name]).value = value;
+                    restored = true;
+                }
+            });
+            if (restored) {
+                document.querySelector('.tab-btn[data-tab="data"]').click();
+            }
+        }
+        
+        function saveTableFilters(search, depth, status) {
+            const params = new URLSearchParams(window.location.search);
+            const values = { q: search, depth: depth, status: status };
+            Object.keys(values).forEach(function(name) {
+                if (values[name]) {
+                    params.set(name, values[name]);
                 } else {
-                    row.style.display = 'none';
+                    params.delete(name);
                 }
             });
+            const query = params.toString();
+            history.replaceState(null, '', window.location.pathname + (query ? '?' + query : '') + window.location.hash);
+        }
+        
+        // Trigram index over the lowercased URL and title of every row,
+        // built on the first search. Postings are ascending row indices.
+        let searchIndex = null;
+        let lastSearch = { query: '', result: null };
+        
+        function addTrigrams(index, text, row) {
+            for (let i = 0; i + 3 <= text.length; i++) {
+                const gram = text.substr(i, 3);
+                const postings = index.get(gram);
+                if (!postings) {
+                    index.set(gram, [row]);
+                } else if (postings[postings.length - 1] !== row) {
+                    postings.push(row);
+                }
+            }
+        }
+        
+        function buildSearchIndex() {
+            const index = new Map();
+            for (let i = 0; i < tableRows.length; i++) {
+                addTrigrams(index, sortKeys[0][i], i);
+                addTrigrams(index, sortKeys[1][i], i);
+            }
+            return index;
+        }
+        
+        function intersectSorted(a, b) {
+            const result = [];
+            let i = 0;
+            let j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] < b[j]) {
+                    i++;
+                } else if (a[i] > b[j]) {
+                    j++;
+                } else {
+                    result.push(a[i]);
+                    i++;
+                    j++;
+                }
+            }
+            return result;
+        }
+        
+        // Text search matches URL and title only; depth and status are
+        // narrowed with the facet filters instead.
+        function searchRows(query) {
+            let candidates;
+            if (lastSearch.result && query.startsWith(lastSearch.query)) {
+                // Extending the previous query can only narrow its matches.
+                candidates = lastSearch.result;
+            } else if (query.length >= 3) {
+                if (!searchIndex) searchIndex = buildSearchIndex();
+                const lists = [];
+                for (let i = 0; i + 3 <= query.length; i++) {
+                    lists.push(searchIndex.get(query.substr(i, 3)) || []);
+                }
+                lists.sort(function(a, b) { return a.length - b.length; });
+                candidates = lists.reduce(intersectSorted);
+            } else {
+                candidates = rowOrder;
+            }
             
-            document.getElementById('visibleCount').textContent = visibleCount;
+            const result = candidates.filter(function(i) {
+                return sortKeys[0][i].includes(query) || sortKeys[1][i].includes(query);
+            });
+            lastSearch = { query: query, result: result };
+            return result;
         }
         
-        let sortDirection = {};
-        function sortTable(columnIndex) {
-            const tbody = document.getElementById('dataTableBody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
+        const rowTemplate = document.getElementById('rowTemplate').content.firstElementChild;
+        // Fully styled badge per status class; rows clone one and append the code
+        const STATUS_BADGES = {};
+        Array.from(document.getElementById('statusBadgeTemplates').content.children).forEach(function(badge) {
+            STATUS_BADGES[badge.dataset.statusClass] = badge;
+        });
+        
+        function buildRow(index) {
+            let tr = rowNodeCache[index];
+            if (tr) return tr;
             
-            sortDirection[columnIndex] = !sortDirection[columnIndex];
-            const dir = sortDirection[columnIndex] ? 1 : -1;
+            const row = tableRows[index];
+            tr = rowTemplate.cloneNode(true);
+            const cells = tr.cells;
             
-            rows.sort((a, b) => {
-                let aVal = a.cells[columnIndex].textContent.trim();
-                let bVal = b.cells[columnIndex].textContent.trim();
-                
-                if (!isNaN(aVal) && !isNaN(bVal)) {
-                    return (parseFloat(aVal) - parseFloat(bVal)) * dir;
-                }
-                return aVal.localeCompare(bVal) * dir;
-            });
+            const link = cells[0].firstElementChild;
+            link.href = row.url;
+            link.title = row.url;
+            link.textContent = row.url_disp;
             
-            rows.forEach(row => tbody.appendChild(row));
+            cells[1].title = row.title;
+            cells[1].textContent = row.title_disp;
+            cells[2].firstElementChild.textContent = row.depth;
+            cells[3].textContent = row.child_count;
+            
+            const badge = STATUS_BADGES[row.status_class].cloneNode(true);
+            badge.append(String(row.status_code));
+            cells[4].appendChild(badge);
+            
+            rowNodeCache[index] = tr;
+            return tr;
+        }
+        
+        // Sort keys are extracted once; strings are lowercased so the
+        // comparator is a plain < / > compare, numbers live in typed arrays.
+        let sortKeys = buildSortKeys(tableRows);
+        function buildSortKeys(rows) {
+            return [
+                rows.map(function(row) { return row.url.toLowerCase(); }),
+                rows.map(function(row) { return row.title.toLowerCase(); }),
+                Int32Array.from(rows, function(row) { return row.depth; }),
+                Int32Array.from(rows, function(row) { return row.child_count; }),
+                Int32Array.from(rows, function(row) { return row.status_code; })
+            ];
+        }
+        const sortOrderCache = new Map();
+        const sortState = { column: null, dir: 1 };
+        
+        function sortTable(columnIndex) {
+            sortState.dir = sortState.column === columnIndex ? -sortState.dir : 1;
+            sortState.column = columnIndex;
+            updateTableView();
+            requestAnimationFrame(function() {
+                renderTableWindow(true, readTableViewport());
+            });
+        }
+        
+        function getSortOrder(column, dir) {
+            const cacheKey = column + ':' + dir;
+            let order = sortOrderCache.get(cacheKey);
+            if (!order) {
+                const keys = sortKeys[column];
+                order = rowOrder.slice().sort(function(a, b) {
+                    if (keys[a] < keys[b]) return -dir;
+                    if (keys[a] > keys[b]) return dir;
+                    return a - b;
+                });
+                sortOrderCache.set(cacheKey, order);
+            }
+            return order;
+        }
+        
+        function updateTableView() {
+            const order = sortState.column === null ? rowOrder : getSortOrder(sortState.column, sortState.dir);
+            const matches = tableVirtualizer.matches;
+            tableVirtualizer.view = matches ? order.filter(function(i) { return matches[i]; }) : order;
         }
     </script>
 </body>
@@ -4430,59 +5508,737 @@ SHADCN_DASHBOARD_HTML = '''
 '''
 
 
+# ---------------------------------------------------------------------------
+# Lazy-loaded Tab Partials
+# ---------------------------------------------------------------------------
+
+TAB_NETWORK_HTML = '''
+<div class="{{ CARD }} p-6">
+    <div class="flex items-center justify-between mb-4">
+        <h3 class="text-lg font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('project-diagram', 'text-blue-400') }}
+            Interactive Network Visualization
+        </h3>
+        <div class="flex gap-2">
+            <button onclick="zoomIn()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+                {{ icon('search-plus', 'mr-1') }} Zoom In
+            </button>
+            <button onclick="zoomOut()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+                {{ icon('search-minus', 'mr-1') }} Zoom Out
+            </button>
+            <button onclick="resetNetworkView()" class="px-3 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+                {{ icon('sync-alt', 'mr-1') }} Reset
+            </button>
+            <button onclick="exportNetworkPNG()" class="px-3 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm transition-colors">
+                {{ icon('download', 'mr-1') }} Export PNG
+            </button>
+        </div>
+    </div>
+    <div class="rounded-lg bg-slate-900 overflow-hidden" style="height: 600px;">
+        <div id="networkGraphFull" style="width: 100%; height: 100%;"></div>
+    </div>
+
+    <!-- Legend -->
+    <div class="flex flex-wrap gap-6 mt-4 p-4 rounded-lg bg-slate-700/30">
+        <div class="flex items-center gap-2">
+            <span class="w-4 h-4 rounded-full bg-blue-500"></span>
+            <span class="text-sm text-slate-300">Depth 0-1 (Homepage/Main)</span>
+        </div>
+        <div class="flex items-center gap-2">
+            <span class="w-4 h-4 rounded-full bg-purple-500"></span>
+            <span class="text-sm text-slate-300">Depth 2-3 (Section Pages)</span>
+        </div>
+        <div class="flex items-center gap-2">
+            <span class="w-4 h-4 rounded-full bg-pink-500"></span>
+            <span class="text-sm text-slate-300">Depth 4+ (Deep Pages)</span>
+        </div>
+        <div class="flex items-center gap-2 text-slate-400 text-sm">
+            {{ icon('info-circle') }}
+            Node size represents link count
+        </div>
+    </div>
+</div>
+'''
+
+
+TAB_STATISTICS_HTML = '''
+<!-- Charts Row -->
+<div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mb-6">
+    <!-- Depth Distribution -->
+    <div class="{{ CARD }} p-6">
+        <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+            {{ icon('chart-bar', 'text-blue-400') }}
+            Pages by Depth Level
+        </h3>
+        <div id="depthChart" style="height: 300px;"></div>
+    </div>
+
+    <!-- Section Distribution -->
+    <div class="{{ CARD }} p-6">
+        <h3 class="text-base font-semibold text-slate-50 mb-4 flex items-center gap-2">
+            {{ icon('chart-pie', 'text-purple-400') }}
+            Content Distribution
+        </h3>
+        <div id="sectionChart" style="height: 300px;"></div>
+    </div>
+</div>
+
+<!-- Metrics Cards -->
+<div class="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-6">
+    <div class="{{ CARD }} p-5 text-center">
+        <p class="text-3xl font-bold text-blue-400">{{ (stats.total_pages / (stats.max_depth + 1)) | round(1) }}</p>
+        <p class="text-sm text-slate-400 mt-1">Breadth (avg/depth)</p>
+    </div>
+    <div class="{{ CARD }} p-5 text-center">
+        <p class="text-3xl font-bold text-purple-400">0 - {{ stats.max_depth }}</p>
+        <p class="text-sm text-slate-400 mt-1">Depth Range</p>
+    </div>
+    <div class="{{ CARD }} p-5 text-center">
+        <p class="text-3xl font-bold text-amber-400">{{ stats.avg_links }}</p>
+        <p class="text-sm text-slate-400 mt-1">Link Density</p>
+    </div>
+    <div class="{{ CARD }} p-5 text-center">
+        <p class="text-3xl font-bold text-green-400">{{ ia_score.breakdown.connectivity_score }}%</p>
+        <p class="text-sm text-slate-400 mt-1">Connectivity</p>
+    </div>
+</div>
+
+<!-- Metrics Table -->
+<div class="{{ CARD }} overflow-hidden">
+    <div class="p-5 border-b border-slate-700">
+        <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('table', 'text-blue-400') }}
+            Detailed Metrics Comparison
+        </h3>
+    </div>
+    <div class="overflow-x-auto">
+        <table class="w-full">
+            <thead class="bg-slate-700/50">
+                <tr>
+                    <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Metric</th>
+                    <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Current</th>
+                    <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Best Practice</th>
+                    <th class="px-5 py-3 text-left text-xs font-semibold text-slate-300 uppercase tracking-wider">Status</th>
+                </tr>
+            </thead>
+            <tbody class="divide-y divide-slate-700">
+                <tr class="table-row-hover">
+                    <td class="px-5 py-4 text-sm font-medium text-slate-200">Max Depth</td>
+                    <td class="px-5 py-4 text-sm text-slate-300">{{ stats.max_depth }}</td>
+                    <td class="px-5 py-4 text-sm text-slate-400">≤ 4</td>
+                    <td class="px-5 py-4">
+                        {% if stats.max_depth <= 4 %}
+                        <span class="{{ PILL_GOOD }}">
+                            {{ icon('check') }} Good
+                        </span>
+                        {% else %}
+                        <span class="{{ PILL_WARN }}">
+                            {{ icon('exclamation') }} Review
+                        </span>
+                        {% endif %}
+                    </td>
+                </tr>
+                <tr class="table-row-hover">
+                    <td class="px-5 py-4 text-sm font-medium text-slate-200">Average Depth</td>
+                    <td class="px-5 py-4 text-sm text-slate-300">{{ stats.avg_depth }}</td>
+                    <td class="px-5 py-4 text-sm text-slate-400">≤ 3.0</td>
+                    <td class="px-5 py-4">
+                        {% if stats.avg_depth <= 3 %}
+                        <span class="{{ PILL_GOOD }}">
+                            {{ icon('check') }} Good
+                        </span>
+                        {% else %}
+                        <span class="{{ PILL_WARN }}">
+                            {{ icon('exclamation') }} Review
+                        </span>
+                        {% endif %}
+                    </td>
+                </tr>
+                <tr class="table-row-hover">
+                    <td class="px-5 py-4 text-sm font-medium text-slate-200">IA Score</td>
+                    <td class="px-5 py-4 text-sm text-slate-300">{{ ia_score.final_score }}/100</td>
+                    <td class="px-5 py-4 text-sm text-slate-400">≥ 75</td>
+                    <td class="px-5 py-4">
+                        {% if ia_score.final_score >= 75 %}
+                        <span class="{{ PILL_GOOD }}">
+                            {{ icon('check') }} {{ ia_score.health_status }}
+                        </span>
+                        {% elif ia_score.final_score >= 50 %}
+                        <span class="{{ PILL_WARN }}">
+                            {{ icon('exclamation') }} {{ ia_score.health_status }}
+                        </span>
+                        {% else %}
+                        <span class="{{ PILL_BAD }}">
+                            {{ icon('times') }} {{ ia_score.health_status }}
+                        </span>
+                        {% endif %}
+                    </td>
+                </tr>
+                <tr class="table-row-hover">
+                    <td class="px-5 py-4 text-sm font-medium text-slate-200">Orphan Pages</td>
+                    <td class="px-5 py-4 text-sm text-slate-300">{{ orphan_count }}</td>
+                    <td class="px-5 py-4 text-sm text-slate-400">0</td>
+                    <td class="px-5 py-4">
+                        {% if orphan_count == 0 %}
+                        <span class="{{ PILL_GOOD }}">
+                            {{ icon('check') }} Good
+                        </span>
+                        {% else %}
+                        <span class="{{ PILL_BAD }}">
+                            {{ icon('times') }} Fix Required
+                        </span>
+                        {% endif %}
+                    </td>
+                </tr>
+                <tr class="table-row-hover">
+                    <td class="px-5 py-4 text-sm font-medium text-slate-200">Dead Ends</td>
+                    <td class="px-5 py-4 text-sm text-slate-300">{{ dead_end_count }}</td>
+                    <td class="px-5 py-4 text-sm text-slate-400">< 10%</td>
+                    <td class="px-5 py-4">
+                        {% if dead_end_count < stats.total_pages * 0.1 %}
+                        <span class="{{ PILL_GOOD }}">
+                            {{ icon('check') }} Good
+                        </span>
+                        {% else %}
+                        <span class="{{ PILL_WARN }}">
+                            {{ icon('exclamation') }} Review
+                        </span>
+                        {% endif %}
+                    </td>
+                </tr>
+            </tbody>
+        </table>
+    </div>
+</div>
+'''
+
+
+TAB_AUDIT_HTML = '''
+<!-- Export Controls -->
+<div class="flex justify-end gap-2 mb-6">
+    <a href="/download-report" class="inline-flex items-center gap-2 px-4 py-2 rounded-lg bg-slate-700 hover:bg-slate-600 text-slate-300 text-sm transition-colors">
+        {{ icon('file-alt') }} Export TXT
+    </a>
+    <button onclick="window.print()" class="inline-flex items-center gap-2 px-4 py-2 rounded-lg bg-blue-600 hover:bg-blue-700 text-white text-sm transition-colors">
+        {{ icon('print') }} Print Report
+    </button>
+</div>
+
+<!-- Executive Summary -->
+<div class="{{ CARD }} mb-4 overflow-hidden">
+    <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
+        <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('clipboard-list', 'text-blue-400') }}
+            Executive Summary
+        </h3>
+        {{ icon('chevron-down', 'text-slate-400 transition-transform section-icon') }}
+    </button>
+    <div class="section-content px-5 pb-5">
+        <div class="grid grid-cols-2 lg:grid-cols-4 gap-4 mb-4">
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-blue-400">{{ ia_score.final_score }}/100</p>
+                <p class="text-xs text-slate-400 mt-1">IA Score</p>
+            </div>
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-slate-200">{{ stats.total_pages }}</p>
+                <p class="text-xs text-slate-400 mt-1">Total Pages</p>
+            </div>
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-slate-200">{{ stats.max_depth }}</p>
+                <p class="text-xs text-slate-400 mt-1">Max Depth</p>
+            </div>
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold {{ 'text-green-400' if ia_score.health_status in ['Excellent', 'Good'] else 'text-amber-400' }}">{{ ia_score.health_status }}</p>
+                <p class="text-xs text-slate-400 mt-1">Status</p>
+            </div>
+        </div>
+        <p class="text-sm text-slate-400">{{ ia_score.interpretation }}</p>
+    </div>
+</div>
+
+<!-- Critical Issues -->
+<div class="{{ CARD }} mb-4 overflow-hidden">
+    <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
+        <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('exclamation-circle', 'text-red-400') }}
+            Critical Issues ({{ orphan_count + dead_end_count + bottleneck_count }})
+        </h3>
+        {{ icon('chevron-down', 'text-slate-400 transition-transform section-icon') }}
+    </button>
+    <div class="section-content px-5 pb-5 hidden">
+        <div class="space-y-3">
+            {% if orphan_count > 0 %}
+            <div class="p-4 rounded-lg bg-red-500/10 border-l-4 border-red-500">
+                <p class="text-sm font-medium text-slate-200">{{ icon('unlink', 'mr-2 text-red-400') }}Orphan Pages: {{ orphan_count }}</p>
+                <p class="text-xs text-slate-400 mt-1">Pages with no inbound links. Add internal links to improve SEO.</p>
+            </div>
+            {% endif %}
+            {% if dead_end_count > 0 %}
+            <div class="p-4 rounded-lg bg-amber-500/10 border-l-4 border-amber-500">
+                <p class="text-sm font-medium text-slate-200">{{ icon('sign-out-alt', 'mr-2 text-amber-400') }}Dead-End Pages: {{ dead_end_count }}</p>
+                <p class="text-xs text-slate-400 mt-1">Pages with no outbound navigation. Add related links.</p>
+            </div>
+            {% endif %}
+            {% if bottleneck_count > 0 %}
+            <div class="p-4 rounded-lg bg-yellow-500/10 border-l-4 border-yellow-500">
+                <p class="text-sm font-medium text-slate-200">{{ icon('hourglass-half', 'mr-2 text-yellow-400') }}Navigation Bottlenecks: {{ bottleneck_count }}</p>
+                <p class="text-xs text-slate-400 mt-1">Pages requiring more than 3 clicks to reach.</p>
+            </div>
+            {% endif %}
+            {% if orphan_count == 0 and dead_end_count == 0 and bottleneck_count == 0 %}
+            <div class="p-4 rounded-lg bg-green-500/10 border-l-4 border-green-500">
+                <p class="text-sm font-medium text-slate-200">{{ icon('check-circle', 'mr-2 text-green-400') }}No Critical Issues Found!</p>
+                <p class="text-xs text-slate-400 mt-1">Your website structure is well-organized.</p>
+            </div>
+            {% endif %}
+        </div>
+    </div>
+</div>
+
+<!-- Recommendations -->
+<div class="{{ CARD }} mb-4 overflow-hidden">
+    <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
+        <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('lightbulb', 'text-yellow-400') }}
+            Recommendations
+        </h3>
+        {{ icon('chevron-down', 'text-slate-400 transition-transform section-icon') }}
+    </button>
+    <div class="section-content px-5 pb-5 hidden">
+        {% if recommendations.critical %}
+        <h4 class="text-sm font-semibold text-red-400 mb-3">{{ icon('fire', 'mr-2') }}Critical (Do This Week)</h4>
+        <div class="space-y-2 mb-4">
+            {% for rec in recommendations.critical %}
+            <div class="p-3 rounded-lg bg-slate-700/30">
+                <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-red-500/20 text-red-400 mb-2">Critical</span>
+                <p class="text-sm text-slate-300">{{ rec.action }}</p>
+                <p class="text-xs text-slate-500 mt-1">Effort: {{ rec.effort_estimate }} | Impact: {{ rec.expected_impact }}</p>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+
+        {% if recommendations.important %}
+        <h4 class="text-sm font-semibold text-amber-400 mb-3">{{ icon('exclamation-triangle', 'mr-2') }}Important (Do This Month)</h4>
+        <div class="space-y-2 mb-4">
+            {% for rec in recommendations.important %}
+            <div class="p-3 rounded-lg bg-slate-700/30">
+                <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-amber-500/20 text-amber-400 mb-2">Important</span>
+                <p class="text-sm text-slate-300">{{ rec.action }}</p>
+                <p class="text-xs text-slate-500 mt-1">Effort: {{ rec.effort_estimate }} | Difficulty: {{ rec.difficulty }}</p>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+
+        {% if recommendations.nice_to_have %}
+        <h4 class="text-sm font-semibold text-green-400 mb-3">{{ icon('star', 'mr-2') }}Nice to Have (Long Term)</h4>
+        <div class="space-y-2">
+            {% for rec in recommendations.nice_to_have %}
+            <div class="p-3 rounded-lg bg-slate-700/30">
+                <span class="inline-flex items-center rounded px-2 py-0.5 text-xs font-medium bg-green-500/20 text-green-400 mb-2">Enhancement</span>
+                <p class="text-sm text-slate-300">{{ rec.action }}</p>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+    </div>
+</div>
+
+<!-- Score Breakdown -->
+<div class="{{ CARD }} overflow-hidden">
+    <button onclick="toggleSection(this)" class="w-full flex items-center justify-between p-5 hover:bg-slate-700/50 transition-colors">
+        <h3 class="text-base font-semibold text-slate-50 flex items-center gap-2">
+            {{ icon('chart-line', 'text-green-400') }}
+            IA Score Breakdown
+        </h3>
+        {{ icon('chevron-down', 'text-slate-400 transition-transform section-icon') }}
+    </button>
+    <div class="section-content px-5 pb-5 hidden">
+        <div class="grid grid-cols-3 gap-4">
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-blue-400">{{ ia_score.breakdown.depth_score }}</p>
+                <p class="text-xs text-slate-400 mt-1">Depth Score</p>
+                <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
+                    <div class="h-full bg-blue-500" style="width: {{ ia_score.breakdown.depth_score }}%"></div>
+                </div>
+            </div>
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-purple-400">{{ ia_score.breakdown.balance_score }}</p>
+                <p class="text-xs text-slate-400 mt-1">Balance Score</p>
+                <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
+                    <div class="h-full bg-purple-500" style="width: {{ ia_score.breakdown.balance_score }}%"></div>
+                </div>
+            </div>
+            <div class="p-4 rounded-lg bg-slate-700/30 text-center">
+                <p class="text-2xl font-bold text-green-400">{{ ia_score.breakdown.connectivity_score }}</p>
+                <p class="text-xs text-slate-400 mt-1">Connectivity Score</p>
+                <div class="mt-2 h-1 rounded-full bg-slate-600 overflow-hidden">
+                    <div class="h-full bg-green-500" style="width: {{ ia_score.breakdown.connectivity_score }}%"></div>
+                </div>
+            </div>
+        </div>
+    </div>
+</div>
+'''
+
+TAB_PARTIALS = {
+    "network": TAB_NETWORK_HTML,
+    "statistics": TAB_STATISTICS_HTML,
+    "audit": TAB_AUDIT_HTML,
+}
+
+# Register the inline templates by name so Jinja compiles each one once and
+# keeps it in its template cache (render_template_string recompiles per call).
+app.jinja_loader = DictLoader({
+    "dashboard.html": SHADCN_DASHBOARD_HTML,
+    **{f"tabs/{name}.html": source for name, source in TAB_PARTIALS.items()},
+})
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
 
-@app.route("/")
-def dashboard_home():
-    """Main dashboard route."""
-    if request.args.get("refresh"):
-        refresh_dashboard_data()
+MONTH_LABELS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
-    data = get_dashboard_data()
-    df = data["df_crawl"]
+
+def build_page_growth_trend(total_pages: int, seed: str, current_month: int) -> Dict[str, Any]:
+    """Build the illustrative 12-month page trend shown in the Total Pages drilldown.
+
+    The series is seeded from the data ETag, so it is stable for a given crawl;
+    ``current_month`` (0 = January) picks the "this month" and projection figures.
+    """
+    rng = random.Random(seed)
+
+    historical = [
+        round(total_pages * (0.7 + i * 0.025 + rng.random() * 0.05))
+        for i in range(12)
+    ]
+    last_year = [round(value * (0.75 + rng.random() * 0.1)) for value in historical]
+
+    last_month_pages = historical[max(0, current_month - 1)]
+    this_month_pages = historical[current_month]
+    avg_monthly_growth = (historical[11] - historical[0]) / 12
+    growth_rate = (historical[11] - historical[0]) / historical[0] * 100 if historical[0] else 0.0
+
+    return {
+        "historical": historical,
+        "last_year": last_year,
+        "last_month_pages": last_month_pages,
+        "this_month_pages": this_month_pages,
+        "pages_added": max(0, round((this_month_pages - last_month_pages) * 0.8)),
+        "pages_removed": round(rng.random() * 3),
+        "growth_rate": f"{growth_rate:.1f}",
+        "avg_monthly_growth": avg_monthly_growth,
+        "projected_end_of_year": round(total_pages + avg_monthly_growth * (12 - current_month)),
+    }
+
+
+def build_template_context(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the template variables shared by the dashboard and its tab partials."""
     audit_data = data["audit_data"]
-    stats = data["stats"]
 
     ia_score = audit_data.get("ia_score", {
         "final_score": 0, "health_status": "Unknown", "interpretation": "",
         "breakdown": {"depth_score": 0, "balance_score": 0, "connectivity_score": 0}
     })
-    orphan_pages = audit_data.get("orphan_pages", [])
-    dead_ends = audit_data.get("dead_ends", [])
-    bottlenecks = audit_data.get("bottlenecks", [])
-    top_pages = audit_data.get("top_pages", [])
-    recommendations = audit_data.get("recommendations", {"critical": [], "important": [], "nice_to_have": []})
+
+    depth_summary = [
+        (depth, count, get_depth_color(int(depth)))
+        for depth, count in sorted(data["stats"].get("pages_by_depth", {}).items(), key=lambda item: int(item[0]))
+    ]
+
+    return {
+        "timestamp": data["timestamp"],
+        "stats": data["stats"],
+        "depth_summary": depth_summary,
+        "ia_score": ia_score,
+        "orphan_count": len(audit_data.get("orphan_pages", [])),
+        "dead_end_count": len(audit_data.get("dead_ends", [])),
+        "bottleneck_count": len(audit_data.get("bottlenecks", [])),
+        "top_pages": audit_data.get("top_pages", []),
+        "recommendations": audit_data.get("recommendations", {"critical": [], "important": [], "nice_to_have": []}),
+        "data_etag": data["etag"],
+    }
+
+
+DASHBOARD_CACHE_MAX_AGE = 60
+
+
+def client_has_etag(etag: str) -> bool:
+    """Whether the request's If-None-Match holds ``etag``.
+
+    Flask-Compress rewrites the ETag of a compressed response to
+    ``"<etag>:<algorithm>"``, so the suffixed form the browser sends back
+    counts as a match too.
+    """
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return True
+    for tag in if_none_match.as_set(include_weak=True):
+        base, _, algorithm = tag.rpartition(":")
+        if tag == etag or (base == etag and algorithm in app.config["COMPRESS_ALGORITHM"]):
+            return True
+    return False
+
+
+def cached_response(etag: str, render, mimetype: str = "text/html") -> Response:
+    """Return a 304 when the client already has this ETag, else render the body.
+
+    ``render`` may return a string or an iterable of chunks to stream.
+    """
+    if client_has_etag(etag):
+        response = Response(status=304)
+    else:
+        response = Response(render(), mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.max_age = DASHBOARD_CACHE_MAX_AGE
+    return response
+
+
+DASHBOARD_PAGE_CACHE_SIZE = 8
+_rendered_pages: "OrderedDict[str, str]" = OrderedDict()
+
+
+def dashboard_page_etag(etag: str) -> str:
+    """ETag of the dashboard page for the data with ETag ``etag``.
+
+    The page bakes in the current month's page growth figures, and inlines the
+    SEO preview once the analysis is cached, so both are part of the ETag and a
+    page rendered before either changes is not served afterwards.
+    """
+    page_etag = f"{etag}-{datetime.now():%Y%m}"
+    return f"{page_etag}-seo" if etag in _seo_dashboard_data else page_etag
+
+
+def stream_dashboard_page(etag: str) -> Iterator[str]:
+    """Stream the dashboard HTML for the currently loaded data (keyed by its page ETag).
+
+    The first render streams template chunks as Jinja produces them and keeps
+    the joined result, so later requests for the same ETag are served from memory.
+    """
+    cached = _rendered_pages.get(etag)
+    if cached is not None:
+        _rendered_pages.move_to_end(etag)
+        yield cached
+        return
+
+    chunks = []
+    for chunk in stream_template("dashboard.html", **build_dashboard_context()):
+        chunks.append(chunk)
+        yield chunk
+
+    _rendered_pages[etag] = "".join(chunks)
+    while len(_rendered_pages) > DASHBOARD_PAGE_CACHE_SIZE:
+        _rendered_pages.popitem(last=False)
+
+
+def build_dashboard_context() -> Dict[str, Any]:
+    """Build the full template context for the dashboard page."""
+    data = get_dashboard_data()
+    df = data["df_crawl"]
+    audit_data = data["audit_data"]
+    stats = data["stats"]
 
     network_graph_json = create_network_graph_plotly(df, max_nodes=80)
     depth_chart_json = create_depth_bar_chart(stats)
     section_chart_json = create_section_pie_chart(audit_data)
-    mindmap_json = create_mindmap_plotly(df, max_nodes=100)
-    tree_hierarchy_json = create_tree_hierarchy_plotly(df, max_nodes=100)
-    treemap_json = create_treemap_chart(df)
-
-    table_data = df.to_dict("records") if not df.empty else []
-
-    return render_template_string(
-        SHADCN_DASHBOARD_HTML,
-        timestamp=data["timestamp"],
-        stats=stats,
-        ia_score=ia_score,
-        orphan_count=len(orphan_pages),
-        dead_end_count=len(dead_ends),
-        bottleneck_count=len(bottlenecks),
-        top_pages=top_pages,
-        recommendations=recommendations,
-        network_graph_json=network_graph_json,
-        depth_chart_json=depth_chart_json,
-        section_chart_json=section_chart_json,
-        mindmap_json=mindmap_json,
-        tree_hierarchy_json=tree_hierarchy_json,
-        treemap_json=treemap_json,
-        table_data=table_data[:100],
-    )
+
+    context = {
+        **build_template_context(data),
+        "network_graph_json": network_graph_json,
+        "depth_chart_json": depth_chart_json,
+        "section_chart_json": section_chart_json,
+        "page_growth": build_page_growth_trend(
+            int(stats.get("total_pages", 0)), data["etag"], datetime.now().month - 1
+        ),
+    }
+    context["dashboard_stats"] = build_drilldown_stats(context)
+    context["drilldown_traces"] = build_drilldown_traces(context)
+    context.update(build_seo_preview(data["etag"]))
+    return context
+
+
+def build_drilldown_stats(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the figures the drilldown modals read from ``dashboardStats``."""
+    stats = context["stats"]
+    ia_score = context["ia_score"]
+    breakdown = ia_score.get("breakdown", {})
+
+    return {
+        "total_pages": int(stats.get("total_pages", 0)),
+        "avg_depth": float(stats.get("avg_depth", 0)),
+        "max_depth": int(stats.get("max_depth", 0)),
+        "avg_links": float(stats.get("avg_links", 0)),
+        "ia_score": float(ia_score.get("final_score", 0)),
+        "depth_score": float(breakdown.get("depth_score") or 70),
+        "balance_score": float(breakdown.get("balance_score") or 75),
+        "connectivity_score": float(breakdown.get("connectivity_score") or 80),
+        "health_status": ia_score.get("health_status", "Unknown"),
+        "orphan_count": context["orphan_count"],
+        "dead_end_count": context["dead_end_count"],
+        "bottleneck_count": context["bottleneck_count"],
+    }
+
+
+def build_drilldown_traces(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the Plotly traces the drilldown charts draw as-is (``drilldownTraces``)."""
+    page_growth = context["page_growth"]
+
+    return {
+        "total_pages": [
+            {
+                "x": MONTH_LABELS,
+                "y": page_growth["historical"],
+                "type": "scatter",
+                "mode": "lines+markers",
+                "name": "This Year",
+                "line": {"color": "#3B82F6", "width": 3},
+                "marker": {"color": "#3B82F6", "size": 8},
+                "fill": "tozeroy",
+                "fillcolor": "rgba(59, 130, 246, 0.1)",
+            },
+            {
+                "x": MONTH_LABELS,
+                "y": page_growth["last_year"],
+                "type": "scatter",
+                "mode": "lines+markers",
+                "name": "Last Year",
+                "line": {"color": "#64748B", "width": 2, "dash": "dot"},
+                "marker": {"color": "#64748B", "size": 6},
+            },
+        ],
+    }
+
+
+def build_mindmap_tab_data(data: Dict[str, Any]) -> Dict[str, str]:
+    """Build the chart JSON for the Mind Map tab."""
+    df = data["df_crawl"]
+    return {
+        "mindmap": create_mindmap_plotly(df, max_nodes=100),
+        "tree_hierarchy": create_tree_hierarchy_plotly(df, max_nodes=100),
+        "treemap": create_treemap_chart(df),
+    }
+
+
+# Tabs whose chart payloads are fetched when the tab is first opened
+TAB_DATA_BUILDERS = {
+    "mindmap": build_mindmap_tab_data,
+}
+
+
+# Colour classes shared with renderPriorityActions / renderTopKeywords in the page script
+SEO_PRIORITY_CLASSES = {
+    1: "bg-red-600/20 text-red-400 border-red-600/30",
+    2: "bg-amber-600/20 text-amber-400 border-amber-600/30",
+    3: "bg-blue-600/20 text-blue-400 border-blue-600/30",
+    4: "bg-slate-600/20 text-slate-400 border-slate-600/30",
+}
+SEO_KEYWORD_CLASSES = [
+    "bg-blue-600/30 text-blue-300",
+    "bg-green-600/30 text-green-300",
+    "bg-purple-600/30 text-purple-300",
+    "bg-amber-600/30 text-amber-300",
+    "bg-red-600/30 text-red-300",
+]
+
+
+SEO_DATA_CACHE_SIZE = 4
+_seo_dashboard_data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def get_seo_dashboard_data(etag: str) -> Dict[str, Any]:
+    """Run the SEO analysis once per loaded data set (keyed by its ETag)."""
+    seo_data = _seo_dashboard_data.get(etag)
+    if seo_data is not None:
+        _seo_dashboard_data.move_to_end(etag)
+        return seo_data
+
+    seo_data = _seo_dashboard_data[etag] = generate_seo_dashboard_data(str(CSV_FILE_PATH))
+    while len(_seo_dashboard_data) > SEO_DATA_CACHE_SIZE:
+        _seo_dashboard_data.popitem(last=False)
+    return seo_data
+
+
+def build_seo_preview(etag: str) -> Dict[str, Any]:
+    """Priority actions and top keywords rendered into the SEO tab on first paint.
+
+    Only filled in when the SEO analysis for this data is already cached, so
+    the dashboard never waits on (or fails with) the analysis; otherwise the
+    SEO tab keeps its placeholders and loads them from /api/seo/data.
+    """
+    seo_data = _seo_dashboard_data.get(etag)
+    if seo_data is None:
+        return {"seo_priority_actions": [], "seo_top_keywords": []}
+
+    actions = [
+        {**action, "color_class": SEO_PRIORITY_CLASSES.get(action.get("priority"), SEO_PRIORITY_CLASSES[4])}
+        for action in seo_data.get("priority_actions", [])[:5]
+    ]
+    keywords = []
+    for idx, keyword in enumerate(seo_data.get("metrics", {}).get("top_keywords", [])[:10]):
+        word, count = keyword if isinstance(keyword, (list, tuple)) else (keyword, 0)
+        keywords.append((word, count, SEO_KEYWORD_CLASSES[idx % len(SEO_KEYWORD_CLASSES)]))
+
+    return {"seo_priority_actions": actions, "seo_top_keywords": keywords}
+
+
+@lru_cache(maxsize=8)
+def render_tab_data(tab_name: str, etag: str) -> str:
+    """Serialise a tab's chart payload for the currently loaded data."""
+    charts = TAB_DATA_BUILDERS[tab_name](get_dashboard_data())
+    # The chart builders already return JSON strings, so splice them in as-is
+    return "{" + ", ".join(f"{json.dumps(key)}: {value}" for key, value in charts.items()) + "}"
+
+
+@lru_cache(maxsize=32)
+def render_dashboard_tab(tab_name: str, etag: str) -> str:
+    """Render a lazy-loaded tab partial for the currently loaded data."""
+    return render_template(f"tabs/{tab_name}.html", **build_template_context(get_dashboard_data()))
+
+
+@app.route("/")
+def dashboard_home():
+    """Main dashboard route."""
+    if request.args.get("refresh"):
+        refresh_dashboard_data()
+
+    page_etag = dashboard_page_etag(get_dashboard_data()["etag"])
+    return cached_response(page_etag, lambda: stream_with_context(stream_dashboard_page(page_etag)))
+
+
+@app.route("/tab/<tab_name>")
+def dashboard_tab(tab_name: str):
+    """Render a single dashboard tab on demand."""
+    if tab_name not in TAB_PARTIALS:
+        return jsonify({"error": f"Unknown tab: {tab_name}"}), 404
+
+    etag = get_dashboard_data()["etag"]
+    return cached_response(etag, lambda: render_dashboard_tab(tab_name, etag))
+
+
+@app.route("/api/tab/<tab_name>")
+def api_tab_data(tab_name: str):
+    """API endpoint for a tab's chart data, fetched when the tab is opened."""
+    if tab_name not in TAB_DATA_BUILDERS:
+        return jsonify({"error": f"Unknown tab: {tab_name}"}), 404
+
+    etag = get_dashboard_data()["etag"]
+    return cached_response(etag, lambda: render_tab_data(tab_name, etag), mimetype="application/json")
+
+
+@app.route("/api/rows.ndjson")
+def api_table_rows():
+    """API endpoint streaming every data table row as NDJSON (one JSON array per line)."""
+    data = get_dashboard_data()
+
+    def generate():
+        for row in build_table_rows(data["df_crawl"]):
+            yield json.dumps([row[field] for field in TABLE_ROW_FIELDS], ensure_ascii=False) + "\n"
+
+    return cached_response(data["etag"], generate, mimetype="application/x-ndjson")
 
 
 @app.route("/api/statistics")
@@ -4520,18 +6276,51 @@ def download_report():
     )
 
 
+def get_gzipped_csv_path() -> Path:
+    """Return a gzipped copy of the crawl CSV, rebuilding it when the CSV is newer."""
+    gz_path = CSV_FILE_PATH.with_name(CSV_FILE_PATH.name + ".gz")
+    if not gz_path.exists() or gz_path.stat().st_mtime < CSV_FILE_PATH.stat().st_mtime:
+        # Each rebuild writes its own temp file, so concurrent first downloads
+        # never interleave their output before the atomic replace
+        with tempfile.NamedTemporaryFile(dir=gz_path.parent, prefix=gz_path.name, suffix=".tmp", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                with open(CSV_FILE_PATH, "rb") as src, gzip.GzipFile(
+                    CSV_FILE_PATH.name, "wb", compresslevel=6, fileobj=tmp
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+            except BaseException:
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        tmp_path.replace(gz_path)
+    return gz_path
+
+
 @app.route("/download-data")
 def download_data():
     """Download crawl data as CSV."""
     if not CSV_FILE_PATH.exists():
         return jsonify({"error": "Data file not found"}), 404
 
-    return send_file(
-        CSV_FILE_PATH,
+    if request.accept_encodings["gzip"] <= 0:
+        return send_file(
+            CSV_FILE_PATH,
+            mimetype="text/csv",
+            as_attachment=True,
+            download_name="tsm_crawl_data.csv",
+        )
+
+    # Serve the pre-compressed copy; send_file responses bypass the compression hooks
+    response = send_file(
+        get_gzipped_csv_path(),
         mimetype="text/csv",
         as_attachment=True,
         download_name="tsm_crawl_data.csv",
     )
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/visualizations/mindmap")
@@ -4604,8 +6393,10 @@ def api_seo_data():
         }), 500
     
     try:
-        seo_data = generate_seo_dashboard_data(str(CSV_FILE_PATH))
-        return jsonify(seo_data)
+        etag = get_dashboard_data()["etag"]
+        return cached_response(
+            etag, lambda: app.json.dumps(get_seo_dashboard_data(etag)), mimetype="application/json"
+        )
     except Exception as e:
         logger.error(f"Error generating SEO data: {e}")
         return jsonify({
@@ -4644,26 +6435,32 @@ def api_seo_page_scores():
         return jsonify({"error": "SEO Analyzer module not available"}), 500
     
     try:
-        limit = request.args.get("limit", 20, type=int)
+        limit = request.args.get("limit", 20, type=int)  # 0 = all pages
         sort_by = request.args.get("sort", "asc")  # asc = worst first, desc = best first
         
-        analyzer = SEOAnalyzer(str(CSV_FILE_PATH))
-        page_scores = analyzer.get_individual_page_scores()
-        
-        # Sort based on parameter
-        if sort_by == "desc":
-            page_scores.reverse()  # Best first
-        
-        # Limit results
-        page_scores = page_scores[:limit]
+        def render() -> str:
+            analyzer = SEOAnalyzer(str(CSV_FILE_PATH))
+            page_scores = analyzer.get_individual_page_scores()
+            
+            # Sort based on parameter
+            if sort_by == "desc":
+                page_scores.reverse()  # Best first
+            
+            # Limit results
+            if limit > 0:
+                page_scores = page_scores[:limit]
+            
+            return app.json.dumps({
+                "success": True,
+                "total_pages": len(analyzer.df),
+                "pages": page_scores,
+                "sort_by": sort_by,
+                "limit": limit,
+            })
         
-        return jsonify({
-            "success": True,
-            "total_pages": len(analyzer.df),
-            "pages": page_scores,
-            "sort_by": sort_by,
-            "limit": limit,
-        })
+        # The scores only change with the crawl data, so a client holding this
+        # data's ETag gets a 304 without the pages being re-scored
+        return cached_response(get_dashboard_data()["etag"], render, mimetype="application/json")
     except Exception as e:
         logger.error(f"Error getting page scores: {e}")
         return jsonify({"error": str(e)}), 500
@@ -4684,6 +6481,23 @@ def api_seo_competitor_analysis():
             return jsonify({"error": "No competitors specified"}), 400
         
         analyzer = SEOAnalyzer(str(CSV_FILE_PATH))
+        
+        if request.args.get("stream"):
+            # NDJSON: one {"competitor": ...} line as each site finishes, then the report
+            def generate() -> Iterator[str]:
+                competitor_metrics = []
+                try:
+                    for metrics in analyzer.iter_competitor_metrics(competitors, max_pages):
+                        competitor_metrics.append(metrics)
+                        yield app.json.dumps({"competitor": metrics}) + "\n"
+                    results = analyzer.build_competitor_report(competitor_metrics)
+                    yield app.json.dumps({"success": True, "results": results}) + "\n"
+                except Exception as e:
+                    logger.error(f"Error in competitor analysis: {e}")
+                    yield app.json.dumps({"error": str(e)}) + "\n"
+            
+            return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+        
         results = analyzer.competitor_seo_analysis(competitors, max_pages)
         
         return jsonify({
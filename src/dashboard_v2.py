@@ -762,6 +762,10 @@ DASHBOARD_HTML = """
             background: var(--gray-800);
         }
         
+        .data-table tbody tr.row-hidden {
+            display: none;
+        }
+        
         .data-table .url-cell {
             max-width: 300px;
             overflow: hidden;
@@ -1456,7 +1460,7 @@ DASHBOARD_HTML = """
         <div class="tab-content" id="tab-data">
             <div class="data-table-container">
                 <div class="table-controls">
-                    <input type="text" class="search-input" id="tableSearch" placeholder="🔍 Search URLs, titles..." onkeyup="filterTable()">
+                    <input type="text" class="search-input" id="tableSearch" placeholder="🔍 Search URLs, titles..." oninput="scheduleFilterTable()">
                     <select class="filter-select" id="depthFilter" onchange="filterTable()">
                         <option value="">All Depths</option>
                         {% for depth in range(stats.max_depth + 1) %}
@@ -1591,17 +1595,37 @@ DASHBOARD_HTML = """
             header.parentElement.classList.toggle('expanded');
         }
         
-        // Table filtering
+        // Each row's lowercased text is cached on the row the first time the table
+        // is filtered; the rows are server-rendered, so it only changes with them
+        let tableRows = null;
+        function rebuildSearchIndex() {
+            tableRows = Array.from(document.querySelectorAll('#dataTable tbody tr'));
+            tableRows.forEach(row => {
+                row._searchText = row.textContent.toLowerCase();
+            });
+        }
+        
+        // Typing is coalesced into one filter pass per 50ms pause
+        let filterTimer = null;
+        function scheduleFilterTable() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(filterTable, 50);
+        }
+        
+        // Table filtering: every row is matched first (reads only), then the
+        // row-hidden class is flipped in a second pass (writes only)
         function filterTable() {
             const search = document.getElementById('tableSearch').value.toLowerCase();
             const depthFilter = document.getElementById('depthFilter').value;
             const statusFilter = document.getElementById('statusFilter').value;
             
-            const rows = document.querySelectorAll('#dataTable tbody tr');
+            if (!tableRows) rebuildSearchIndex();
+            const rows = tableRows;
+            const visible = new Uint8Array(rows.length);
             let visibleCount = 0;
             
-            rows.forEach(row => {
-                const text = row.textContent.toLowerCase();
+            rows.forEach((row, i) => {
+                const text = row._searchText;
                 const depth = row.dataset.depth;
                 const status = row.dataset.status;
                 
@@ -1610,39 +1634,41 @@ DASHBOARD_HTML = """
                 const matchStatus = !statusFilter || status === statusFilter;
                 
                 if (matchSearch && matchDepth && matchStatus) {
-                    row.style.display = '';
+                    visible[i] = 1;
                     visibleCount++;
-                } else {
-                    row.style.display = 'none';
                 }
             });
             
+            rows.forEach((row, i) => row.classList.toggle('row-hidden', !visible[i]));
             document.getElementById('showingCount').textContent = visibleCount;
         }
         
         // Table sorting
         let sortDirection = {};
+        const tableCollator = new Intl.Collator();
         function sortTable(columnIndex) {
             const table = document.getElementById('dataTable');
             const tbody = table.querySelector('tbody');
-            const rows = Array.from(tbody.querySelectorAll('tr'));
             
             sortDirection[columnIndex] = !sortDirection[columnIndex];
             const dir = sortDirection[columnIndex] ? 1 : -1;
             
-            rows.sort((a, b) => {
-                let aVal = a.cells[columnIndex].textContent.trim();
-                let bVal = b.cells[columnIndex].textContent.trim();
-                
-                // Check if numeric
-                if (!isNaN(aVal) && !isNaN(bVal)) {
-                    return (parseFloat(aVal) - parseFloat(bVal)) * dir;
+            // Read each cell once: [numeric value or null, text, row]
+            const keyed = Array.from(tbody.rows, row => {
+                const text = row.cells[columnIndex].textContent.trim();
+                return [text !== '' && !isNaN(text) ? parseFloat(text) : null, text, row];
+            });
+            
+            keyed.sort((a, b) => {
+                if (a[0] !== null && b[0] !== null) {
+                    return (a[0] - b[0]) * dir;
                 }
-                
-                return aVal.localeCompare(bVal) * dir;
+                return tableCollator.compare(a[1], b[1]) * dir;
             });
             
-            rows.forEach(row => tbody.appendChild(row));
+            const fragment = document.createDocumentFragment();
+            keyed.forEach(entry => fragment.appendChild(entry[2]));
+            tbody.appendChild(fragment);
         }
         
         // Refresh data
@@ -24,7 +24,7 @@ import statistics
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import pandas as pd
@@ -1398,8 +1398,46 @@ class SEOAnalyzer:
         Returns:
             Dictionary containing comparison matrix, gap analysis, and opportunities.
         """
+        competitor_metrics = list(self.iter_competitor_metrics(competitor_domains, max_pages))
+        return self.build_competitor_report(competitor_metrics)
+    
+    def iter_competitor_metrics(
+        self, competitor_domains: List[str], max_pages: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze competitor websites one at a time.
+        
+        Args:
+            competitor_domains: List of competitor domain URLs to analyze.
+            max_pages: Maximum pages to crawl per competitor (default 50).
+        
+        Yields:
+            Each competitor's metrics as soon as its analysis finishes. A failed
+            competitor yields its domain, the error and a score of 0.
+        """
         logger.info(f"Starting competitor SEO analysis for {len(competitor_domains)} competitors...")
         
+        for domain in competitor_domains:
+            try:
+                yield self._analyze_competitor(domain, max_pages)
+            except Exception as e:
+                logger.warning(f"Failed to analyze competitor {domain}: {e}")
+                yield {
+                    "domain": domain,
+                    "error": str(e),
+                    "seo_score": 0,
+                }
+    
+    def build_competitor_report(self, competitor_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compare our metrics with already-analyzed competitors.
+        
+        Args:
+            competitor_metrics: Metrics from iter_competitor_metrics().
+        
+        Returns:
+            Dictionary containing comparison matrix, gap analysis, and opportunities.
+        """
         # Our metrics (ensure we have them)
         self.calculate_overall_seo_score()
         
@@ -1417,20 +1455,6 @@ class SEOAnalyzer:
             "dead_ends": self.linking_analysis.get("dead_ends", 0),
         }
         
-        competitor_metrics = []
-        
-        for domain in competitor_domains:
-            try:
-                metrics = self._analyze_competitor(domain, max_pages)
-                competitor_metrics.append(metrics)
-            except Exception as e:
-                logger.warning(f"Failed to analyze competitor {domain}: {e}")
-                competitor_metrics.append({
-                    "domain": domain,
-                    "error": str(e),
-                    "seo_score": 0,
-                })
-        
         # Generate comparison matrix
         comparison_matrix = self._generate_comparison_matrix(our_metrics, competitor_metrics)
         
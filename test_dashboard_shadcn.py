@@ -0,0 +1,184 @@
+"""Tests for the shadcn dashboard routes."""
+import gzip
+import json
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("flask_compress")
+pd = pytest.importorskip("pandas")
+
+from src import dashboard_shadcn as dashboard  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    df = pd.DataFrame({
+        "url": [f"https://example.com/page-{i}" for i in range(50)],
+        "title": [f"Page {i}" for i in range(50)],
+        "depth": [i % 4 for i in range(50)],
+        "child_count": [i % 7 for i in range(50)],
+        "status_code": [200] * 50,
+    })
+    data = {"etag": "test-etag", "df_crawl": df}
+    monkeypatch.setattr(dashboard, "get_dashboard_data", lambda: data)
+    dashboard.app.config["TESTING"] = True
+    return dashboard.app.test_client()
+
+
+@pytest.fixture
+def crawl_client(tmp_path, monkeypatch):
+    """Test client serving a small crawl CSV through the real data loader."""
+    csv_path = tmp_path / "tsm_crawl_data.csv"
+    pd.DataFrame({
+        "url": ["https://example.com/"] + [f"https://example.com/page-{i}" for i in range(1, 20)],
+        "parent_url": [""] + ["https://example.com/"] * 19,
+        "depth": [0] + [1] * 19,
+        "title": ["Home"] + [f"Page {i}" for i in range(1, 20)],
+        "description": [""] * 20,
+        "heading": [""] * 20,
+        "child_count": [19] + [0] * 19,
+        "status_code": [200] * 20,
+    }).to_csv(csv_path, index=False)
+
+    monkeypatch.setattr(dashboard, "CSV_FILE_PATH", csv_path)
+    monkeypatch.setattr(dashboard, "_dashboard_data", None)
+    monkeypatch.setattr(dashboard, "_rendered_pages", OrderedDict())
+    monkeypatch.setattr(dashboard, "_seo_dashboard_data", OrderedDict())
+    dashboard.app.config["TESTING"] = True
+    return dashboard.app.test_client()
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_compressed_revalidation_returns_304(client, encoding):
+    first = client.get("/api/rows.ndjson", headers={"Accept-Encoding": encoding})
+    assert first.status_code == 200
+    assert first.headers["Content-Encoding"] == encoding
+
+    second = client.get(
+        "/api/rows.ndjson",
+        headers={"Accept-Encoding": encoding, "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_stale_etag_renders_body(client):
+    response = client.get(
+        "/api/rows.ndjson",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": '"other-etag:gzip"'},
+    )
+    assert response.status_code == 200
+
+
+def test_page_scores_revalidation_skips_analysis(client, monkeypatch):
+    calls = []
+
+    class FakeAnalyzer:
+        def __init__(self, csv_path):
+            calls.append(csv_path)
+            self.df = list(range(30))
+
+        def get_individual_page_scores(self):
+            return [{"url": f"https://example.com/page-{i}", "score": i} for i in range(30)]
+
+    monkeypatch.setattr(dashboard, "SEO_ANALYZER_AVAILABLE", True)
+    monkeypatch.setattr(dashboard, "SEOAnalyzer", FakeAnalyzer, raising=False)
+
+    first = client.get("/api/seo/page-scores?limit=0", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert len(calls) == 1
+
+    second = client.get(
+        "/api/seo/page-scores?limit=0",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 304
+    assert len(calls) == 1
+
+
+def test_dashboard_inlines_seo_preview_once_analysed(crawl_client, monkeypatch):
+    seo_data = {
+        "overall_score": 72,
+        "grade": "C",
+        "priority_actions": [
+            {"priority": 1, "category": "Titles", "action": "Shorten long page titles",
+             "impact": "High", "effort": "Low"},
+        ],
+        "metrics": {"top_keywords": [["crawler", 12]]},
+    }
+    monkeypatch.setattr(dashboard, "SEO_ANALYZER_AVAILABLE", True)
+    monkeypatch.setattr(dashboard, "generate_seo_dashboard_data", lambda csv_path: seo_data, raising=False)
+
+    before = crawl_client.get("/")
+    assert before.status_code == 200
+    assert b"Shorten long page titles" not in before.data
+
+    assert crawl_client.get("/api/seo/data").status_code == 200
+
+    after = crawl_client.get("/", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert b"Shorten long page titles" in after.data
+    assert b"crawler (12)" in after.data
+
+
+def test_page_growth_trend_is_pinned_for_seed_and_month():
+    trend = dashboard.build_page_growth_trend(100, "test-etag", 5)
+
+    assert trend == {
+        "historical": [73, 74, 76, 80, 80, 86, 87, 88, 92, 95, 99, 98],
+        "last_year": [60, 62, 64, 66, 65, 67, 67, 71, 71, 80, 79, 77],
+        "last_month_pages": 80,
+        "this_month_pages": 86,
+        "pages_added": 5,
+        "pages_removed": 1,
+        "growth_rate": "34.2",
+        "avg_monthly_growth": pytest.approx(25 / 12),
+        "projected_end_of_year": 115,
+    }
+    # The series depends on the seed only; the month picks the figures
+    assert dashboard.build_page_growth_trend(100, "test-etag", 6)["historical"] == trend["historical"]
+    assert dashboard.build_page_growth_trend(100, "test-etag", 6)["this_month_pages"] == 87
+
+
+def test_rows_ndjson_lines_follow_table_row_fields(client):
+    response = client.get("/api/rows.ndjson")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 50
+    first = dict(zip(dashboard.TABLE_ROW_FIELDS, json.loads(lines[0])))
+    assert len(json.loads(lines[0])) == len(dashboard.TABLE_ROW_FIELDS)
+    assert first == {
+        "url": "https://example.com/page-0",
+        "title": "Page 0",
+        "depth": 0,
+        "child_count": 0,
+        "status_code": 200,
+        "url_disp": "https://example.com/page-0",
+        "title_disp": "Page 0",
+        "status_class": "ok",
+    }
+
+    revalidated = client.get("/api/rows.ndjson", headers={"If-None-Match": response.headers["ETag"]})
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, compressed",
+    [("gzip, deflate", True), ("gzip;q=0, deflate", False), ("", False)],
+)
+def test_download_data_serves_gzip_only_when_accepted(crawl_client, accept_encoding, compressed):
+    response = crawl_client.get("/download-data", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+
+    expected = dashboard.CSV_FILE_PATH.read_bytes()
+    if compressed:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data) == expected
+    else:
+        assert "Content-Encoding" not in response.headers
+        assert response.data == expected